@@ -1,12 +1,37 @@
+import importlib
 import logging
+from typing import TYPE_CHECKING
 
 from pyodk import errors
-from pyodk.client import Client
+
+if TYPE_CHECKING:
+    from pyodk.async_client import AsyncClient
+    from pyodk.client import Client
 
 __all__ = (
+    "AsyncClient",
     "Client",
     "errors",
 )
 
+# The clients are imported on first use, so that `import pyodk` is fast, and scripts
+# which only use `Client` don't import asyncio.
+_lazy = {
+    "AsyncClient": "pyodk.async_client",
+    "Client": "pyodk.client",
+}
+
+
+def __getattr__(name: str):
+    if name in _lazy:
+        value = getattr(importlib.import_module(_lazy[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
+
 
 logging.getLogger(__name__).addHandler(logging.NullHandler())
@@ -1,4 +1,5 @@
 import logging
+from datetime import datetime, timedelta, timezone
 from typing import TYPE_CHECKING
 
 from pyodk._utils import config
@@ -11,6 +12,9 @@ log = logging.getLogger(__name__)
 
 
 class AuthService:
+    # A cached token is replaced if it expires within this time.
+    expiry_margin: timedelta = timedelta(minutes=5)
+
     def __init__(self, session: "Session", cache_path: str | None = None) -> None:
         self.session: Session = session
         self.cache_path: str = cache_path
@@ -40,20 +44,21 @@ class AuthService:
             log.error(err, exc_info=True)
             raise err
 
-    def get_new_token(self, username: str, password: str) -> str:
+    def get_new_session(self, username: str, password: str) -> dict:
         """
-        Get a new token from Central by creating a new session.
+        Create a new session in Central.
 
         https://docs.getodk.org/central-api-authentication/#logging-in
 
         :param username: The username of the Web User to auth with.
         :param password: The Web User's password.
-        :return: The session token.
+        :return: The session data, including the "token" and its "expiresAt" time.
         """
         response = self.session.post(
             url="sessions",
             json={"email": username, "password": password},
-            headers={"Content-Type": "application/json"},
+            # Don't send the current token, which may be the one being replaced.
+            headers={"Content-Type": "application/json", "Authorization": None},
         )
         if response.status_code == 200:
             data = response.json()
@@ -63,7 +68,7 @@ class AuthService:
                 log.error(err, exc_info=True)
                 raise err
             else:
-                return data["token"]
+                return data
         else:
             msg = (
                 f"The login request failed."
@@ -73,11 +78,23 @@ class AuthService:
             log.error(err, exc_info=True)
             raise err
 
+    def get_new_token(self, username: str, password: str) -> str:
+        """
+        Get a new token from Central by creating a new session.
+
+        :param username: The username of the Web User to auth with.
+        :param password: The Web User's password.
+        :return: The session token.
+        """
+        return self.get_new_session(username=username, password=password)["token"]
+
     def get_token(self, username: str, password: str) -> str:
         """
-        Get a verified session token with the provided credential.
+        Get a session token with the provided credential.
 
-        Tries to verify token in cache_file, or requests a new session.
+        Uses the token in cache_file if its cached expiry time is not near, without
+        checking with Central. If a cached token has no expiry time, it is verified with
+        Central. Otherwise, requests a new session.
 
         :param username: The username of the Web User to auth with.
         :param password: The Web User's password.
@@ -85,11 +102,30 @@ class AuthService:
         """
         try:
             token = config.read_cache_token(cache_path=self.cache_path)
-            return self.verify_token(token=token)
+            expires_at = config.read_cache_token_expiry(cache_path=self.cache_path)
+            if expires_at is None:
+                return self.verify_token(token=token)
+            if expires_at - self.expiry_margin > datetime.now(tz=timezone.utc):
+                return token
         except PyODKError:
             # Couldn't read the token, or it wasn't valid.
             pass
 
-        token = self.get_new_token(username=username, password=password)
-        config.write_cache(key="token", value=token, cache_path=self.cache_path)
-        return token
+        return self.refresh_token(username=username, password=password)
+
+    def refresh_token(self, username: str, password: str) -> str:
+        """
+        Get a new session token, and write it and its expiry time to the cache file.
+
+        :param username: The username of the Web User to auth with.
+        :param password: The Web User's password.
+        :return: The session token.
+        """
+        data = self.get_new_session(username=username, password=password)
+        config.write_cache(key="token", value=data["token"], cache_path=self.cache_path)
+        config.write_cache(
+            key="token_expires_at",
+            value=data.get("expiresAt"),
+            cache_path=self.cache_path,
+        )
+        return data["token"]
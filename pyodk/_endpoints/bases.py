@@ -1,7 +1,16 @@
-from pydantic import BaseModel, ConfigDict
+import types
+from collections.abc import Callable, Iterator, Sequence
+from datetime import datetime
+from functools import cache
+from typing import TYPE_CHECKING, Any, ClassVar, Generic, TypeVar, Union, overload
+
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 from pyodk._utils.session import Session
 
+if TYPE_CHECKING:
+    from requests import Response
+
 
 class Model(BaseModel):
     """Base configuration for data model classes."""
@@ -9,6 +18,222 @@ class Model(BaseModel):
     model_config = ConfigDict(arbitrary_types_allowed=True, validate_assignment=True)
 
 
+M = TypeVar("M", bound=Model)
+
+
+class ModelList(Sequence[M], Generic[M]):
+    """
+    A read-only list of models, each validated when it is first accessed.
+
+    This is returned by `list` methods for trusted responses (see `Client`), so that
+    code which only uses some of the items (or just the count) doesn't pay to validate
+    all of them. Any validation error is raised when the item is accessed. Use
+    `list(...)` to validate all items and get a regular list.
+
+    :param model: The model class of the items.
+    :param data: The JSON objects for the items.
+    """
+
+    __slots__ = ("_data", "_items", "_model")
+    __hash__ = None  # Mutable, like a list.
+
+    def __init__(self, model: type[M], data: list[dict[str, Any]]):
+        self._model: type[M] = model
+        self._data: list[dict[str, Any] | None] = list(data)
+        self._items: list[M | None] = [None] * len(self._data)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    @overload
+    def __getitem__(self, index: int) -> M: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[M]: ...
+
+    def __getitem__(self, index: int | slice) -> M | list[M]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        item = self._items[index]
+        if item is None:
+            item = self._model(**self._data[index])
+            self._items[index] = item
+            self._data[index] = None  # Validated; the raw data isn't needed.
+        return item
+
+    def __iter__(self) -> Iterator[M]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Sequence) and not isinstance(other, str | bytes):
+            return len(self) == len(other) and all(
+                a == b for a, b in zip(self, other, strict=True)
+            )
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"ModelList({self._model.__name__}, {len(self)} items)"
+
+
+@cache
+def list_adapter(model: type[M]) -> TypeAdapter[list[M]]:
+    """
+    Get a validator for a list of the model, which is built once per model on first
+    use, since building it is much slower than using it.
+    """
+    return TypeAdapter(list[model])
+
+
+def parse_datetime(value: str) -> datetime:
+    """Parse a datetime from the API, in the same way as the models do."""
+    try:
+        # Central uses ISO 8601 with a "Z" suffix, which Python 3.10 can't parse.
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return TypeAdapter(datetime).validate_python(value)
+
+
+class _LazyDatetime:
+    """
+    A record field which holds the datetime text until it is first read, since most
+    datetimes in a large list are never used, and parsing them all is slow.
+    """
+
+    __slots__ = ("slot",)
+
+    def __init__(self, slot):
+        self.slot = slot  # The member descriptor of the slot holding the value.
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        value = self.slot.__get__(obj)
+        if isinstance(value, str):
+            value = parse_datetime(value)
+            self.slot.__set__(obj, value)
+        return value
+
+    def __set__(self, obj, value):
+        self.slot.__set__(obj, value)
+
+
+class Record:
+    """
+    A compact, unvalidated alternative to a data model, for large lists.
+
+    A record has the same fields as its model (e.g. `Submission`), stored in slots
+    instead of a pydantic model's `__dict__`, and datetime fields are parsed when they
+    are first read. Each record uses around a quarter of the memory of the model.
+    Use `to_model` to get the (validated) model.
+
+    Record classes are made from model classes with `record_type`.
+    """
+
+    __slots__ = ()
+    _model: ClassVar[type[Model]]
+    _fields: ClassVar[tuple[str, ...]]
+    # The slot, key, and converter (or None) for each field.
+    _spec: ClassVar[tuple[tuple[str, str, Callable[[Any], Any] | None], ...]]
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "Record":
+        record = cls.__new__(cls)
+        for slot, key, convert in cls._spec:
+            value = data.get(key)
+            if convert is not None and value is not None:
+                value = convert(value)
+            setattr(record, slot, value)
+        return record
+
+    def to_dict(self) -> dict[str, Any]:
+        """Get the field values, with nested records also as dicts."""
+        return {f: _record_to_dict(getattr(self, f)) for f in self._fields}
+
+    def to_model(self) -> Model:
+        """Validate the record, and get the model it represents."""
+        return self._model(**self.to_dict())
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(getattr(self, f) == getattr(other, f) for f in self._fields)
+
+    __hash__ = None  # Mutable.
+
+    def __repr__(self) -> str:
+        values = ", ".join(f"{f}={getattr(self, f)!r}" for f in self._fields)
+        return f"{type(self).__name__}({values})"
+
+
+def _record_to_dict(value: Any) -> Any:
+    if isinstance(value, Record):
+        return value.to_dict()
+    if isinstance(value, list):
+        return [_record_to_dict(v) for v in value]
+    return value
+
+
+def _unwrap_optional(annotation: Any) -> Any:
+    if getattr(annotation, "__origin__", None) is Union or isinstance(
+        annotation, types.UnionType
+    ):
+        args = [a for a in annotation.__args__ if a is not type(None)]
+        if len(args) == 1:
+            return args[0]
+    return annotation
+
+
+def _get_converter(annotation: Any) -> Callable[[Any], Any] | None:
+    """Get the function to make the record value from the JSON value, if any."""
+    annotation = _unwrap_optional(annotation)
+    if isinstance(annotation, type) and issubclass(annotation, Model):
+        return record_type(annotation).from_dict
+    if getattr(annotation, "__origin__", None) is list:
+        (item,) = annotation.__args__
+        item = _unwrap_optional(item)
+        if isinstance(item, type) and issubclass(item, Model):
+            from_dict = record_type(item).from_dict
+            return lambda values: [from_dict(v) for v in values]
+    return None
+
+
+@cache
+def record_type(model: type[Model]) -> type[Record]:
+    """
+    Get the record class for a model class, e.g. `SubmissionRecord` for `Submission`.
+
+    :param model: The model class. Nested models are also made into records.
+    """
+    fields, slots, spec, lazy = [], [], [], []
+    for name, info in model.model_fields.items():
+        key = info.alias or name
+        fields.append(name)
+        if _unwrap_optional(info.annotation) is datetime:
+            # The slot holds the text, or the datetime once it has been read.
+            slots.append(f"_{name}")
+            lazy.append(name)
+            spec.append((f"_{name}", key, None))
+        else:
+            slots.append(name)
+            spec.append((name, key, _get_converter(info.annotation)))
+    cls = type(
+        f"{model.__name__}Record",
+        (Record,),
+        {
+            "__slots__": tuple(slots),
+            "__module__": model.__module__,
+            "__doc__": f"A compact record of a `{model.__name__}`. See `Record`.",
+            "_model": model,
+            "_fields": tuple(fields),
+            "_spec": tuple(spec),
+        },
+    )
+    for name in lazy:
+        setattr(cls, name, _LazyDatetime(cls.__dict__[f"_{name}"]))
+    return cls
+
+
 class Manager:
     """Base for managers of data model classes."""
 
@@ -23,3 +248,34 @@ class Service:
     """Base for services interacting with the ODK Central API over HTTP."""
 
     __slots__ = ("__weakref__",)
+
+    def _to_models(
+        self,
+        model: type[M],
+        response: "Response",
+        trusted: bool | None = None,
+        compact: bool = False,
+    ) -> list[M] | ModelList[M] | list[Record]:
+        """
+        Make models from a list response.
+
+        The response body is validated directly, without first parsing it into dicts.
+
+        :param model: The model class to make.
+        :param response: The response, with a JSON array body.
+        :param trusted: If True, defer validation of each item until it is accessed.
+          Defaults to the session's `trust_responses` setting.
+        :param compact: If True, make a `Record` for each item instead of a model.
+        """
+        if compact:
+            from_dict = record_type(model).from_dict
+            data = response.json()
+            # Replace each dict as it's converted, so they don't all stay in memory.
+            for i, item in enumerate(data):
+                data[i] = from_dict(item)
+            return data
+        if trusted is None:
+            trusted = getattr(self.session, "trust_responses", False)
+        if trusted:
+            return ModelList(model, response.json())
+        return list_adapter(model).validate_json(response.content)
@@ -2,7 +2,7 @@ import logging
 from dataclasses import dataclass
 from datetime import datetime
 
-from pyodk._endpoints.bases import Model, Service
+from pyodk._endpoints.bases import Model, ModelList, Record, Service
 from pyodk._utils import validators as pv
 from pyodk._utils.session import Session
 from pyodk.errors import PyODKError
@@ -50,13 +50,19 @@ class CommentService(Service):
         form_id: str | None = None,
         project_id: int | None = None,
         instance_id: str | None = None,
-    ) -> list[Comment]:
+        trusted: bool | None = None,
+        compact: bool = False,
+    ) -> list[Comment] | ModelList[Comment] | list[Record]:
         """
         Read all Comment details.
 
         :param form_id: The xmlFormId of the Form being referenced.
         :param project_id: The id of the project the Submissions belong to.
         :param instance_id: The instanceId of the Submission being referenced.
+        :param trusted: If True, validate each item when it is first accessed, instead
+          of all items now. Defaults to the client's `trust_responses` setting.
+        :param compact: If True, return a `Record` for each item instead of a model, which
+          uses much less memory. The `trusted` setting is not used.
         """
         try:
             pid = pv.validate_project_id(project_id, self.default_project_id)
@@ -73,8 +79,7 @@ class CommentService(Service):
             ),
             logger=log,
         )
-        data = response.json()
-        return [Comment(**r) for r in data]
+        return self._to_models(Comment, response, trusted, compact)
 
     def post(
         self,
@@ -1,14 +1,18 @@
 import logging
-from collections.abc import Iterable, Mapping
+from collections.abc import Callable, Iterable, Iterator, Mapping
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
 from uuid import uuid4
 
 from pyodk.__version__ import __version__
-from pyodk._endpoints.bases import Model, Service
+from pyodk._endpoints.bases import Model, ModelList, Record, Service
 from pyodk._endpoints.entity_list_properties import EntityListPropertyService
 from pyodk._utils import validators as pv
+from pyodk._utils.columnar import read_columnar
+from pyodk._utils.concurrency import map_bounded
+from pyodk._utils.edmx import ODataSchema, SchemaCache, parse_metadata
+from pyodk._utils.odata import iter_table_rows
 from pyodk._utils.session import Session
 from pyodk.errors import PyODKError
 
@@ -29,6 +33,10 @@ class MergeActions:
     reserved_keys: frozenset = frozenset({"__id", "__system", "label"})
     # Set by "merge" function according to the "add_new_properties" parameter.
     final_keys: set = field(default_factory=set)
+    # Set by "merge" function: the outcome of each update / delete, by match key.
+    updated: dict = field(default_factory=dict)
+    deleted: dict = field(default_factory=dict)
+    errors: dict = field(default_factory=dict)
 
     @property
     def keys_difference(self) -> set:
@@ -74,6 +82,8 @@ class URLs:
     patch: str = f"{_entities}/{{entity_id}}"
     delete: str = patch
     get_table: str = f"{_entity_name}.svc/Entities"
+    get_entity_list: str = _entity_name
+    get_metadata: str = f"{_entity_name}.svc/$metadata"
 
 
 class EntityService(Service):
@@ -92,7 +102,13 @@ class EntityService(Service):
     Entities are like instances.
     """
 
-    __slots__ = ("default_entity_list_name", "default_project_id", "session", "urls")
+    __slots__ = (
+        "default_entity_list_name",
+        "default_project_id",
+        "schema_cache",
+        "session",
+        "urls",
+    )
 
     def __init__(
         self,
@@ -105,15 +121,24 @@ class EntityService(Service):
         self.session: Session = session
         self.default_project_id: int | None = default_project_id
         self.default_entity_list_name: str | None = default_entity_list_name
+        self.schema_cache: SchemaCache = SchemaCache()
 
     def list(
-        self, entity_list_name: str | None = None, project_id: int | None = None
-    ) -> list[Entity]:
+        self,
+        entity_list_name: str | None = None,
+        project_id: int | None = None,
+        trusted: bool | None = None,
+        compact: bool = False,
+    ) -> list[Entity] | ModelList[Entity] | list[Record]:
         """
         Read all Entity metadata.
 
         :param entity_list_name: The name of the Entity List (Dataset) being referenced.
         :param project_id: The id of the project the Entity belongs to.
+        :param trusted: If True, validate each item when it is first accessed, instead
+          of all items now. Defaults to the client's `trust_responses` setting.
+        :param compact: If True, return a `Record` for each item instead of a model, which
+          uses much less memory. The `trusted` setting is not used.
 
         :return: A list of the object representation of all Entity metadata.
         """
@@ -131,8 +156,7 @@ class EntityService(Service):
             url=self.session.urlformat(self.urls.list, project_id=pid, el_name=eln),
             logger=log,
         )
-        data = response.json()
-        return [Entity(**r) for r in data]
+        return self._to_models(Entity, response, trusted, compact)
 
     def create(
         self,
@@ -198,6 +222,9 @@ class EntityService(Service):
         created in advance for each key in `data` that is not "label". The `merge` method
         can be used to automatically add properties (or a subset) and create Entities.
 
+        For a large `data`, the request can be compressed by setting `compression` on
+        [the session](../#session-customization).
+
         :param data: Data to store for the Entities.
         :param entity_list_name: The name of the Entity List (Dataset) being referenced.
         :param project_id: The id of the project this Entity belongs to.
@@ -246,6 +273,7 @@ class EntityService(Service):
             url=self.session.urlformat(self.urls.post, project_id=pid, el_name=eln),
             logger=log,
             json=final_data,
+            compress=True,
         )
         data = response.json()
         return data["success"]
@@ -349,6 +377,9 @@ class EntityService(Service):
         count: bool | None = None,
         filter: str | None = None,
         select: str | None = None,
+        columnar: bool = False,
+        dtypes: dict[str, str] | None = None,
+        typed: bool = False,
     ) -> dict:
         """
         Read Entity List data.
@@ -364,6 +395,15 @@ class EntityService(Service):
           and or are supported, and the built-in functions now, year, month, day, hour,
           minute, second.
         :param select: If provided, will return only the selected fields.
+        :param columnar: If True, return the rows of the "value" array as columns,
+          built while the response is read. See `pyodk._utils.columnar`. With NumPy
+          installed (`pip install pyodk[numpy]`), each column is a masked array.
+        :param dtypes: For a columnar result, the type of some columns, by column name:
+          "int", "float", "bool", "datetime", "date", "str", "geo", or "geopoint" (see
+          `TableBuilder` in `pyodk._utils.columnar`). Other column types are inferred.
+        :param typed: If True, convert values using the column types from the Entity
+          List (see `get_table_schema`), e.g. the "__system" datetimes. The `dtypes`
+          take precedence.
 
         :return: A dictionary representation of the OData JSON document.
         """
@@ -387,15 +427,142 @@ class EntityService(Service):
             log.error(err, exc_info=True)
             raise
 
+        url = self.session.urlformat(
+            self.urls.get_table, project_id=pid, el_name=eln, table_name="Entities"
+        )
+        schema = None
+        if typed:
+            schema = self.get_table_schema(entity_list_name=eln, project_id=pid)
+        if columnar:
+            if schema is not None:
+                dtypes = {**schema.dtypes("Entities"), **(dtypes or {})}
+            response = self.session.response_or_error(
+                method="GET", url=url, logger=log, params=params, stream=True
+            )
+            with response:
+                return read_columnar(
+                    response.iter_content(chunk_size=self.session.blocksize),
+                    dtypes=dtypes,
+                )
         response = self.session.response_or_error(
+            method="GET",
+            url=url,
+            logger=log,
+            params=params,
+        )
+        data = response.json()
+        if schema is not None:
+            convert = schema.row_converter("Entities")
+            for row in data.get("value", ()):
+                convert(row)
+        return data
+
+    def get_table_schema(
+        self, entity_list_name: str | None = None, project_id: int | None = None
+    ) -> ODataSchema:
+        """
+        Read the column types of the Entity List's table, from the OData metadata
+        document (`$metadata`).
+
+        The schema is cached by the Entity List's property names, so `$metadata` is
+        only requested again if a property has been added. Checking the properties is
+        a small request.
+
+        :param entity_list_name: The name of the Entity List (Dataset) being referenced.
+        :param project_id: The id of the project this Entity List belongs to.
+        """
+        try:
+            pid = pv.validate_project_id(project_id, self.default_project_id)
+            eln = pv.validate_entity_list_name(
+                entity_list_name, self.default_entity_list_name
+            )
+        except PyODKError as err:
+            log.error(err, exc_info=True)
+            raise
+
+        entity_list = self.session.response_or_error(
             method="GET",
             url=self.session.urlformat(
-                self.urls.get_table, project_id=pid, el_name=eln, table_name="Entities"
+                self.urls.get_entity_list, project_id=pid, el_name=eln
             ),
             logger=log,
+        ).json()
+
+        def load() -> ODataSchema:
+            response = self.session.response_or_error(
+                method="GET",
+                url=self.session.urlformat(
+                    self.urls.get_metadata, project_id=pid, el_name=eln
+                ),
+                logger=log,
+            )
+            return parse_metadata(response.content)
+
+        properties = tuple(p.get("name") for p in entity_list.get("properties") or ())
+        key = (self.session.base_url, pid, eln, properties)
+        return self.schema_cache.get(key, load)
+
+    def iter_table(
+        self,
+        entity_list_name: str | None = None,
+        project_id: int | None = None,
+        page_size: int = 1000,
+        skip: int | None = None,
+        filter: str | None = None,
+        select: str | None = None,
+    ) -> Iterator[dict]:
+        """
+        Read Entity List data one row at a time, requesting it page by page.
+
+        Each page is requested with `$top` set to `page_size`. The next page is found by
+        following the `@odata.nextLink` in the response, or (for servers that don't
+        provide one) by incrementing `$skip`. Each page is decoded incrementally as it
+        is received, so at most one row is held in memory at a time.
+
+        The requests are made when iteration starts, not when this method is called.
+
+        :param entity_list_name: The name of the Entity List (Dataset) being referenced.
+        :param project_id: The id of the project this Entity belongs to.
+        :param page_size: The maximum number of rows to request per page.
+        :param skip: The first n rows will be omitted from the results.
+        :param filter: Filter responses to those matching the query. Only certain fields
+          are available to reference. The operators lt, le, eq, neq, ge, gt, not, and,
+          and or are supported, and the built-in functions now, year, month, day, hour,
+          minute, second.
+        :param select: If provided, will return only the selected fields.
+
+        :return: An iterator of the rows in the OData JSON document "value" array.
+        """
+        try:
+            pid = pv.validate_project_id(project_id, self.default_project_id)
+            eln = pv.validate_entity_list_name(
+                entity_list_name, self.default_entity_list_name
+            )
+            top = pv.validate_int(page_size, key="page_size")
+            if top < 1:
+                raise PyODKError("page_size: must be greater than 0.")  # noqa: TRY301
+            offset = 0 if skip is None else pv.validate_int(skip, key="skip")
+            params = {
+                k: v
+                for k, v in {
+                    "$top": top,
+                    "$filter": filter,
+                    "$select": select,
+                }.items()
+                if v is not None
+            }
+        except PyODKError as err:
+            log.error(err, exc_info=True)
+            raise
+
+        return iter_table_rows(
+            session=self.session,
+            url=self.session.urlformat(self.urls.get_table, project_id=pid, el_name=eln),
             params=params,
+            page_size=top,
+            offset=offset,
+            logger=log,
         )
-        return response.json()
 
     @staticmethod
     def _prep_data_for_merge(
@@ -504,6 +671,8 @@ class EntityService(Service):
         source_keys: Iterable[str] | None = None,
         create_source: str | None = None,
         source_size: str | None = None,
+        max_workers: int = 1,
+        raise_errors: bool = True,
     ) -> MergeActions:
         """
         Update Entities in Central based on the provided data:
@@ -519,11 +688,16 @@ class EntityService(Service):
             {"label": "Melbourne", "state": "VIC", "postcode": "3000"},
         ]
 
-        Entity creation is performed in one request using `create_many`. The merge
-        operation may be slow if large quantities of updates or deletes are required,
-        since for these operations each change is a request in a loop. If this is a
-        concern, set the parameters `update_matched` and `delete_not_matched` to False and
-        use the return value to perform threaded or async requests for these data.
+        Entity creation is performed in one request using `create_many`. Updates and
+        deletes require one request per Entity, so the merge operation may be slow if
+        large quantities of these changes are required. To send these requests
+        concurrently, set `max_workers` to more than 1. The session's connection pool
+        should have at least `max_workers` connections (10 by default).
+
+        The outcome of each update and delete is recorded in the returned MergeActions,
+        keyed by the match key: `updated` has the updated Entity, `deleted` has the
+        delete result, and `errors` has the error raised for any failed change. Results
+        are in the same order as `to_update` and `to_delete`.
 
         :param data: Data to use for updating Entities in Central.
         :param entity_list_name: The name of the Entity List (Dataset) being referenced.
@@ -544,6 +718,10 @@ class EntityService(Service):
           of the change in Central, for example a file name. Defaults to the PyODK version.
         :param source_size: If Entities are created, this is used to capture the size of
           `data` in Central, for example a file size. Excluded if None.
+        :param max_workers: The number of update or delete requests to send at once.
+        :param raise_errors: If True, stop at the first failed update or delete and raise
+          its error, after any requests in progress have finished. If False, continue
+          with the remaining changes, and record each error in the return value.
         """
         pid = pv.validate_project_id(project_id, self.default_project_id)
         eln = pv.validate_entity_list_name(
@@ -580,16 +758,38 @@ class EntityService(Service):
                 create_source=create_source,
                 source_size=source_size,
             )
+
+        def apply(changes: dict, func: Callable, results: dict) -> None:
+            for outcome in map_bounded(
+                func=lambda item: func(item[1]),
+                items=changes.items(),
+                max_workers=max_workers,
+                stop_on_error=raise_errors,
+            ):
+                key = outcome.item[0]
+                if outcome.error is None:
+                    results[key] = outcome.result
+                else:
+                    merge_actions.errors[key] = outcome.error
+            if raise_errors and merge_actions.errors:
+                raise next(iter(merge_actions.errors.values()))
+
         if update_matched:
-            for u in merge_actions.to_update.values():
-                self.update(
+            apply(
+                changes=merge_actions.to_update,
+                func=lambda u: self.update(
                     uuid=u["__id"],
                     entity_list_name=eln,
                     label=u["label"],
                     data={k: u.get(k) for k in u if k in merge_actions.final_keys},
                     base_version=u["__system"]["version"],
-                )
+                ),
+                results=merge_actions.updated,
+            )
         if delete_not_matched:
-            for d in merge_actions.to_delete.values():
-                self.delete(uuid=d["__id"], entity_list_name=eln)
+            apply(
+                changes=merge_actions.to_delete,
+                func=lambda d: self.delete(uuid=d["__id"], entity_list_name=eln),
+                results=merge_actions.deleted,
+            )
         return merge_actions
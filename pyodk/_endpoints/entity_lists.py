@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Any
 
-from pyodk._endpoints.bases import Model, Service
+from pyodk._endpoints.bases import Model, ModelList, Service
 from pyodk._endpoints.entity_list_properties import (
     EntityListProperty,
     EntityListPropertyService,
@@ -102,11 +102,15 @@ class EntityListService(Service):
         self._default_entity_list_name = v
         self._property_service.default_entity_list_name = v
 
-    def list(self, project_id: int | None = None) -> list[EntityList]:
+    def list(
+        self, project_id: int | None = None, trusted: bool | None = None
+    ) -> list[EntityList] | ModelList[EntityList]:
         """
         Read all Entity List details.
 
         :param project_id: The id of the project the Entity List belongs to.
+        :param trusted: If True, validate each item when it is first accessed, instead
+          of all items now. Defaults to the client's `trust_responses` setting.
 
         :return: A list of the object representation of all Entity Lists' details.
         """
@@ -121,8 +125,7 @@ class EntityListService(Service):
             url=self.session.urlformat(self.urls.list, project_id=pid),
             logger=log,
         )
-        data = response.json()
-        return [EntityList(**r) for r in data]
+        return self._to_models(EntityList, response, trusted)
 
     def get(
         self,
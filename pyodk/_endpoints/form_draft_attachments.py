@@ -7,6 +7,7 @@ from os import PathLike
 from pyodk._endpoints.bases import Model, Service
 from pyodk._utils import validators as pv
 from pyodk._utils.session import Session
+from pyodk._utils.transfer import open_upload
 from pyodk.errors import PyODKError
 
 log = logging.getLogger(__name__)
@@ -65,34 +66,27 @@ class FormDraftAttachmentService(Service):
             if file_name is None:
                 file_name = pv.validate_str(file_path.name, key="file_name")
             guess_type, guess_encoding = mimetypes.guess_type(file_name)
-            headers = {
-                "Transfer-Encoding": "chunked",
-                "Content-Type": guess_type or "application/octet-stream",
-            }
+            headers = {"Content-Type": guess_type or "application/octet-stream"}
             if guess_encoding:  # associated compression type, if any.
                 headers["Content-Encoding"] = guess_encoding
         except PyODKError as err:
             log.error(err, exc_info=True)
             raise
 
-        def file_stream():
-            # Generator forces requests to read/send in chunks instead of all at once.
-            with open(file_path, "rb") as f:
-                while chunk := f.read(self.session.blocksize):
-                    yield chunk
-
-        response = self.session.response_or_error(
-            method="POST",
-            url=self.session.urlformat(
-                self.urls.post,
-                project_id=pid,
-                form_id=fid,
-                fname=file_name,
-            ),
-            logger=log,
-            headers=headers,
-            data=file_stream(),
-        )
+        # The body can be sent again if the request is retried (e.g. after a 503).
+        with open_upload(file_path, memory_map=self.session.memory_map_uploads) as f:
+            response = self.session.response_or_error(
+                method="POST",
+                url=self.session.urlformat(
+                    self.urls.post,
+                    project_id=pid,
+                    form_id=fid,
+                    fname=file_name,
+                ),
+                logger=log,
+                headers=headers,
+                data=f,
+            )
         data = response.json()
         try:
             # Response format prior to Central v2025.1 is constant `{"success": True}`.
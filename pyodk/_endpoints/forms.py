@@ -5,7 +5,7 @@ from datetime import datetime
 from os import PathLike
 from typing import Any
 
-from pyodk._endpoints.bases import Model, Service
+from pyodk._endpoints.bases import Model, ModelList, Service
 from pyodk._endpoints.form_draft_attachments import FormDraftAttachmentService
 from pyodk._endpoints.form_drafts import FormDraftService
 from pyodk._utils import validators as pv
@@ -70,11 +70,15 @@ class FormService(Service):
             "default_form_id": self.default_form_id,
         }
 
-    def list(self, project_id: int | None = None) -> list[Form]:
+    def list(
+        self, project_id: int | None = None, trusted: bool | None = None
+    ) -> list[Form] | ModelList[Form]:
         """
         Read all Form details.
 
         :param project_id: The id of the project the forms belong to.
+        :param trusted: If True, validate each item when it is first accessed, instead
+          of all items now. Defaults to the client's `trust_responses` setting.
 
         :return: A list of object representations of all Forms' metadata.
         """
@@ -89,8 +93,7 @@ class FormService(Service):
                 url=self.session.urlformat(self.urls.forms, project_id=pid),
                 logger=log,
             )
-            data = response.json()
-            return [Form(**r) for r in data]
+            return self._to_models(Form, response, trusted)
 
     def get(
         self,
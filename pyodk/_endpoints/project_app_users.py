@@ -2,7 +2,7 @@ import logging
 from dataclasses import dataclass
 from datetime import datetime
 
-from pyodk._endpoints.bases import Model, Service
+from pyodk._endpoints.bases import Model, ModelList, Record, Service
 from pyodk._utils import validators as pv
 from pyodk._utils.session import Session
 from pyodk.errors import PyODKError
@@ -47,11 +47,17 @@ class ProjectAppUserService(Service):
     def list(
         self,
         project_id: int | None = None,
-    ) -> list[ProjectAppUser]:
+        trusted: bool | None = None,
+        compact: bool = False,
+    ) -> list[ProjectAppUser] | ModelList[ProjectAppUser] | list[Record]:
         """
         Read all ProjectAppUser details.
 
         :param project_id: The project_id the ProjectAppUsers are assigned to.
+        :param trusted: If True, validate each item when it is first accessed, instead
+          of all items now. Defaults to the client's `trust_responses` setting.
+        :param compact: If True, return a `Record` for each item instead of a model, which
+          uses much less memory. The `trusted` setting is not used.
         """
         try:
             pid = pv.validate_project_id(project_id, self.default_project_id)
@@ -64,8 +70,7 @@ class ProjectAppUserService(Service):
             url=self.session.urlformat(self.urls.list, project_id=pid),
             logger=log,
         )
-        data = response.json()
-        return [ProjectAppUser(**r) for r in data]
+        return self._to_models(ProjectAppUser, response, trusted, compact)
 
     def create(
         self,
@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Any
 
-from pyodk._endpoints.bases import Model, Service
+from pyodk._endpoints.bases import Model, ModelList, Service
 from pyodk._endpoints.form_assignments import FormAssignmentService
 from pyodk._endpoints.project_app_users import ProjectAppUser, ProjectAppUserService
 from pyodk._utils import validators as pv
@@ -65,10 +65,13 @@ class ProjectService(Service):
             "default_project_id": self.default_project_id,
         }
 
-    def list(self) -> list[Project]:
+    def list(self, trusted: bool | None = None) -> list[Project] | ModelList[Project]:
         """
         Read Project details.
 
+        :param trusted: If True, validate each item when it is first accessed, instead
+          of all items now. Defaults to the client's `trust_responses` setting.
+
         :return: An list of object representations of the Projects' metadata.
         """
         response = self.session.response_or_error(
@@ -76,8 +79,7 @@ class ProjectService(Service):
             url=self.urls.list,
             logger=log,
         )
-        data = response.json()
-        return [Project(**r) for r in data]
+        return self._to_models(Project, response, trusted)
 
     def get(self, project_id: int | None = None) -> Project:
         """
@@ -1,25 +1,85 @@
 import logging
 import mimetypes
-from dataclasses import dataclass
+import re
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
 from os import PathLike
+from pathlib import Path
 
-from pyodk._endpoints.bases import Model, Service
+from pyodk._endpoints.bases import Model, ModelList, Service
 from pyodk._utils import validators as pv
+from pyodk._utils.concurrency import map_bounded
 from pyodk._utils.session import Session
+from pyodk._utils.transfer import Download, file_md5, open_upload
 from pyodk.errors import PyODKError
 
 log = logging.getLogger(__name__)
 
 
+# Characters which aren't allowed in file names on some systems, e.g. ":" in "uuid:".
+_UNSAFE_CHARACTERS = re.compile(r'[<>:"/\\|?*\x00-\x1f]')
+
+
 class SubmissionAttachment(Model):
     name: str
     exists: bool
 
 
+@dataclass
+class AttachmentDownloads:
+    """
+    Return type for SubmissionAttachmentService.download_many. Each dict is keyed by
+    (instance_id, file_name).
+    """
+
+    # The path of each file downloaded.
+    downloaded: dict = field(default_factory=dict)
+    # The path of each file not downloaded because the local copy is the same.
+    unchanged: dict = field(default_factory=dict)
+    # The error raised for each file which failed to download.
+    errors: dict = field(default_factory=dict)
+
+
+def safe_file_name(name: str) -> str:
+    """
+    Make a name safe to use as a file name, e.g. an instanceId.
+
+    Path separators are replaced, so the file can't be written outside its directory.
+    """
+    safe = _UNSAFE_CHARACTERS.sub("_", name)
+    return "_" * len(safe) if safe in {"", ".", ".."} else safe
+
+
+def _unique_paths(
+    attachments: Iterable[tuple[str, str]], root: Path
+) -> Iterator[tuple[tuple[str, str], Path]]:
+    """
+    Get the file path of each (instance_id, file_name), where it is downloaded to.
+
+    Different names can have the same safe file name (e.g. "a?.jpg" and "a_.jpg"), or
+    differ only by case, which is the same file on some file systems. So a path which
+    is already taken gets a number, e.g. "a_ (2).jpg". Repeated attachments are skipped.
+    """
+    seen = set()
+    taken = set()
+    for instance_id, file_name in attachments:
+        if (item := (instance_id, file_name)) in seen:
+            continue
+        seen.add(item)
+        path = root / safe_file_name(instance_id) / safe_file_name(file_name)
+        candidate, number = path, 1
+        while str(candidate).casefold() in taken:
+            number += 1
+            candidate = path.with_name(f"{path.stem} ({number}){path.suffix}")
+        taken.add(str(candidate).casefold())
+        yield item, candidate
+
+
 @dataclass(frozen=True, slots=True)
 class URLs:
     _submission: str = "projects/{project_id}/forms/{form_id}/submissions/{instance_id}"
     list: str = f"{_submission}/attachments"
+    get: str = f"{_submission}/attachments/{{fname}}"
     post: str = f"{_submission}/attachments/{{fname}}"
 
 
@@ -51,13 +111,16 @@ class SubmissionAttachmentService(Service):
         form_id: str | None = None,
         project_id: int | None = None,
         instance_id: str | None = None,
-    ) -> list[SubmissionAttachment]:
+        trusted: bool | None = None,
+    ) -> list[SubmissionAttachment] | ModelList[SubmissionAttachment]:
         """
         Read all Submission Attachment details.
 
         :param form_id: The xmlFormId of the Form being referenced.
         :param project_id: The id of the project the Submissions belong to.
         :param instance_id: The instanceId of the Submission being referenced.
+        :param trusted: If True, validate each item when it is first accessed, instead
+          of all items now. Defaults to the client's `trust_responses` setting.
         """
         try:
             pid = pv.validate_project_id(project_id, self.default_project_id)
@@ -74,8 +137,7 @@ class SubmissionAttachmentService(Service):
             ),
             logger=log,
         )
-        data = response.json()
-        return [SubmissionAttachment(**r) for r in data]
+        return self._to_models(SubmissionAttachment, response, trusted)
 
     def upload(
         self,
@@ -102,34 +164,163 @@ class SubmissionAttachmentService(Service):
             if file_name is None:
                 file_name = pv.validate_str(file_path.name, key="file_name")
             guess_type, guess_encoding = mimetypes.guess_type(file_name)
-            headers = {
-                "Transfer-Encoding": "chunked",
-                "Content-Type": guess_type or "application/octet-stream",
-            }
+            headers = {"Content-Type": guess_type or "application/octet-stream"}
             if guess_encoding:  # associated compression type, if any.
                 headers["Content-Encoding"] = guess_encoding
         except PyODKError as err:
             log.error(err, exc_info=True)
             raise
 
-        def file_stream():
-            # Generator forces requests to read/send in chunks instead of all at once.
-            with open(file_path, "rb") as f:
-                while chunk := f.read(self.session.blocksize):
-                    yield chunk
+        # The body can be sent again if the request is retried (e.g. after a 503).
+        with open_upload(file_path, memory_map=self.session.memory_map_uploads) as f:
+            response = self.session.response_or_error(
+                method="POST",
+                url=self.session.urlformat(
+                    self.urls.post,
+                    project_id=pid,
+                    form_id=fid,
+                    instance_id=iid,
+                    fname=file_name,
+                ),
+                logger=log,
+                headers=headers,
+                data=f,
+            )
+        data = response.json()
+        return data["success"]
 
-        response = self.session.response_or_error(
-            method="POST",
+    def download(
+        self,
+        file_name: str,
+        file_path: PathLike | str,
+        project_id: int | None = None,
+        form_id: str | None = None,
+        instance_id: str | None = None,
+        skip_unchanged: bool = True,
+        max_resumes: int = 3,
+    ) -> bool:
+        """
+        Download a Submission Attachment.
+
+        The file is written as it is received, instead of being held in memory. If the
+        connection drops, the download resumes from where it stopped. See
+        `pyodk._utils.transfer`.
+
+        :param file_name: The name of the attachment, e.g. from `list`.
+        :param file_path: Where to write the file.
+        :param project_id: The id of the project this form belongs to.
+        :param form_id: The xmlFormId of the Form being referenced.
+        :param instance_id: The instanceId of the Submission being referenced.
+        :param skip_unchanged: If True, and `file_path` exists, only download the
+          attachment if its MD5 hash differs from the file's.
+        :param max_resumes: The number of times to resume after a dropped connection,
+          before raising an error.
+
+        :return: True if the file was downloaded, or False if the file was unchanged.
+        """
+        try:
+            pid = pv.validate_project_id(project_id, self.default_project_id)
+            fid = pv.validate_form_id(form_id, self.default_form_id)
+            iid = pv.validate_instance_id(instance_id, self.default_instance_id)
+            fname = pv.validate_str(file_name, key="file_name")
+            path = Path(
+                pv.validate_is_instance(file_path, typ=(str, PathLike), key="file_path")
+            )
+        except PyODKError as err:
+            log.error(err, exc_info=True)
+            raise
+
+        headers = {}
+        if skip_unchanged and path.is_file():
+            # Central sends the attachment MD5 hash as its ETag.
+            headers["If-None-Match"] = f'"{file_md5(path)}"'
+        download = Download(
+            session=self.session,
             url=self.session.urlformat(
-                self.urls.post,
+                self.urls.get,
                 project_id=pid,
                 form_id=fid,
                 instance_id=iid,
-                fname=file_name,
+                fname=fname,
             ),
+            path=path,
             logger=log,
             headers=headers,
-            data=file_stream(),
+            max_resumes=max_resumes,
         )
-        data = response.json()
-        return data["success"]
+        download.run()
+        return not download.not_modified
+
+    def download_many(
+        self,
+        attachments: Iterable[tuple[str, str]],
+        directory: PathLike | str,
+        project_id: int | None = None,
+        form_id: str | None = None,
+        max_workers: int = 4,
+        skip_unchanged: bool = True,
+        max_resumes: int = 3,
+    ) -> AttachmentDownloads:
+        """
+        Download many Submission Attachments, e.g. all the photos of a form.
+
+        Each file is written to `directory/<instance_id>/<file_name>`, with characters
+        which aren't allowed in file names replaced by "_" (e.g. "uuid_1234"). If that
+        path is already taken by another attachment (e.g. "a?.jpg" and "a_.jpg"), a
+        number is added to the name, e.g. "a_ (2).jpg". To send requests concurrently,
+        set `max_workers` to more than 1. The session's connection pool should have at
+        least `max_workers` connections (10 by default).
+
+        A failed download doesn't stop the others: requests are retried by the session
+        (e.g. after a 503 response), and each download resumes after a dropped
+        connection, up to `max_resumes` times. Any error after that is recorded in the
+        return value, so the failed files can be downloaded again later.
+
+        :param attachments: The (instance_id, file_name) of each attachment. Consumed
+          lazily, so it can be a generator.
+        :param directory: The directory to write the files to.
+        :param project_id: The id of the project this form belongs to.
+        :param form_id: The xmlFormId of the Form being referenced.
+        :param max_workers: The number of files to download at once.
+        :param skip_unchanged: If True, don't download files which exist with the same
+          MD5 hash as the attachment.
+        :param max_resumes: The number of times to resume each download after a dropped
+          connection, before recording an error.
+        """
+        try:
+            pid = pv.validate_project_id(project_id, self.default_project_id)
+            fid = pv.validate_form_id(form_id, self.default_form_id)
+            root = Path(
+                pv.validate_is_instance(directory, typ=(str, PathLike), key="directory")
+            )
+        except PyODKError as err:
+            log.error(err, exc_info=True)
+            raise
+
+        def download(item_path: tuple[tuple[str, str], Path]) -> tuple[Path, bool]:
+            (instance_id, file_name), path = item_path
+            path.parent.mkdir(parents=True, exist_ok=True)
+            downloaded = self.download(
+                file_name=file_name,
+                file_path=path,
+                project_id=pid,
+                form_id=fid,
+                instance_id=instance_id,
+                skip_unchanged=skip_unchanged,
+                max_resumes=max_resumes,
+            )
+            return path, downloaded
+
+        results = AttachmentDownloads()
+        for outcome in map_bounded(
+            func=download,
+            items=_unique_paths(attachments, root=root),
+            max_workers=max_workers,
+        ):
+            key = outcome.item[0]
+            if outcome.error is not None:
+                results.errors[key] = outcome.error
+            else:
+                path, downloaded = outcome.result
+                (results.downloaded if downloaded else results.unchanged)[key] = path
+        return results
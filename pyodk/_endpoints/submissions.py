@@ -1,19 +1,26 @@
 import logging
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable, Iterator
 from dataclasses import dataclass
 from datetime import datetime
 from os import PathLike
+from pathlib import Path
 from typing import Any
 
-from pyodk._endpoints.bases import Model, Service
+from pyodk._endpoints.bases import Model, ModelList, Record, Service
 from pyodk._endpoints.comments import Comment, CommentService
 from pyodk._endpoints.submission_attachments import (
+    AttachmentDownloads,
     SubmissionAttachment,
     SubmissionAttachmentService,
 )
 from pyodk._utils import validators as pv
+from pyodk._utils.columnar import read_columnar
+from pyodk._utils.concurrency import map_bounded
+from pyodk._utils.edmx import ODataSchema, SchemaCache, parse_metadata
+from pyodk._utils.odata import iter_table_rows
 from pyodk._utils.session import Session
-from pyodk.errors import PyODKError
+from pyodk._utils.transfer import TransferProgress, download
+from pyodk.errors import AttachmentUploadError, PyODKError
 
 log = logging.getLogger(__name__)
 
@@ -37,6 +44,10 @@ class URLs:
     list: str = f"{_form}/submissions"
     get: str = f"{_form}/submissions/{{instance_id}}"
     get_table: str = f"{_form}.svc/{{table_name}}"
+    get_form: str = _form
+    get_metadata: str = f"{_form}.svc/$metadata"
+    export: str = f"{_form}/submissions.csv.zip"
+    export_csv: str = f"{_form}/submissions.csv"
     post: str = f"{_form}/submissions"
     patch: str = f"{_form}/submissions/{{instance_id}}"
     put: str = f"{_form}/submissions/{{instance_id}}"
@@ -54,7 +65,13 @@ class SubmissionService(Service):
     ```
     """
 
-    __slots__ = ("default_form_id", "default_project_id", "session", "urls")
+    __slots__ = (
+        "default_form_id",
+        "default_project_id",
+        "schema_cache",
+        "session",
+        "urls",
+    )
 
     def __init__(
         self,
@@ -67,6 +84,7 @@ class SubmissionService(Service):
         self.session: Session = session
         self.default_project_id: int | None = default_project_id
         self.default_form_id: str | None = default_form_id
+        self.schema_cache: SchemaCache = SchemaCache()
 
     def _default_kw(self) -> dict[str, Any]:
         return {
@@ -75,13 +93,21 @@ class SubmissionService(Service):
         }
 
     def list(
-        self, form_id: str | None = None, project_id: int | None = None
-    ) -> list[Submission]:
+        self,
+        form_id: str | None = None,
+        project_id: int | None = None,
+        trusted: bool | None = None,
+        compact: bool = False,
+    ) -> list[Submission] | ModelList[Submission] | list[Record]:
         """
         Read all Submission metadata.
 
         :param form_id: The xmlFormId of the Form being referenced.
         :param project_id: The id of the project the Submissions belong to.
+        :param trusted: If True, validate each item when it is first accessed, instead
+          of all items now. Defaults to the client's `trust_responses` setting.
+        :param compact: If True, return a `Record` for each item instead of a model, which
+          uses much less memory. The `trusted` setting is not used.
 
         :return: A list of the object representation of all Submissions' metadata.
         """
@@ -97,8 +123,7 @@ class SubmissionService(Service):
             url=self.session.urlformat(self.urls.list, project_id=pid, form_id=fid),
             logger=log,
         )
-        data = response.json()
-        return [Submission(**r) for r in data]
+        return self._to_models(Submission, response, trusted, compact)
 
     def get(
         self,
@@ -145,6 +170,9 @@ class SubmissionService(Service):
         filter: str | None = None,
         expand: str | None = None,
         select: str | None = None,
+        columnar: bool = False,
+        dtypes: dict[str, str] | None = None,
+        typed: bool = False,
     ) -> dict:
         """
         Read Submission data.
@@ -165,6 +193,15 @@ class SubmissionService(Service):
         :param expand: Repetitions, which should get expanded. Currently, only `*` (star)
           is implemented, which expands all repetitions.
         :param select: If provided, will return only the selected fields.
+        :param columnar: If True, return the rows of the "value" array as columns,
+          built while the response is read. See `pyodk._utils.columnar`. With NumPy
+          installed (`pip install pyodk[numpy]`), each column is a masked array.
+        :param dtypes: For a columnar result, the type of some columns, by column name:
+          "int", "float", "bool", "datetime", "date", "str", "geo", or "geopoint" (see
+          `TableBuilder` in `pyodk._utils.columnar`). Other column types are inferred.
+        :param typed: If True, convert values using the column types from the form (see
+          `get_table_schema`): datetimes and dates, and for a columnar result also
+          numbers and geopoints. The `dtypes` take precedence.
 
         :return: A dictionary representation of the OData JSON document.
         """
@@ -189,15 +226,227 @@ class SubmissionService(Service):
             log.error(err, exc_info=True)
             raise
 
+        url = self.session.urlformat(
+            self.urls.get_table, project_id=pid, form_id=fid, table_name=table
+        )
+        schema = self.get_table_schema(form_id=fid, project_id=pid) if typed else None
+        if columnar:
+            if schema is not None:
+                dtypes = {**schema.dtypes(table), **(dtypes or {})}
+            response = self.session.response_or_error(
+                method="GET", url=url, logger=log, params=params, stream=True
+            )
+            with response:
+                return read_columnar(
+                    response.iter_content(chunk_size=self.session.blocksize),
+                    dtypes=dtypes,
+                )
         response = self.session.response_or_error(
             method="GET",
+            url=url,
+            logger=log,
+            params=params,
+        )
+        data = response.json()
+        if schema is not None:
+            convert = schema.row_converter(table)
+            for row in data.get("value", ()):
+                convert(row)
+        return data
+
+    def get_table_schema(
+        self, form_id: str | None = None, project_id: int | None = None
+    ) -> ODataSchema:
+        """
+        Read the column types of the form's tables (Submissions, and repeats), from the
+        OData metadata document (`$metadata`).
+
+        The schema is cached by the form version and hash, so `$metadata` is only
+        requested again if the form has changed. Checking the form version is a small
+        request.
+
+        :param form_id: The xmlFormId of the Form being referenced.
+        :param project_id: The id of the project this form belongs to.
+        """
+        try:
+            pid = pv.validate_project_id(project_id, self.default_project_id)
+            fid = pv.validate_form_id(form_id, self.default_form_id)
+        except PyODKError as err:
+            log.error(err, exc_info=True)
+            raise
+
+        form = self.session.response_or_error(
+            method="GET",
+            url=self.session.urlformat(self.urls.get_form, project_id=pid, form_id=fid),
+            logger=log,
+        ).json()
+
+        def load() -> ODataSchema:
+            response = self.session.response_or_error(
+                method="GET",
+                url=self.session.urlformat(
+                    self.urls.get_metadata, project_id=pid, form_id=fid
+                ),
+                logger=log,
+            )
+            return parse_metadata(response.content)
+
+        key = (self.session.base_url, pid, fid, form.get("version"), form.get("hash"))
+        return self.schema_cache.get(key, load)
+
+    def iter_table(
+        self,
+        form_id: str | None = None,
+        project_id: int | None = None,
+        table_name: str | None = "Submissions",
+        page_size: int = 1000,
+        skip: int | None = None,
+        wkt: bool | None = None,
+        filter: str | None = None,
+        expand: str | None = None,
+        select: str | None = None,
+    ) -> Iterator[dict]:
+        """
+        Read Submission data one row at a time, requesting it page by page.
+
+        Each page is requested with `$top` set to `page_size`. The next page is found by
+        following the `@odata.nextLink` in the response, or (for servers that don't
+        provide one) by incrementing `$skip`. Each page is decoded incrementally as it
+        is received, so at most one row is held in memory at a time. This is suitable
+        for tables too large to read with `get_table`.
+
+        The requests are made when iteration starts, not when this method is called.
+
+        :param form_id: The xmlFormId of the Form being referenced.
+        :param project_id: The id of the project this form belongs to.
+        :param table_name: The name of the table to be returned.
+        :param page_size: The maximum number of rows to request per page.
+        :param skip: The first n rows will be omitted from the results.
+        :param wkt: If True, geospatial data will be returned as Well-Known Text (WKT)
+          strings rather than GeoJSON structures.
+        :param filter: Filter responses to those matching the query. Only certain fields
+          are available to reference (submitterId, createdAt, updatedAt, reviewState).
+          The operators lt, le, eq, neq, ge, gt, not, and, and or are supported, and the
+          built-in functions now, year, month, day, hour, minute, second.
+        :param expand: Repetitions, which should get expanded. Currently, only `*` (star)
+          is implemented, which expands all repetitions.
+        :param select: If provided, will return only the selected fields.
+
+        :return: An iterator of the rows in the OData JSON document "value" array.
+        """
+        try:
+            pid = pv.validate_project_id(project_id, self.default_project_id)
+            fid = pv.validate_form_id(form_id, self.default_form_id)
+            table = pv.validate_table_name(table_name)
+            top = pv.validate_int(page_size, key="page_size")
+            if top < 1:
+                raise PyODKError("page_size: must be greater than 0.")  # noqa: TRY301
+            offset = 0 if skip is None else pv.validate_int(skip, key="skip")
+            params = {
+                k: v
+                for k, v in {
+                    "$top": top,
+                    "$wkt": wkt,
+                    "$filter": filter,
+                    "$expand": expand,
+                    "$select": select,
+                }.items()
+                if v is not None
+            }
+        except PyODKError as err:
+            log.error(err, exc_info=True)
+            raise
+
+        return iter_table_rows(
+            session=self.session,
             url=self.session.urlformat(
                 self.urls.get_table, project_id=pid, form_id=fid, table_name=table
             ),
+            params=params,
+            page_size=top,
+            offset=offset,
+            logger=log,
+        )
+
+    def export(
+        self,
+        path: PathLike | str,
+        form_id: str | None = None,
+        project_id: int | None = None,
+        attachments: bool = False,
+        repeats: bool = True,
+        filter: str | None = None,
+        group_paths: bool | None = None,
+        split_select_multiples: bool | None = None,
+        deleted_fields: bool | None = None,
+        max_resumes: int = 3,
+        progress: Callable[[TransferProgress], Any] | None = None,
+    ) -> Path:
+        """
+        Download the Submissions as CSV, as from the Central form page "Download" button.
+
+        The export is written to the file as it is received, in `chunk_size` chunks,
+        instead of being held in memory. If the connection drops, the download resumes
+        from where it stopped, if the server supports it (otherwise it starts again).
+        See `pyodk._utils.transfer`.
+
+        :param path: Where to write the file, e.g. "submissions.zip". The file is only
+          written once the download is complete; until then it is "<path>.part".
+        :param form_id: The xmlFormId of the Form being referenced.
+        :param project_id: The id of the project this form belongs to.
+        :param attachments: If True, include the Submission attachments in the ZIP.
+        :param repeats: If True, download a ZIP file with a CSV file for the
+          Submissions and one for each repeat. If False, download only the Submissions
+          CSV file (`attachments` is not used).
+        :param filter: Filter responses to those matching the query, as for
+          `get_table`, e.g. "__system/submissionDate ge 2025-01-01".
+        :param group_paths: If False, name columns without their group path, e.g.
+          "age" instead of "person-age". Defaults to True.
+        :param split_select_multiples: If True, add a column for each choice of each
+          select multiple question. Defaults to False.
+        :param deleted_fields: If True, include fields from earlier form versions which
+          have been removed. Defaults to False.
+        :param max_resumes: The number of times to resume after a dropped connection,
+          before raising an error.
+        :param progress: A function to call with a `TransferProgress` (bytes written,
+          total, bytes per second) as the file is written.
+
+        :return: The path of the downloaded file.
+        """
+        try:
+            pid = pv.validate_project_id(project_id, self.default_project_id)
+            fid = pv.validate_form_id(form_id, self.default_form_id)
+            file_path = Path(
+                pv.validate_is_instance(path, typ=(str, PathLike), key="path")
+            )
+            params = {
+                k: str(v).lower() if isinstance(v, bool) else v
+                for k, v in {
+                    "attachments": attachments if repeats else None,
+                    "$filter": filter,
+                    "groupPaths": group_paths,
+                    "splitSelectMultiples": split_select_multiples,
+                    "deletedFields": deleted_fields,
+                }.items()
+                if v is not None
+            }
+        except PyODKError as err:
+            log.error(err, exc_info=True)
+            raise
+
+        return download(
+            session=self.session,
+            url=self.session.urlformat(
+                self.urls.export if repeats else self.urls.export_csv,
+                project_id=pid,
+                form_id=fid,
+            ),
+            path=file_path,
             logger=log,
             params=params,
+            max_resumes=max_resumes,
+            progress=progress,
         )
-        return response.json()
 
     def create(
         self,
@@ -207,6 +456,8 @@ class SubmissionService(Service):
         device_id: str | None = None,
         encoding: str = "utf-8",
         attachments: Iterable[PathLike | str] | None = None,
+        max_workers: int = 1,
+        list_attachments: bool = True,
     ) -> Submission:
         """
         Create a Submission.
@@ -232,10 +483,19 @@ class SubmissionService(Service):
         unique file name references in the submission XML if necessary, e.g. Central will
         only store one `pigeon.jpg` file across all questions in a given submission. You
         may provide directory paths to pyodk e.g. `["/home/u/pigeon.jpg"]`, but only the
-        file name is used to identify the file in the upload to Central.
+        file name is used to identify the file in the upload to Central, so an error is
+        raised if two attachments have the same file name.
 
         File attachments are sent in chunks of 16 KB by default. Advanced users can customize
-        the chunk size on [the session](../#session-customization).
+        the chunk size on [the session](../#session-customization), and set `compression`
+        to compress a large submission XML. To upload several attachments at once, set
+        `max_workers`. The session's connection pool should have at least `max_workers`
+        connections (10 by default).
+
+        If any attachment fails to upload, the others are still uploaded, then an
+        `AttachmentUploadError` is raised, with the files which were and weren't
+        uploaded. The Submission is created regardless, so the failed files can be
+        uploaded again with its instanceId.
 
         :param xml: The submission XML.
         :param form_id: The xmlFormId of the Form being referenced.
@@ -243,6 +503,12 @@ class SubmissionService(Service):
         :param device_id: An optional deviceID associated with the submission.
         :param encoding: The encoding of the submission XML, default "utf-8".
         :param attachments: The file paths of the attachment(s) to upload.
+        :param max_workers: The number of attachments to upload at once. By default,
+          they are uploaded one at a time.
+        :param list_attachments: If True, read the Submission's attachments from Central
+          after uploading, which includes any files in the submission XML not uploaded
+          yet. If False, the returned Submission only lists the uploaded attachments,
+          which saves a request.
         """
         try:
             pid = pv.validate_project_id(project_id, self.default_project_id)
@@ -250,6 +516,7 @@ class SubmissionService(Service):
             params = {}
             if device_id is not None:
                 params["deviceID"] = pv.validate_str(device_id, key="device_id")
+            attachments = pv.validate_unique_file_names(attachments or ())
         except PyODKError as err:
             log.error(err, exc_info=True)
             raise
@@ -261,6 +528,7 @@ class SubmissionService(Service):
             headers={"Content-Type": "application/xml"},
             params=params,
             data=xml.encode(encoding=encoding),
+            compress=True,
         )
         data = response.json()
         iid = data["instanceId"]
@@ -268,22 +536,40 @@ class SubmissionService(Service):
             session=self.session, **self._default_kw()
         )
 
-        if attachments:
-            for attach in attachments:
-                if not attachment_svc.upload(
-                    file_path=attach,
-                    project_id=pid,
-                    form_id=fid,
-                    instance_id=iid,
-                ):
-                    raise PyODKError(f"Attachment upload failed: {attach}.")
-
-        # Request list in case the submission XML mentions other files not provided yet.
-        attach_meta = attachment_svc.list(
-            project_id=pid,
-            form_id=fid,
-            instance_id=iid,
-        )
+        uploaded, failed = [], {}
+        for outcome in map_bounded(
+            func=lambda attach: attachment_svc.upload(
+                file_path=attach,
+                project_id=pid,
+                form_id=fid,
+                instance_id=iid,
+            ),
+            items=attachments,
+            max_workers=max_workers,
+        ):
+            if outcome.error is not None:
+                failed[outcome.item] = outcome.error
+            elif not outcome.result:
+                failed[outcome.item] = PyODKError("Central did not report success.")
+            else:
+                uploaded.append(outcome.item)
+        if failed:
+            err = AttachmentUploadError(instance_id=iid, uploaded=uploaded, failed=failed)
+            log.error(err)
+            raise err
+
+        if list_attachments:
+            # Request list in case the submission XML mentions files not provided yet.
+            attach_meta = attachment_svc.list(
+                project_id=pid,
+                form_id=fid,
+                instance_id=iid,
+            )
+        else:
+            attach_meta = [
+                SubmissionAttachment(name=Path(attach).name, exists=True)
+                for attach in uploaded
+            ]
         # Attachments don't seem to trigger updatedAt so use original data.
         return Submission(attachments=attach_meta or None, **data)
 
@@ -320,6 +606,7 @@ class SubmissionService(Service):
             logger=log,
             headers={"Content-Type": "application/xml"},
             data=xml.encode(encoding=encoding),
+            compress=True,
         )
         data = response.json()
         return Submission(**data)
@@ -463,3 +750,40 @@ class SubmissionService(Service):
         fp_ids = {"form_id": form_id, "project_id": project_id}
         comment_svc = CommentService(session=self.session, **self._default_kw())
         return comment_svc.post(comment=comment, instance_id=instance_id, **fp_ids)
+
+    def download_attachments(
+        self,
+        attachments: Iterable[tuple[str, str]],
+        directory: PathLike | str,
+        form_id: str | None = None,
+        project_id: int | None = None,
+        max_workers: int = 4,
+        skip_unchanged: bool = True,
+    ) -> AttachmentDownloads:
+        """
+        Download many Submission Attachments, e.g. all the photos of a form, to
+        `directory/<instance_id>/<file_name>`.
+
+        See `SubmissionAttachmentService.download_many`.
+
+        :param attachments: The (instance_id, file_name) of each attachment.
+        :param directory: The directory to write the files to.
+        :param form_id: The xmlFormId of the Form being referenced.
+        :param project_id: The id of the project the Submissions belong to.
+        :param max_workers: The number of files to download at once.
+        :param skip_unchanged: If True, don't download files which exist with the same
+          MD5 hash as the attachment.
+
+        :return: The path of each file downloaded or unchanged, and any errors.
+        """
+        fp_ids = {"form_id": form_id, "project_id": project_id}
+        attachment_svc = SubmissionAttachmentService(
+            session=self.session, **self._default_kw()
+        )
+        return attachment_svc.download_many(
+            attachments=attachments,
+            directory=directory,
+            max_workers=max_workers,
+            skip_unchanged=skip_unchanged,
+            **fp_ids,
+        )
@@ -0,0 +1,315 @@
+"""
+Build OData tables as columns instead of rows.
+
+Columns are built while the response is parsed, one row at a time, so the list of row
+dicts is never made. If NumPy is installed (`pip install pyodk[numpy]`), each column is
+a `numpy.ma.MaskedArray`, with a typed array (int64, float64, bool, datetime64[us], or
+datetime64[D]) where the values allow, and a mask for the nulls. Otherwise each column
+is a list, with None for nulls.
+"""
+
+import importlib
+import re
+from array import array
+from collections.abc import Iterable, Mapping
+from datetime import date, datetime, timedelta, timezone
+from functools import cache
+from typing import Any
+
+from pyodk._utils.odata import ODataStream
+from pyodk.errors import PyODKError
+
+SEPARATOR = "/"
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+_EPOCH_DATE = date(1970, 1, 1)
+_EPOCH_ORDINAL = _EPOCH_DATE.toordinal()
+_WKT_POINT = re.compile(r"POINT\s*Z?\s*\(([^)]*)\)", re.IGNORECASE)
+
+
+@cache
+def get_numpy():
+    """Get the numpy module, or None if it isn't installed."""
+    try:
+        return importlib.import_module("numpy")
+    except ImportError:
+        return None
+
+
+def _to_int(value: Any) -> int:
+    if isinstance(value, bool) or not isinstance(value, int | float | str):
+        raise TypeError(value)
+    # Rather than truncate, e.g. 2.7 to 2.
+    if isinstance(value, float) and not value.is_integer():
+        raise ValueError(value)
+    return int(value)
+
+
+def _to_float(value: Any) -> float:
+    if isinstance(value, bool) or not isinstance(value, int | float | str):
+        raise TypeError(value)
+    return float(value)
+
+
+def _to_bool(value: Any) -> bool:
+    if isinstance(value, bool):
+        return value
+    if value in ("true", "false"):
+        return value == "true"
+    raise TypeError(value)
+
+
+def _to_microseconds(value: Any) -> int:
+    """Convert an ISO 8601 datetime to microseconds since the epoch, assuming UTC."""
+    if not isinstance(value, str):
+        raise TypeError(value)
+    # Python 3.10 doesn't parse the "Z" suffix.
+    dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return (dt - _EPOCH) // _MICROSECOND
+
+
+def _to_days(value: Any) -> int:
+    """Convert an ISO 8601 date to days since the epoch."""
+    if not isinstance(value, str):
+        raise TypeError(value)
+    return date.fromisoformat(value).toordinal() - _EPOCH_ORDINAL
+
+
+def parse_geopoint(value: Any) -> tuple[float, float, float | None, float | None]:
+    """
+    Get the longitude, latitude, altitude, and accuracy of a geopoint, from GeoJSON
+    (the default) or WKT (if requested with `wkt=True`).
+    """
+    if isinstance(value, dict):
+        coordinates = value["coordinates"]
+        accuracy = (value.get("properties") or {}).get("accuracy")
+    elif isinstance(value, str) and (match := _WKT_POINT.fullmatch(value.strip())):
+        coordinates, accuracy = [float(c) for c in match.group(1).split()], None
+    else:
+        raise ValueError(value)
+    altitude = coordinates[2] if len(coordinates) > 2 else None
+    return (
+        float(coordinates[0]),
+        float(coordinates[1]),
+        None if altitude is None else float(altitude),
+        None if accuracy is None else float(accuracy),
+    )
+
+
+# For each column type: the array typecode, the value converter, and the numpy dtype.
+# Columns without a typecode hold the values as they are. "geo" and "geopoint" columns
+# hold GeoJSON objects, which are not flattened into columns.
+DTYPES = {
+    "int": ("q", _to_int, "int64"),
+    "float": ("d", _to_float, "float64"),
+    "bool": ("b", _to_bool, "bool"),
+    "datetime": ("q", _to_microseconds, "datetime64[us]"),
+    "date": ("q", _to_days, "datetime64[D]"),
+    "str": (None, None, None),
+    "geo": (None, None, None),
+    "geopoint": (None, parse_geopoint, None),
+}
+GEOPOINT_PARTS = ("longitude", "latitude", "altitude", "accuracy")
+
+
+class _TypedColumn:
+    """A column of a known type, stored compactly as it is built."""
+
+    __slots__ = ("convert", "dtype", "mask", "name", "values")
+
+    def __init__(self, name: str, dtype: str, fill: int):
+        typecode, self.convert, self.dtype = DTYPES[dtype]
+        self.name: str = name
+        self.values: array = array(typecode, bytes(array(typecode).itemsize * fill))
+        self.mask: bytearray = bytearray(b"\x01" * fill)
+
+    def __len__(self) -> int:
+        return len(self.mask)
+
+    def append(self, value: Any) -> None:
+        if value is None:
+            self.values.append(0)
+            self.mask.append(1)
+            return
+        try:
+            self.values.append(self.convert(value))
+        except (TypeError, ValueError, OverflowError) as err:
+            raise PyODKError(
+                f"Column {self.name!r}: can't convert {value!r} to {self.dtype}."
+            ) from err
+        self.mask.append(0)
+
+    def build(self, np) -> Any:
+        if np is None:
+            converted = self.values.tolist()
+            if self.dtype == "bool":
+                converted = [bool(v) for v in converted]
+            elif self.dtype == "datetime64[us]":
+                converted = [_EPOCH + v * _MICROSECOND for v in converted]
+            elif self.dtype == "datetime64[D]":
+                converted = [_EPOCH_DATE + timedelta(days=v) for v in converted]
+            return [None if m else v for v, m in zip(converted, self.mask, strict=True)]
+        data = np.frombuffer(self.values, dtype=self.values.typecode)
+        data = data.astype(self.dtype)
+        mask = np.frombuffer(self.mask, dtype=np.bool_)
+        return np.ma.MaskedArray(data, mask=mask.copy())
+
+
+class _GeopointColumn:
+    """A geopoint column, split into a float column for each part of the point."""
+
+    __slots__ = ("name", "parts")
+
+    def __init__(self, name: str, fill: int):
+        self.name: str = name
+        self.parts: list[_TypedColumn] = [
+            _TypedColumn(name=f"{name}{SEPARATOR}{p}", dtype="float", fill=fill)
+            for p in GEOPOINT_PARTS
+        ]
+
+    def __len__(self) -> int:
+        return len(self.parts[0])
+
+    def append(self, value: Any) -> None:
+        if value is None:
+            values = (None,) * len(self.parts)
+        else:
+            try:
+                values = parse_geopoint(value)
+            except (KeyError, IndexError, TypeError, ValueError) as err:
+                raise PyODKError(
+                    f"Column {self.name!r}: can't convert {value!r} to a geopoint."
+                ) from err
+        for part, v in zip(self.parts, values, strict=True):
+            part.append(v)
+
+    def build(self, np) -> dict[str, Any]:
+        return {part.name: part.build(np) for part in self.parts}
+
+
+def _build_list(np, values: list[Any]) -> Any:
+    """Make the most specific masked array that holds the values."""
+    if np is None:
+        return values
+    data = np.fromiter(values, dtype=object, count=len(values))
+    mask = np.equal(data, None)
+    types = set(map(type, values))
+    types.discard(type(None))
+    if types == {bool}:
+        dtype = np.bool_
+    elif types and types <= {int}:
+        dtype = np.int64
+    elif types and types <= {int, float}:
+        dtype = np.float64
+    else:
+        return np.ma.MaskedArray(data, mask=mask)
+    try:
+        typed = np.where(mask, 0, data).astype(dtype)
+    except OverflowError:  # An int that doesn't fit in int64.
+        return np.ma.MaskedArray(data, mask=mask)
+    return np.ma.MaskedArray(typed, mask=mask)
+
+
+class TableBuilder:
+    """
+    Build the columns of a table, from rows added one at a time.
+
+    Nested objects (e.g. groups, and "__system") are flattened into columns named with
+    their path, e.g. "meta/instanceID". Arrays (e.g. expanded repeats) are not
+    flattened. A column missing from some rows is null in those rows.
+
+    :param dtypes: The type of some columns, by column name: "int", "float", "bool",
+      "datetime", "date", "str", "geo", or "geopoint". These columns are converted as
+      they are built, which uses less memory. A "geopoint" column is split into
+      "longitude", "latitude", "altitude", and "accuracy" columns, e.g.
+      "location/latitude". Other columns are inferred from their values once all rows
+      are added. For column types from the form, see `pyodk._utils.edmx`.
+    """
+
+    __slots__ = ("_names", "columns", "dtypes", "rows")
+
+    def __init__(self, dtypes: Mapping[str, str] | None = None):
+        self.dtypes: dict[str, str] = dict(dtypes or {})
+        for name, dtype in self.dtypes.items():
+            if dtype not in DTYPES:
+                raise PyODKError(
+                    f"Column {name!r}: unknown type {dtype!r}. "
+                    f"Must be one of: {tuple(DTYPES)}."
+                )
+        # A list of values, or a _TypedColumn, for each column.
+        self.columns: dict[str, list[Any] | _TypedColumn | _GeopointColumn] = {}
+        self.rows: int = 0
+        # The column name for each key, for each object path, e.g. "__system/".
+        self._names: dict[str, dict[str, str]] = {}
+
+    def _new_column(self, name: str) -> list[Any] | _TypedColumn | _GeopointColumn:
+        dtype = self.dtypes.get(name)
+        if dtype == "geopoint":
+            column = _GeopointColumn(name=name, fill=self.rows)
+        elif dtype is None or DTYPES[dtype][0] is None:
+            column = [None] * self.rows
+        else:
+            column = _TypedColumn(name=name, dtype=dtype, fill=self.rows)
+        self.columns[name] = column
+        return column
+
+    def _add(self, prefix: str, row: dict[str, Any]) -> int:
+        """Add the values of the row (or nested object); return how many were added."""
+        names = self._names.get(prefix)
+        if names is None:
+            names = self._names[prefix] = {}
+        columns = self.columns
+        added = 0
+        for key, value in row.items():
+            name = names.get(key)
+            if name is None:
+                name = names[key] = f"{prefix}{key}"
+            if type(value) is dict and value and name not in self.dtypes:
+                added += self._add(f"{name}{SEPARATOR}", value)
+                continue
+            column = columns.get(name)
+            if column is None:
+                column = self._new_column(name)
+            column.append(value)
+            added += 1
+        return added
+
+    def add(self, row: dict[str, Any]) -> None:
+        added = self._add("", row)
+        self.rows += 1
+        if added < len(self.columns):
+            for column in self.columns.values():
+                if len(column) < self.rows:
+                    column.append(None)
+
+    def build(self) -> dict[str, Any]:
+        """Get the columns, by column name."""
+        np = get_numpy()
+        columns = {}
+        for name, column in self.columns.items():
+            if isinstance(column, list):
+                columns[name] = _build_list(np, column)
+            elif isinstance(column, _GeopointColumn):
+                columns.update(column.build(np))
+            else:
+                columns[name] = column.build(np)
+        return columns
+
+
+def read_columnar(
+    chunks: Iterable[bytes], dtypes: Mapping[str, str] | None = None
+) -> dict[str, Any]:
+    """
+    Read an OData JSON document, with the rows of the "value" array as columns.
+
+    :param chunks: The response body, e.g. from `Response.iter_content()`.
+    :param dtypes: The type of some columns, by column name. See `TableBuilder`.
+    :return: The OData JSON document, with "value" as a dict of columns.
+    """
+    builder = TableBuilder(dtypes=dtypes)
+    document = ODataStream(chunks)
+    for row in document:
+        builder.add(row)
+    return {**document.metadata, "value": builder.build()}
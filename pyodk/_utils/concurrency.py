@@ -0,0 +1,74 @@
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, NamedTuple
+
+
+class Outcome(NamedTuple):
+    """The result of applying a function to an item, or the error it raised."""
+
+    item: Any
+    result: Any = None
+    error: Exception | None = None
+
+
+def map_bounded(
+    func: Callable[[Any], Any],
+    items: Iterable[Any],
+    max_workers: int = 1,
+    max_in_flight: int | None = None,
+    stop_on_error: bool = False,
+) -> Iterator[Outcome]:
+    """
+    Apply `func` to each item, yielding an Outcome for each item in the input order.
+
+    With `max_workers` > 1, items are processed on a thread pool, with no more than
+    `max_in_flight` items submitted but not yet yielded. This bounds memory use for
+    large inputs, and the number of concurrent requests when `func` sends one. Errors
+    raised by `func` are captured in the Outcome rather than raised.
+
+    :param func: The function to apply to each item.
+    :param items: The items to process. Consumed lazily.
+    :param max_workers: The number of threads to use. If 1, items are processed in the
+      calling thread.
+    :param max_in_flight: The maximum number of submitted items not yet yielded.
+      Defaults to twice `max_workers`.
+    :param stop_on_error: If True, don't start any more items after an error. Items
+      already in flight are finished and yielded, the rest are not.
+    """
+
+    def apply(item: Any) -> Outcome:
+        try:
+            return Outcome(item=item, result=func(item))
+        except Exception as err:
+            return Outcome(item=item, error=err)
+
+    if max_workers <= 1:
+        for item in items:
+            outcome = apply(item)
+            yield outcome
+            if stop_on_error and outcome.error is not None:
+                return
+        return
+
+    if max_in_flight is None:
+        max_in_flight = 2 * max_workers
+    max_in_flight = max(max_in_flight, max_workers)
+    source = iter(items)
+    pending: deque[Future] = deque()
+    stopped = False
+    end = object()
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while True:
+            while not stopped and len(pending) < max_in_flight:
+                item = next(source, end)
+                if item is end:
+                    stopped = True
+                else:
+                    pending.append(executor.submit(apply, item))
+            if not pending:
+                return
+            outcome = pending.popleft().result()
+            if stop_on_error and outcome.error is not None:
+                stopped = True
+            yield outcome
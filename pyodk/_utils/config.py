@@ -1,6 +1,7 @@
 import logging
 import os
 from dataclasses import dataclass, field
+from datetime import datetime, timezone
 from pathlib import Path
 
 import toml
@@ -102,16 +103,41 @@ def read_cache_token(cache_path: str | None = None) -> str:
     return file_data["token"]
 
 
-def write_cache(key: str, value: str, cache_path: str | None = None) -> None:
+def read_cache_token_expiry(cache_path: str | None = None) -> datetime | None:
+    """
+    Read the "token_expires_at" key from the cache file.
+
+    :return: The token expiry time, or None if it's not in the cache or can't be parsed.
+    """
+    file_path = get_cache_path(cache_path=cache_path)
+    file_data = read_toml(path=file_path)
+    try:
+        # Python <3.11 fromisoformat doesn't accept the "Z" suffix that Central uses.
+        value = datetime.fromisoformat(
+            file_data["token_expires_at"].replace("Z", "+00:00")
+        )
+    except (KeyError, AttributeError, ValueError):
+        return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value
+
+
+def write_cache(key: str, value: str | None, cache_path: str | None = None) -> None:
     """
     Append or overwrite the given key/value pair to the cache file.
+
+    If the value is None, the key is removed from the cache file.
     """
     file_path = get_cache_path(cache_path=cache_path)
     if file_path.exists() and file_path.is_file():
         file_data = read_toml(path=file_path)
-        file_data[key] = value
     else:
-        file_data = {key: value}
+        file_data = {}
+    if value is None:
+        file_data.pop(key, None)
+    else:
+        file_data[key] = value
     with open(file_path, "w") as outfile:
         toml.dump(file_data, outfile)
 
@@ -0,0 +1,234 @@
+"""
+Read the OData service metadata document (EDMX, at `.svc/$metadata`), which describes
+the type of each column of each table, e.g. of a form's Submissions and repeats.
+
+The column types are used to convert values while reading a table, instead of each
+caller inferring the types from the values.
+"""
+
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass, field
+from datetime import date, datetime, timezone
+from typing import Any
+from xml.etree import ElementTree
+
+from pyodk._utils.columnar import SEPARATOR
+from pyodk.errors import PyODKError
+
+EDM = "{http://docs.oasis-open.org/odata/ns/edm}"
+
+# The columnar dtype for each Edm type. Other types (e.g. enums) are left as they are.
+EDM_DTYPES = {
+    "Edm.Byte": "int",
+    "Edm.SByte": "int",
+    "Edm.Int16": "int",
+    "Edm.Int32": "int",
+    "Edm.Int64": "int",
+    "Edm.Decimal": "float",
+    "Edm.Double": "float",
+    "Edm.Single": "float",
+    "Edm.Boolean": "bool",
+    "Edm.DateTimeOffset": "datetime",
+    "Edm.Date": "date",
+    "Edm.String": "str",
+    "Edm.GeographyPoint": "geopoint",
+    "Edm.GeographyLineString": "geo",
+    "Edm.GeographyPolygon": "geo",
+}
+
+
+def _to_datetime(value: str) -> datetime:
+    # Python 3.10 doesn't parse the "Z" suffix.
+    dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    return dt if dt.tzinfo is not None else dt.replace(tzinfo=timezone.utc)
+
+
+# The converter for each dtype, for rows. JSON numbers and booleans need no conversion.
+ROW_CONVERTERS: dict[str, Callable[[Any], Any]] = {
+    "datetime": _to_datetime,
+    "date": date.fromisoformat,
+}
+
+
+@dataclass
+class ODataSchema:
+    """
+    The column types of the tables of an OData service, e.g. a form's submissions.
+
+    :param tables: The Edm type (e.g. "Edm.Int64") of each column, by column name, by
+      table name (e.g. "Submissions"). Nested objects (e.g. groups) are flattened into
+      columns named with their path, e.g. "meta/instanceID", as in columnar results.
+    """
+
+    tables: dict[str, dict[str, str]]
+    _row_converters: dict[str, Callable[[dict], dict]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def _table(self, table: str) -> dict[str, str]:
+        try:
+            return self.tables[table]
+        except KeyError as err:
+            raise PyODKError(
+                f"Table {table!r} not found. Must be one of: {tuple(self.tables)}."
+            ) from err
+
+    def dtypes(self, table: str) -> dict[str, str]:
+        """
+        Get the columnar dtype of each column of the table, for the types which have
+        one. See `pyodk._utils.columnar.TableBuilder`.
+
+        :param table: The table name, e.g. "Submissions".
+        """
+        return {
+            name: EDM_DTYPES[edm]
+            for name, edm in self._table(table).items()
+            if edm in EDM_DTYPES
+        }
+
+    def row_converter(self, table: str) -> Callable[[dict], dict]:
+        """
+        Make a function which converts the values of a row of the table, in place:
+        datetimes (e.g. "__system/submissionDate") and dates.
+
+        The conversions are planned once per table, so each row only visits the
+        columns which need converting.
+
+        :param table: The table name, e.g. "Submissions".
+        """
+        converter = self._row_converters.get(table)
+        if converter is None:
+            converter = make_row_converter(self.dtypes(table))
+            self._row_converters[table] = converter
+        return converter
+
+
+def make_row_converter(dtypes: dict[str, str]) -> Callable[[dict], dict]:
+    """
+    Make a function which converts the values of a row in place, by column name.
+
+    :param dtypes: The columnar dtype of each column, by column name.
+    """
+    # A tree of the object keys leading to each column which needs converting.
+    tree: dict[str, Any] = {}
+    for name, dtype in dtypes.items():
+        if (convert := ROW_CONVERTERS.get(dtype)) is None:
+            continue
+        *path, key = name.split(SEPARATOR)
+        node = tree
+        for part in path:
+            node = node.setdefault(part, {})
+        node[key] = convert
+
+    def convert_object(obj: dict, node: dict[str, Any]) -> None:
+        for key, child in node.items():
+            value = obj.get(key)
+            if value is None:
+                continue
+            if isinstance(child, dict):
+                if isinstance(value, dict):
+                    convert_object(value, child)
+            elif isinstance(value, str):
+                obj[key] = child(value)
+
+    def convert_row(row: dict) -> dict:
+        convert_object(row, tree)
+        return row
+
+    return convert_row
+
+
+def _flatten(
+    properties: list[tuple[str, str]],
+    complex_types: dict[str, list[tuple[str, str]]],
+    prefix: str = "",
+    seen: frozenset[str] = frozenset(),
+) -> dict[str, str]:
+    columns = {}
+    for name, edm in properties:
+        if edm in complex_types and edm not in seen:
+            columns.update(
+                _flatten(
+                    complex_types[edm],
+                    complex_types,
+                    prefix=f"{prefix}{name}{SEPARATOR}",
+                    seen=seen | {edm},
+                )
+            )
+        else:
+            columns[f"{prefix}{name}"] = edm
+    return columns
+
+
+def parse_metadata(content: bytes | str) -> ODataSchema:
+    """
+    Parse an OData service metadata document (EDMX).
+
+    :param content: The XML document, e.g. from `.svc/$metadata`.
+    """
+    try:
+        # The document is from the Central server.
+        root = ElementTree.fromstring(content)  # noqa: S314
+    except ElementTree.ParseError as err:
+        raise PyODKError(f"Invalid OData metadata document: {err}") from err
+    # The Property (not NavigationProperty) names and types, of each type, by full name.
+    complex_types, entity_types, entity_sets = {}, {}, {}
+    for schema in root.iter(f"{EDM}Schema"):
+        namespace = schema.get("Namespace")
+        for kind, types in (
+            ("ComplexType", complex_types),
+            ("EntityType", entity_types),
+        ):
+            for element in schema.iter(f"{EDM}{kind}"):
+                types[f"{namespace}.{element.get('Name')}"] = [
+                    (p.get("Name"), p.get("Type"))
+                    for p in element.iterfind(f"{EDM}Property")
+                ]
+        for entity_set in schema.iter(f"{EDM}EntitySet"):
+            entity_sets[entity_set.get("Name")] = entity_set.get("EntityType")
+    return ODataSchema(
+        tables={
+            table: _flatten(entity_types.get(entity_type, []), complex_types)
+            for table, entity_type in entity_sets.items()
+        }
+    )
+
+
+class SchemaCache:
+    """
+    Keep parsed schemas, by a key which changes when the schema does, e.g. a form's
+    version and hash.
+
+    :param max_entries: The number of schemas to keep. The least recently used schema
+      is dropped to make room for a new one.
+    """
+
+    __slots__ = ("_schemas", "max_entries")
+
+    def __init__(self, max_entries: int = 32):
+        self.max_entries: int = max_entries
+        self._schemas: OrderedDict[Hashable, ODataSchema] = OrderedDict()
+
+    def get(self, key: Hashable, load: Callable[[], ODataSchema]) -> ODataSchema:
+        """
+        Get the schema for the key, or load it if it isn't cached.
+
+        :param key: Identifies the schema, e.g. (project ID, form ID, version, hash).
+        :param load: Gets the schema, e.g. requests and parses `$metadata`.
+        """
+        schema = self._schemas.get(key)
+        if schema is not None:
+            self._schemas.move_to_end(key)
+            return schema
+        schema = load()
+        self._schemas[key] = schema
+        while len(self._schemas) > self.max_entries:
+            self._schemas.popitem(last=False)
+        return schema
+
+    def clear(self) -> None:
+        self._schemas.clear()
+
+    def __len__(self) -> int:
+        return len(self._schemas)
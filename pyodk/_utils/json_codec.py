@@ -0,0 +1,162 @@
+"""
+Encode and decode JSON request and response bodies, with a fast library if installed.
+
+orjson and msgspec are several times faster than the standard library `json` module,
+which matters for large bodies, e.g. `EntityService.create_many` or a large `list`.
+They encode NaN and Infinity as null, where the standard library (and `requests`)
+raise an error. A null could clear a value in Central (e.g. a NaN from pandas in
+`EntityService.merge` data), so if a body has a null, its floats are checked, and the
+usual error is raised for NaN and Infinity. Values which they can't encode, but the
+standard library can (e.g. `numpy.float64`, or integers larger than 64 bits), are
+encoded with the standard library. They also encode datetimes as ISO 8601 text rather
+than raising an error.
+"""
+
+import importlib
+import importlib.util
+import json
+import math
+from collections.abc import Callable
+from functools import cache
+from typing import Any
+
+from pyodk.errors import PyODKError
+
+# The preferred order, for "auto".
+CODECS = ("orjson", "msgspec", "json")
+
+
+class JSONCodec:
+    """
+    Encode to and decode from JSON bytes.
+
+    :param name: The codec name, e.g. "orjson".
+    :param dumps: Encode an object to JSON bytes.
+    :param loads: Decode JSON bytes or text to an object.
+    """
+
+    __slots__ = ("dumps", "loads", "name")
+
+    def __init__(
+        self,
+        name: str,
+        dumps: Callable[[Any], bytes],
+        loads: Callable[[bytes | str], Any],
+    ):
+        self.name: str = name
+        self.dumps: Callable[[Any], bytes] = dumps
+        self.loads: Callable[[bytes | str], Any] = loads
+
+    def __repr__(self) -> str:
+        return f"JSONCodec({self.name!r})"
+
+
+def _stdlib_dumps(obj: Any) -> bytes:
+    # The same as requests, for `json=` bodies.
+    return json.dumps(obj, allow_nan=False).encode("utf-8")
+
+
+def _stdlib() -> JSONCodec:
+    return JSONCodec(name="json", dumps=_stdlib_dumps, loads=json.loads)
+
+
+def _check_finite(obj: Any) -> None:
+    if isinstance(obj, float):
+        if not math.isfinite(obj):
+            # The same error as the standard library.
+            raise ValueError("Out of range float values are not JSON compliant")
+    elif isinstance(obj, dict):
+        for value in obj.values():
+            _check_finite(value)
+    elif isinstance(obj, list | tuple):
+        for value in obj:
+            _check_finite(value)
+
+
+def _compatible(
+    dumps: Callable[[Any], bytes], errors: tuple[type[Exception], ...]
+) -> Callable[[Any], bytes]:
+    """
+    Encode what the standard library can, and raise a ValueError for NaN and Infinity.
+
+    :param dumps: The fast encoder.
+    :param errors: The errors it raises for values it can't encode.
+    """
+
+    def compatible_dumps(obj: Any) -> bytes:
+        try:
+            encoded = dumps(obj)
+        except errors:
+            # E.g. numpy.float64, or integers larger than 64 bits.
+            return _stdlib_dumps(obj)
+        if b"null" in encoded:
+            # Maybe a NaN or Infinity, which are encoded as null.
+            _check_finite(obj)
+        return encoded
+
+    return compatible_dumps
+
+
+def _orjson() -> JSONCodec:
+    orjson = importlib.import_module("orjson")
+    option = orjson.OPT_NON_STR_KEYS
+
+    def dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=option)
+
+    def loads(data: bytes | str) -> Any:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # E.g. integers larger than 64 bits, which the standard library allows.
+            return json.loads(data)
+
+    # orjson.JSONEncodeError is a TypeError.
+    return JSONCodec(name="orjson", dumps=_compatible(dumps, (TypeError,)), loads=loads)
+
+
+def _msgspec() -> JSONCodec:
+    msgspec = importlib.import_module("msgspec")
+    encoder, decoder = msgspec.json.Encoder(), msgspec.json.Decoder()
+
+    def loads(data: bytes | str) -> Any:
+        try:
+            return decoder.decode(data)
+        except msgspec.DecodeError:
+            return json.loads(data)
+
+    return JSONCodec(
+        name="msgspec",
+        dumps=_compatible(encoder.encode, (TypeError, OverflowError)),
+        loads=loads,
+    )
+
+
+_FACTORIES = {"orjson": _orjson, "msgspec": _msgspec, "json": _stdlib}
+
+
+@cache
+def get_codec(name: str = "auto") -> JSONCodec:
+    """
+    Get a JSON codec by name.
+
+    :param name: "orjson", "msgspec", or "json" (the standard library). Or "auto" to
+      use the first of these which is installed.
+    """
+    if name == "auto":
+        name = next(
+            c for c in CODECS if c == "json" or importlib.util.find_spec(c) is not None
+        )
+    if name not in _FACTORIES:
+        raise PyODKError(
+            f"Unknown JSON codec: {name!r}. Must be one of: {('auto', *CODECS)}."
+        )
+    try:
+        return _FACTORIES[name]()
+    except ImportError as err:
+        raise PyODKError(
+            f"The JSON codec {name!r} is not installed (pip install {name})."
+        ) from err
+
+
+STDLIB = get_codec("json")
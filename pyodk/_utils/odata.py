@@ -0,0 +1,190 @@
+import codecs
+import json
+import re
+from collections.abc import Iterable, Iterator
+from logging import Logger
+from typing import TYPE_CHECKING, Any
+
+from pyodk._utils.session import TemplatedURL
+from pyodk.errors import PyODKError
+
+if TYPE_CHECKING:
+    from pyodk._utils.session import Session
+
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+class ODataStream:
+    """
+    Decode an OData JSON document incrementally, yielding each row of the "value" array.
+
+    Rows are produced as soon as their bytes have arrived, so neither the raw response
+    body nor the full list of rows needs to be held in memory. The other top-level
+    members of the document (e.g. "@odata.context", "@odata.count", "@odata.nextLink")
+    are collected into `metadata` as they are parsed, so `metadata` is only complete
+    once iteration has finished.
+
+    Each row is decoded by the standard library JSON scanner. If a row is split across
+    chunks, decoding is retried once the buffered text has doubled, so a large row
+    arriving in many small chunks is decoded in linear rather than quadratic time.
+
+    :param chunks: The response body, e.g. from `Response.iter_content()`.
+    """
+
+    __slots__ = ("_buffer", "_chunks", "_decoder", "_eof", "_pos", "_text", "metadata")
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks: Iterator[bytes] = iter(chunks)
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._decoder: json.JSONDecoder = json.JSONDecoder()
+        self._buffer: str = ""
+        self._pos: int = 0
+        self._eof: bool = False
+        self.metadata: dict[str, Any] = {}
+
+    def _fill(self, size: int = 1) -> bool:
+        """
+        Append at least `size` characters of text to the buffer, or up to the end of the
+        body; False if there is no more.
+        """
+        if self._eof:
+            return False
+        # Drop the consumed part of the buffer so it doesn't grow with the document.
+        parts = [self._buffer[self._pos :]]
+        self._pos = 0
+        added = 0
+        for chunk in self._chunks:
+            if text := self._text.decode(chunk):
+                parts.append(text)
+                added += len(text)
+                if added >= size:
+                    break
+        else:
+            parts.append(self._text.decode(b"", final=True))
+            self._eof = True
+        # Joined once, rather than copying the buffer for each chunk.
+        self._buffer = "".join(parts)
+        return added > 0
+
+    def _peek(self) -> str | None:
+        """Skip whitespace and return the next character, or None at the end."""
+        while True:
+            self._pos = _WHITESPACE.match(self._buffer, self._pos).end()
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                return None
+
+    def _expect(self, *tokens: str) -> str:
+        char = self._peek()
+        if char not in tokens:
+            raise PyODKError(
+                f"Unexpected OData JSON content: expected one of {tokens!r}, "
+                f"found {char!r}."
+            )
+        self._pos += 1
+        return char
+
+    def _value(self) -> Any:
+        """Decode the next complete JSON value."""
+        while True:
+            # Skip the whitespace check when the value starts right away (compact JSON).
+            if (
+                self._pos >= len(self._buffer) or self._buffer[self._pos] in " \t\n\r"
+            ) and self._peek() is None:
+                raise PyODKError("Unexpected end of OData JSON content.")
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError as err:
+                if self._fill(size=len(self._buffer) - self._pos):
+                    continue
+                raise PyODKError(f"Invalid OData JSON content: {err}") from err
+            # A number at the end of the buffer may continue in the next chunk.
+            if (
+                end == len(self._buffer)
+                and isinstance(value, int | float)
+                and self._fill()
+            ):
+                continue
+            self._pos = end
+            return value
+
+    def _array(self) -> Iterator[Any]:
+        self._expect("[")
+        if self._peek() == "]":
+            self._pos += 1
+            return
+        while True:
+            yield self._value()
+            # Fast path for compact JSON, where the comma follows the value directly.
+            if self._buffer.startswith(",", self._pos):
+                self._pos += 1
+                continue
+            if self._expect(",", "]") == "]":
+                return
+
+    def __iter__(self) -> Iterator[dict]:
+        self._expect("{")
+        if self._peek() == "}":
+            self._pos += 1
+            return
+        while True:
+            key = self._value()
+            self._expect(":")
+            if key == "value":
+                yield from self._array()
+            else:
+                self.metadata[key] = self._value()
+            if self._expect(",", "}") == "}":
+                return
+
+
+def iter_table_rows(
+    session: "Session",
+    url: str,
+    params: dict,
+    page_size: int,
+    offset: int,
+    logger: Logger,
+) -> Iterator[dict]:
+    """
+    Stream the rows of an OData table, requesting one page at a time.
+
+    The next page is found by following the `@odata.nextLink` in the response, or (for
+    servers that don't provide one) by incrementing `$skip` after a full page. After a
+    nextLink has been followed, the first page without one is the last.
+
+    :param session: The session to send the requests with.
+    :param url: The URL of the OData table.
+    :param params: Query parameters for the first request, which should include `$top`.
+    :param page_size: The `$top` value, used to detect a full page.
+    :param offset: The `$skip` value for the first request.
+    :param logger: The logger to use for request errors.
+    """
+    # Once Central has sent a nextLink, the links do the paging, so a page without one
+    # is the last, even if it's full. Adding $skip to a link would read rows again.
+    followed = False
+    while True:
+        response = session.response_or_error(
+            method="GET",
+            url=url,
+            logger=logger,
+            params={**params, "$skip": offset} if offset > 0 else params,
+            stream=True,
+        )
+        with response:
+            document = ODataStream(response.iter_content(chunk_size=session.blocksize))
+            rows = 0
+            for row in document:
+                rows += 1
+                yield row
+        if (next_link := document.metadata.get("@odata.nextLink")) is not None:
+            # The link includes all query parameters, including a paging token.
+            if (template := getattr(url, "template", None)) is not None:
+                next_link = TemplatedURL(next_link, template=template)
+            url, params, offset, followed = next_link, {}, 0, True
+        elif not followed and rows == page_size:
+            offset += page_size
+        else:
+            return
@@ -1,7 +1,15 @@
+import functools
+import gzip
+import queue
+import threading
+import time
+import zlib
+from collections.abc import Iterable
+from dataclasses import dataclass, replace
 from logging import Logger
 from string import Formatter
 from typing import Any
-from urllib.parse import quote, urljoin
+from urllib.parse import quote, urljoin, urlsplit
 from uuid import uuid4
 
 from requests import PreparedRequest, Response
@@ -9,10 +17,15 @@ from requests import Session as RequestsSession
 from requests.adapters import HTTPAdapter, Retry
 from requests.auth import AuthBase
 from requests.exceptions import HTTPError
+from requests.utils import rewind_body
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
 
 from pyodk.__version__ import __version__
 from pyodk._endpoints.auth import AuthService
+from pyodk._utils.json_codec import STDLIB, JSONCodec, get_codec
 from pyodk.errors import PyODKError
+from pyodk.instrumentation import Instrument, RequestEvent, emit
+from pyodk.response_cache import ResponseCache
 
 
 class URLFormatter(Formatter):
@@ -35,10 +48,167 @@ class URLFormatter(Formatter):
     """
 
     def format_field(self, value: Any, format_spec: str) -> Any:
-        return format(quote(str(value), safe="*'()"), format_spec)
+        return format(_quote(value), format_spec)
 
 
 _URL_FORMATTER = URLFormatter()
+COMPRESSION_ENCODINGS = ("gzip", "deflate", None)
+_DOT_SEGMENTS = frozenset((".", ".."))
+
+
+@functools.lru_cache(maxsize=4096, typed=True)
+def _quote_cached(value: Any) -> str:
+    return quote(str(value), safe="*'()")
+
+
+def _quote(value: Any) -> str:
+    """Quote a URL field value. Repeated values (project IDs, form IDs) are cached."""
+    try:
+        return _quote_cached(value)
+    except TypeError:  # Not hashable.
+        return quote(str(value), safe="*'()")
+
+
+class TemplatedURL(str):
+    """
+    A URL which remembers the template it was formatted from, e.g. for metrics.
+
+    If `joinable` is True, the URL is a relative path that can be appended to the base
+    URL as is, rather than resolved with `urllib.parse.urljoin`.
+    """
+
+    def __new__(cls, url: str, template: str, joinable: bool = False) -> "TemplatedURL":
+        obj = super().__new__(cls, url)
+        obj.template = template
+        obj.joinable = joinable
+        return obj
+
+
+class URLTemplate:
+    """
+    A URL template, parsed once so that formatting it is a join of the literal text
+    and the quoted field values.
+
+    Templates with anything other than named fields (e.g. positional fields, format
+    specs, or conversions) are formatted with `URLFormatter` instead.
+    """
+
+    __slots__ = ("head", "joinable", "parts", "template")
+
+    def __init__(self, template: str):
+        self.template: str = template
+        literals, fields = [], []
+        for literal, field, spec, conversion in _URL_FORMATTER.parse(template):
+            literals.append(literal)
+            if field is not None:
+                fields.append(field)
+                if not field.isidentifier() or spec or conversion:
+                    self.parts = None
+                    break
+        else:
+            literals.append("")
+            # Each field, and the literal text that follows it.
+            self.parts: list[tuple[str, str]] | None = list(
+                zip(fields, literals[1:], strict=False)
+            )
+        self.head: str = literals[0]
+        # Only a plain relative path can skip urljoin. Dot segments, a scheme, or
+        # a leading slash would be resolved by urljoin.
+        self.joinable: bool = (
+            self.parts is not None
+            and not template.startswith(("/", "."))
+            and not any(c in template for c in (":", "#", "./", "//"))
+        )
+
+    def format(self, *args, **kwargs) -> TemplatedURL:
+        if self.parts is None or args:
+            url = _URL_FORMATTER.format(self.template, *args, **kwargs)
+            return TemplatedURL(url, template=self.template)
+        url = [self.head]
+        try:
+            for field, literal in self.parts:
+                url.append(_quote_cached(kwargs[field]))
+                url.append(literal)
+        except TypeError:  # A value is not hashable.
+            url = _URL_FORMATTER.format(self.template, **kwargs)
+            return TemplatedURL(url, template=self.template)
+        joinable = self.joinable and not _DOT_SEGMENTS.intersection(url)
+        return TemplatedURL("".join(url), template=self.template, joinable=joinable)
+
+
+@functools.lru_cache(maxsize=256)
+def compile_url(template: str) -> URLTemplate:
+    """Get the parsed URL template, parsing it on first use."""
+    return URLTemplate(template)
+
+
+class _CountingLifoQueue(queue.LifoQueue):
+    """A connection pool queue that counts connections discarded when it is full."""
+
+    def __init__(self, maxsize: int = 0):
+        super().__init__(maxsize=maxsize)
+        self.discarded: int = 0
+
+    def put(self, item, block: bool = True, timeout: float | None = None) -> None:
+        try:
+            super().put(item, block=block, timeout=timeout)
+        except queue.Full:
+            self.discarded += 1
+            raise
+
+
+class _CountingPoolMixin:
+    """Count connections opened, including re-connections of dropped connections."""
+
+    QueueCls = _CountingLifoQueue
+    num_connects: int = 0
+
+    def _make_request(self, conn, *args, **kwargs):
+        if conn.sock is None:
+            self.num_connects += 1
+        return super()._make_request(conn, *args, **kwargs)
+
+
+class _HTTPConnectionPool(_CountingPoolMixin, HTTPConnectionPool):
+    pass
+
+
+class _HTTPSConnectionPool(_CountingPoolMixin, HTTPSConnectionPool):
+    pass
+
+
+@dataclass
+class PoolStats:
+    """
+    Connection pool statistics, for the pools currently held by the session.
+
+    :param pools: The number of connection pools (one per scheme/host/port).
+    :param requests: The number of requests sent.
+    :param connections: The number of new connections opened.
+    :param discarded: The number of connections closed after a request because the
+      pool was already full. If this is often non-zero, increase `pool_maxsize`.
+    :param idle: The number of open connections waiting in the pools for re-use.
+    """
+
+    pools: int = 0
+    requests: int = 0
+    connections: int = 0
+    discarded: int = 0
+    idle: int = 0
+
+    @property
+    def reused(self) -> int:
+        """The number of requests sent on an existing connection."""
+        return max(self.requests - self.connections, 0)
+
+    def __add__(self, other: "PoolStats") -> "PoolStats":
+        return PoolStats(
+            pools=self.pools + other.pools,
+            requests=self.requests + other.requests,
+            connections=self.connections + other.connections,
+            discarded=self.discarded + other.discarded,
+            idle=self.idle + other.idle,
+        )
 
 
 class Adapter(HTTPAdapter):
@@ -62,6 +232,24 @@ class Adapter(HTTPAdapter):
         if kwargs.get("blocksize") is None and hasattr(self, "blocksize"):
             kwargs["blocksize"] = self.blocksize
         super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _HTTPConnectionPool,
+            "https": _HTTPSConnectionPool,
+        }
+
+    def pool_stats(self) -> PoolStats:
+        stats = PoolStats()
+        for key in self.poolmanager.pools.keys():
+            pool = self.poolmanager.pools.get(key)
+            if pool is None:
+                continue
+            stats.pools += 1
+            stats.requests += pool.num_requests
+            stats.connections += pool.num_connects
+            if pool.pool is not None:
+                stats.discarded += getattr(pool.pool, "discarded", 0)
+                stats.idle += sum(1 for c in list(pool.pool.queue) if c is not None)
+        return stats
 
     def send(self, request, **kwargs):
         timeout = kwargs.get("timeout")
@@ -76,26 +264,84 @@ class Auth(AuthBase):
         self.username: str = username
         self.password: str = password
         self.service: AuthService = AuthService(session=session, cache_path=cache_path)
-        self._skip_auth_check: bool = False
+        # Only one thread at a time logs in; the others wait and then use its token.
+        self._lock: threading.RLock = threading.RLock()
+        self._local: threading.local = threading.local()
 
-    def login(self) -> str:
+    @property
+    def _skip_auth_check(self) -> bool:
+        """True while the current thread is sending login requests."""
+        return getattr(self._local, "skip_auth_check", False)
+
+    @_skip_auth_check.setter
+    def _skip_auth_check(self, value: bool) -> None:
+        self._local.skip_auth_check = value
+
+    def login(self, refresh: bool = False) -> str:
         """
-        Log in to Central (create new session or verify existing).
+        Log in to Central (create new session or use existing).
 
+        :param refresh: If True, create a new session instead of using the current or
+          cached token, e.g. because Central rejected it.
         :return: Bearer <token>
         """
-        if "Authorization" not in self.session.headers:
-            try:
-                self._skip_auth_check = True  # Avoid loop of death due to the below call.
-                t = self.service.get_token(username=self.username, password=self.password)
-                self.session.headers["Authorization"] = "Bearer " + t
-            finally:
-                self._skip_auth_check = False
-        return self.session.headers["Authorization"]
+        with self._lock:
+            if refresh or "Authorization" not in self.session.headers:
+                try:
+                    self._skip_auth_check = True  # Avoid loop of death due to the below.
+                    if refresh:
+                        t = self.service.refresh_token(
+                            username=self.username, password=self.password
+                        )
+                    else:
+                        t = self.service.get_token(
+                            username=self.username, password=self.password
+                        )
+                    self.session.headers["Authorization"] = "Bearer " + t
+                finally:
+                    self._skip_auth_check = False
+            return self.session.headers["Authorization"]
+
+    def handle_401(self, r: Response, **kwargs) -> Response:
+        """
+        If Central rejected the session token, log in again and re-send the request.
+
+        The cached token is trusted until near its expiry time, and a session can expire
+        or be logged out during a long-running job. When requests are sent from many
+        threads, the first thread to get a 401 logs in, and the others re-send their
+        request with its new token. The request is re-sent once, and only if its body
+        can be sent again.
+        """
+        request = r.request
+        if r.status_code != 401 or getattr(request, "_pyodk_reauth", False):
+            return r
+        if not isinstance(request.body, bytes | str | memoryview | None):
+            if not isinstance(getattr(request, "_body_position", None), int):
+                return r
+            rewind_body(request)
+
+        # Consume content and release the original connection to allow its reuse.
+        _ = r.content
+        r.close()
+        rejected = request.headers.get("Authorization")
+        with self._lock:
+            if self.session.headers.get("Authorization") == rejected:
+                self.login(refresh=True)
+            authorization = self.session.headers["Authorization"]
+        prep = request.copy()
+        prep.headers["Authorization"] = authorization
+        prep._pyodk_reauth = True
+        retry = self.session.send(prep, **kwargs)
+        retry.history.insert(0, r)
+        return retry
 
     def __call__(self, r: PreparedRequest, *args, **kwargs):
-        if "Authorization" not in r.headers and not self._skip_auth_check:
-            r.headers["Authorization"] = self.login()
+        if not self._skip_auth_check:
+            if "Authorization" not in r.headers:
+                r.headers["Authorization"] = self.login()
+            # Requests with other credentials (e.g. verify_token) are left as they are.
+            if r.headers["Authorization"] == self.session.headers.get("Authorization"):
+                r.register_hook("response", self.handle_401)
         return r
 
 
@@ -108,6 +354,17 @@ class Session(RequestsSession):
         password: str,
         cache_path: str,
         chunk_size: int = 16384,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        instruments: Iterable[Instrument] | None = None,
+        response_cache: ResponseCache | None = None,
+        compression: str | None = None,
+        compression_threshold: int = 16384,
+        trust_responses: bool = False,
+        json_codec: str | JSONCodec = "auto",
+        memory_map_uploads: bool = False,
     ) -> None:
         """
         :param base_url: Scheme/domain/port parts of the URL e.g. https://www.example.com
@@ -117,17 +374,76 @@ class Session(RequestsSession):
         :param cache_path: Where to read/write pyodk_cache.toml.
         :param chunk_size: In bytes. For transferring large files (e.g. >1MB), it may be
           noticeably faster to use larger chunks than the default 16384 bytes (16KB).
+        :param pool_connections: The number of hosts to keep a connection pool for.
+        :param pool_maxsize: The number of connections to keep open for re-use, per
+          host. If sending requests from multiple threads, use at least one per thread.
+        :param pool_block: If True, when all `pool_maxsize` connections to a host are in
+          use, wait for one to be free instead of opening (and discarding) another.
+        :param keep_alive: If False, close each connection after one request.
+        :param instruments: Callables to receive a `pyodk.instrumentation.RequestEvent`
+          for each request, e.g. a `MetricsAggregator`. More can be added later to the
+          `instruments` list.
+        :param response_cache: A `pyodk.response_cache.ResponseCache`, to re-use GET
+          responses instead of fetching them again.
+        :param compression: The encoding to compress large request bodies with, for
+          methods which support it (e.g. `EntityService.create_many`): "gzip",
+          "deflate", or None to not compress. Responses are always requested compressed.
+        :param compression_threshold: In bytes. Smaller request bodies are not
+          compressed, because the saving is too small to be worth the time.
+        :param trust_responses: If True, `list` methods (e.g. `SubmissionService.list`)
+          return a `ModelList`, which validates each item when it is first accessed,
+          instead of validating all items up front.
+        :param json_codec: The library to encode `json` request bodies and decode
+          `Response.json()` with: "orjson", "msgspec", "json" (the standard library), or
+          "auto" to use the fastest one installed. See `pyodk._utils.json_codec`.
+        :param memory_map_uploads: If True, send attachment files from a memory map,
+          which uses much less CPU for large files than reading `chunk_size` chunks.
+          See `pyodk._utils.transfer.open_upload`.
         """
         super().__init__()
         self.base_url: str = self.base_url_validate(
             base_url=base_url, api_version=api_version
         )
         self.blocksize: int = chunk_size
-        self.mount("https://", Adapter(timeout=30, blocksize=self.blocksize))
+        adapter = Adapter(
+            timeout=30,
+            blocksize=self.blocksize,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+        self.mount("https://", adapter)
+        self.mount("http://", adapter)
         self.headers.update({"User-Agent": f"pyodk v{__version__}"})
+        if not keep_alive:
+            self.headers["Connection"] = "close"
         self.auth: Auth = Auth(
             session=self, username=username, password=password, cache_path=cache_path
         )
+        self.instruments: list[Instrument] = list(instruments or ())
+        self.response_cache: ResponseCache | None = response_cache
+        if compression not in COMPRESSION_ENCODINGS:
+            raise PyODKError(
+                f"Unknown compression: {compression!r}. "
+                f"Must be one of: {COMPRESSION_ENCODINGS}."
+            )
+        self.compression: str | None = compression
+        self.compression_threshold: int = compression_threshold
+        self.trust_responses: bool = trust_responses
+        if isinstance(json_codec, str):
+            json_codec = get_codec(json_codec)
+        self.json_codec: JSONCodec = json_codec
+        self.memory_map_uploads: bool = memory_map_uploads
+
+    def pool_stats(self) -> PoolStats:
+        """
+        Get connection pool statistics, summed across the mounted adapters.
+        """
+        stats = PoolStats()
+        for adapter in {id(a): a for a in self.adapters.values()}.values():
+            if isinstance(adapter, Adapter):
+                stats += adapter.pool_stats()
+        return stats
 
     @staticmethod
     def base_url_validate(base_url: str, api_version: str):
@@ -139,27 +455,181 @@ class Session(RequestsSession):
         return base_url
 
     def urljoin(self, url: str) -> str:
-        return urljoin(self.base_url, url.lstrip("/"))
+        if getattr(url, "joinable", False):
+            return TemplatedURL(self.base_url + url, template=url.template)
+        joined = urljoin(self.base_url, url.lstrip("/"))
+        if (template := getattr(url, "template", None)) is not None:
+            return TemplatedURL(joined, template=template)
+        return joined
 
     @staticmethod
     def urlformat(url: str, *args, **kwargs) -> str:
-        return _URL_FORMATTER.format(url, *args, **kwargs)
+        return compile_url(url).format(*args, **kwargs)
 
     @staticmethod
     def urlquote(url: str) -> str:
-        return _URL_FORMATTER.format_field(url, format_spec="")
+        return _quote(url)
+
+    def request(self, method, url, *args, compress: bool = False, **kwargs):
+        """
+        :param compress: If True, and the session has a `compression` method, compress
+          the `json` or `data` body if it is at least `compression_threshold` bytes.
+        """
+        if compress and self.compression is not None:
+            kwargs = self.compress_body(**kwargs)
+        elif self.json_codec is not STDLIB:
+            kwargs = self.encode_json(**kwargs)
+        # The URL is joined to the base URL in prepare_request.
+        return super().request(method, url, *args, **kwargs)
+
+    def encode_json(self, **kwargs) -> dict:
+        """
+        Encode the `json` body of the request keyword arguments with the session's
+        `json_codec`, instead of with the standard library in `requests`.
+        """
+        json_data = kwargs.get("json")
+        if json_data is None or kwargs.get("data") is not None:
+            return kwargs
+        headers = dict(kwargs.get("headers") or {})
+        headers.setdefault("Content-Type", "application/json")
+        kwargs.pop("json")
+        return {**kwargs, "data": self.json_codec.dumps(json_data), "headers": headers}
+
+    def decode_json(self, response: Response, **kwargs) -> Any:
+        """
+        Decode the response body with the session's `json_codec`. Used for
+        `Response.json()`.
 
-    def request(self, method, url, *args, **kwargs):
-        return super().request(method, self.urljoin(url), *args, **kwargs)
+        Invalid JSON is decoded by `requests` as usual, so the error is the same as for
+        the standard library.
+        """
+        content = response.content
+        if not kwargs and content:
+            try:
+                return self.json_codec.loads(content)
+            except ValueError:
+                pass
+        return Response.json(response, **kwargs)
+
+    def compress_body(self, **kwargs) -> dict:
+        """
+        Compress the `json` or `data` body of the request keyword arguments, and set the
+        Content-Encoding header. Other types of body (e.g. files) are not changed. A
+        `json` body is encoded with the session's `json_codec`, even if it is too small
+        to compress.
+        """
+        json_data, data = kwargs.get("json"), kwargs.get("data")
+        content_type = None
+        if json_data is not None and data is None:
+            body = self.json_codec.dumps(json_data)
+            content_type = "application/json"
+        elif isinstance(data, str):
+            body = data.encode("utf-8")
+        elif isinstance(data, bytes):
+            body = data
+        else:
+            return kwargs
+        headers = dict(kwargs.get("headers") or {})
+        if content_type is not None:
+            headers.setdefault("Content-Type", content_type)
+        if len(body) >= self.compression_threshold:
+            if self.compression == "gzip":
+                body = gzip.compress(body, compresslevel=6, mtime=0)
+            else:
+                body = zlib.compress(body, level=6)
+            headers["Content-Encoding"] = self.compression
+        elif content_type is None:
+            return kwargs
+        kwargs.pop("json", None)
+        return {**kwargs, "data": body, "headers": headers}
 
     def prepare_request(self, request):
         request.url = self.urljoin(request.url)
-        return super().prepare_request(request)
+        prep = super().prepare_request(request)
+        prep.url_template = getattr(request.url, "template", None)
+        return prep
+
+    def url_template(self, request: PreparedRequest) -> str:
+        """
+        Get the template of the request URL, or its path relative to the base URL.
+        """
+        template = getattr(request, "url_template", None)
+        if template is not None:
+            return template
+        path = urlsplit(request.url).path
+        base_path = urlsplit(self.base_url).path
+        return path[len(base_path) :] if path.startswith(base_path) else path
+
+    def send(self, request, **kwargs):
+        if self.response_cache is None:
+            response = self._send(request, **kwargs)
+        else:
+            response = self.response_cache.send(
+                request,
+                send=functools.partial(self._send, **kwargs),
+                stream=bool(kwargs.get("stream")),
+            )
+        if self.json_codec is not STDLIB:
+            response.json = functools.partial(self.decode_json, response)
+        return response
+
+    def _send(self, request, **kwargs):
+        # A request re-sent after logging in again is part of the original's event.
+        if not self.instruments or getattr(request, "_pyodk_reauth", False):
+            return super().send(request, **kwargs)
+
+        start = time.perf_counter()
+        event = RequestEvent(
+            method=request.method,
+            url=request.url,
+            template=self.url_template(request),
+            request_bytes=RequestEvent.get_request_bytes(request),
+        )
+        try:
+            response = super().send(request, **kwargs)
+        except Exception as err:
+            event = replace(event, duration=time.perf_counter() - start, error=err)
+            emit(self.instruments, event)
+            raise
+
+        def finish():
+            emit(
+                self.instruments,
+                replace(
+                    event,
+                    status=response.status_code,
+                    response_bytes=RequestEvent.get_response_bytes(response),
+                    retries=RequestEvent.get_retries(response),
+                    ttfb=response.elapsed.total_seconds(),
+                    duration=time.perf_counter() - start,
+                ),
+            )
+
+        if kwargs.get("stream"):
+            # The body hasn't been read yet, so wait until the response is closed.
+            close = response.close
+
+            def close_and_finish():
+                close()
+                if response.close is close_and_finish:
+                    response.close = close
+                    finish()
+
+            response.close = close_and_finish
+        else:
+            finish()
+        return response
 
     def response_or_error(
         self, method: str, url: str, logger: Logger, *args, **kwargs
     ) -> Response:
         response = self.request(*args, method=method, url=url, **kwargs)
+        return self.check_response(response=response, url=url, logger=logger)
+
+    def check_response(self, response: Response, url: str, logger: Logger) -> Response:
+        """
+        Raise a PyODKError if the response has an error status, otherwise return it.
+        """
         try:
             response.raise_for_status()
         except HTTPError as e:
@@ -0,0 +1,337 @@
+"""
+Transfer large files: download response bodies (e.g. submission exports) straight to a
+file, and open files to upload as request bodies.
+
+The body is written to "<path>.part" in `Session.blocksize` chunks, and moved to `path`
+once complete, so a partial file is never mistaken for a complete one. If the
+connection drops, the download resumes from the end of the partial file with an HTTP
+Range request. A partial file left by an earlier call (e.g. after the process was
+stopped) is resumed in the same way.
+
+If the server doesn't support ranges (it replies with the whole body), or the body has
+changed since the download started, the download starts again from the beginning.
+
+A conditional request (e.g. with `If-None-Match`) which the server answers with "304 Not
+Modified" leaves the existing file as it is.
+
+Uploads are sent from the open file, so they can be rewound and sent again if the request
+is retried. With `memory_map`, the file is sent from a memory map instead of being read
+into a new bytes object for each chunk, which uses much less CPU for large files.
+"""
+
+import hashlib
+import mmap
+import os
+import re
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager, suppress
+from dataclasses import dataclass
+from logging import Logger
+from os import PathLike
+from pathlib import Path
+from typing import Any, BinaryIO
+
+from requests import Response
+from requests import exceptions as requests_errors
+
+from pyodk._utils.session import Session
+from pyodk.errors import PyODKError
+
+PART_SUFFIX = ".part"
+# In seconds. The least time between progress reports, except the last one.
+PROGRESS_INTERVAL = 0.5
+# Errors after which the download can resume, e.g. a dropped connection.
+RESUMABLE_ERRORS = (
+    requests_errors.ConnectionError,
+    requests_errors.ChunkedEncodingError,
+    requests_errors.Timeout,
+)
+_CONTENT_RANGE = re.compile(r"bytes (\d+)-\d+/(\d+|\*)")
+
+
+@dataclass(frozen=True, slots=True)
+class TransferProgress:
+    """
+    The progress of a download, passed to the `progress` callback.
+
+    :param path: The file being downloaded to.
+    :param transferred: The number of bytes of the file downloaded so far.
+    :param total: The size of the file in bytes, if the server sent it.
+    :param received: The number of bytes received in this call, which excludes any
+      partial file resumed from an earlier call.
+    :param elapsed: Seconds since the download started.
+    :param resumes: The number of times the download resumed after an error.
+    :param done: True if the download is complete.
+    """
+
+    path: Path
+    transferred: int
+    total: int | None
+    received: int
+    elapsed: float
+    resumes: int = 0
+    done: bool = False
+
+    @property
+    def bytes_per_second(self) -> float:
+        """The average download speed in this call."""
+        return self.received / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def fraction(self) -> float | None:
+        """The fraction of the file downloaded, if the total size is known."""
+        if not self.total:
+            return None
+        return self.transferred / self.total
+
+
+class Download:
+    """
+    Download a response body to a file, resuming after errors. See `download`.
+    """
+
+    __slots__ = (
+        "_reported",
+        "_started",
+        "_validator",
+        "headers",
+        "logger",
+        "max_resumes",
+        "not_modified",
+        "params",
+        "part",
+        "path",
+        "progress",
+        "received",
+        "resumes",
+        "session",
+        "total",
+        "url",
+    )
+
+    def __init__(
+        self,
+        session: Session,
+        url: str,
+        path: PathLike | str,
+        logger: Logger,
+        params: dict | None = None,
+        headers: dict | None = None,
+        max_resumes: int = 3,
+        progress: Callable[[TransferProgress], Any] | None = None,
+    ):
+        self.session: Session = session
+        self.url: str = url
+        self.path: Path = Path(path)
+        self.part: Path = self.path.with_name(f"{self.path.name}{PART_SUFFIX}")
+        self.logger: Logger = logger
+        self.params: dict | None = params
+        self.headers: dict | None = headers
+        self.max_resumes: int = max_resumes
+        self.progress: Callable[[TransferProgress], Any] | None = progress
+        self.total: int | None = None
+        self.received: int = 0
+        self.resumes: int = 0
+        # True if the server replied "304 Not Modified", so the file was kept.
+        self.not_modified: bool = False
+        self._started: float = 0.0
+        self._reported: float = 0.0
+        # An ETag or Last-Modified date, to only resume if the body hasn't changed.
+        self._validator: str | None = None
+
+    def _open(self, offset: int) -> Response:
+        # Ranges are of the encoded body, so ask for it unencoded, as it is written.
+        headers = {**(self.headers or {}), "Accept-Encoding": "identity"}
+        if offset:
+            headers["Range"] = f"bytes={offset}-"
+            if self._validator is not None:
+                headers["If-Range"] = self._validator
+        response = self.session.request(
+            method="GET", url=self.url, params=self.params, headers=headers, stream=True
+        )
+        if offset and response.status_code == 416:
+            # The partial file is longer than the body, so it must have changed.
+            response.close()
+            return self._open(offset=0)
+        return self.session.check_response(
+            response=response, url=self.url, logger=self.logger
+        )
+
+    def _start(self, response: Response, offset: int) -> int:
+        """Read the response headers; return the offset the body starts at."""
+        if response.status_code == 206:
+            match = _CONTENT_RANGE.fullmatch(response.headers.get("Content-Range", ""))
+            if match is None or int(match.group(1)) != offset:
+                raise PyODKError(
+                    f"The download from {self.session.urljoin(self.url)} returned an "
+                    f"unexpected range: {response.headers.get('Content-Range')!r}."
+                )
+            total = match.group(2)
+            self.total = None if total == "*" else int(total)
+            return offset
+        # The whole body.
+        length = response.headers.get("Content-Length", "")
+        self.total = int(length) if length.isdigit() else None
+        etag = response.headers.get("ETag")
+        if etag is not None and not etag.startswith("W/"):
+            self._validator = etag
+        else:
+            self._validator = response.headers.get("Last-Modified")
+        return 0
+
+    def _report(self, transferred: int, done: bool = False) -> None:
+        if self.progress is None:
+            return
+        now = time.perf_counter()
+        if not done and now - self._reported < PROGRESS_INTERVAL:
+            return
+        self._reported = now
+        self.progress(
+            TransferProgress(
+                path=self.path,
+                transferred=transferred,
+                total=self.total,
+                received=self.received,
+                elapsed=now - self._started,
+                resumes=self.resumes,
+                done=done,
+            )
+        )
+
+    def _write(self, response: Response, offset: int) -> int:
+        """Write the body to the partial file; return the size of the file."""
+        size = offset
+        with self.part.open("ab" if offset else "wb") as f:
+            for chunk in response.iter_content(chunk_size=self.session.blocksize):
+                f.write(chunk)
+                size += len(chunk)
+                self.received += len(chunk)
+                self._report(transferred=size)
+        return size
+
+    def _attempt(self) -> Exception | None:
+        """Download the rest of the body; return the error if it can be resumed."""
+        offset = self.part.stat().st_size if self.part.exists() else 0
+        try:
+            response = self._open(offset=offset)
+            if response.status_code == 304:
+                response.close()
+                self.not_modified = True
+                self.part.unlink(missing_ok=True)
+                return None
+            with response:
+                size = self._write(response, offset=self._start(response, offset))
+        except RESUMABLE_ERRORS as err:
+            return err
+        if self.total is not None and size != self.total:
+            return PyODKError(f"Received {size} of {self.total} bytes.")
+        return None
+
+    def run(self) -> Path:
+        """
+        Download the body to the file.
+
+        :return: The path of the downloaded file.
+        """
+        self._started = time.perf_counter()
+        while (error := self._attempt()) is not None:
+            if self.resumes >= self.max_resumes:
+                err = PyODKError(
+                    f"The download from {self.session.urljoin(self.url)} failed after "
+                    f"{self.resumes} resumes: {error}. Download it again to resume from "
+                    f"the partial file: {self.part}"
+                )
+                self.logger.error(err)
+                raise err from error
+            self.resumes += 1
+            self.logger.warning("Resuming the download to %s: %s", self.path, error)
+        if not self.not_modified:
+            self.part.replace(self.path)
+        self._report(transferred=self.path.stat().st_size, done=True)
+        return self.path
+
+
+def download(
+    session: Session,
+    url: str,
+    path: PathLike | str,
+    logger: Logger,
+    params: dict | None = None,
+    headers: dict | None = None,
+    max_resumes: int = 3,
+    progress: Callable[[TransferProgress], Any] | None = None,
+) -> Path:
+    """
+    Download a response body to a file, resuming after a dropped connection.
+
+    :param session: The session to send the requests with.
+    :param url: The URL to download, relative to the session base URL.
+    :param path: Where to write the file. Any existing file is replaced once the
+      download is complete.
+    :param logger: The logger to report errors to.
+    :param params: The query parameters of the request.
+    :param headers: Extra headers for the request, e.g. `If-None-Match`.
+    :param max_resumes: The number of times to resume after an error (e.g. a dropped
+      connection), before raising an error. The partial file is kept, so the next
+      call to download the same path resumes from it.
+    :param progress: A function to call with a `TransferProgress` as the file is
+      written, at most every 0.5 seconds, and once complete.
+    :return: The path of the downloaded file.
+    """
+    return Download(
+        session=session,
+        url=url,
+        path=path,
+        logger=logger,
+        params=params,
+        headers=headers,
+        max_resumes=max_resumes,
+        progress=progress,
+    ).run()
+
+
+def file_md5(path: PathLike | str, blocksize: int = 1048576) -> str:
+    """
+    Get the MD5 hash of a file, as hex, e.g. to compare with a Central attachment ETag.
+
+    :param path: The file to read.
+    :param blocksize: In bytes, how much of the file to read at a time.
+    """
+    md5 = hashlib.md5()  # noqa: S324  For comparison with Central, not for security.
+    with open(path, "rb") as f:
+        while chunk := f.read(blocksize):
+            md5.update(chunk)
+    return md5.hexdigest()
+
+
+@contextmanager
+def open_upload(
+    path: PathLike | str, memory_map: bool = False
+) -> Iterator[BinaryIO | memoryview]:
+    """
+    Open a file to send as a request body, with its size as the Content-Length.
+
+    A file object is read in chunks of the connection blocksize (`Session.blocksize`),
+    and rewound if the request is retried. A memoryview of a memory map is sent
+    without being copied into Python objects, and can be sent again as it is. Neither
+    reads the whole file into memory.
+
+    :param path: The file to upload.
+    :param memory_map: If True, yield a memoryview of the memory mapped file, unless
+      the file is empty (which can't be mapped). Otherwise, yield the file object.
+    """
+    with open(path, "rb") as f:
+        if not memory_map or os.fstat(f.fileno()).st_size == 0:
+            yield f
+            return
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(mapped)
+        try:
+            yield view
+        finally:
+            # A slice of the view may still be referenced, e.g. by the traceback of a
+            # failed send, in which case the map is closed once that is collected.
+            with suppress(BufferError):
+                view.release()
+                mapped.close()
@@ -1,4 +1,5 @@
-from collections.abc import Callable
+from collections import Counter
+from collections.abc import Callable, Iterable
 from os import PathLike
 from pathlib import Path
 from typing import Any
@@ -111,3 +112,16 @@ def validate_is_instance(*args: Any, typ: Any, key: str):
     if not isinstance(val, typ):
         raise PyODKError(f"{key}: Unexpected type. Expected '{typ}'.")
     return val
+
+
+def validate_unique_file_names(
+    paths: Iterable[PathLike | str], key: str = "attachments"
+) -> list[PathLike | str]:
+    paths = list(paths)
+    names = Counter(Path(p).name for p in paths)
+    if duplicates := sorted(name for name, count in names.items() if count > 1):
+        raise PyODKError(
+            f"{key}: File names must be unique, but these were provided more than "
+            f"once: {', '.join(duplicates)}."
+        )
+    return paths
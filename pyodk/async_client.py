@@ -0,0 +1,238 @@
+import asyncio
+import functools
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+from itertools import islice
+from typing import TYPE_CHECKING, Any
+
+from pyodk._utils.session import Session
+from pyodk.client import Client
+from pyodk.instrumentation import Instrument
+
+if TYPE_CHECKING:
+    from pyodk._endpoints.bases import Service
+    from pyodk._utils.json_codec import JSONCodec
+    from pyodk.response_cache import ResponseCache
+
+
+class AsyncRows:
+    """
+    Asynchronous iterator over the rows from a (blocking) row iterator, such as
+    `iter_table`. Rows are read in batches on the client's thread pool.
+    """
+
+    __slots__ = ("_batch_size", "_buffer", "_client", "_rows")
+
+    def __init__(self, client: "AsyncClient", rows: Iterator, batch_size: int = 100):
+        self._client: AsyncClient = client
+        self._rows: Iterator = rows
+        self._batch_size: int = batch_size
+        self._buffer: Iterator = iter(())
+
+    def __aiter__(self) -> AsyncIterator:
+        return self
+
+    async def __anext__(self) -> Any:
+        for row in self._buffer:
+            return row
+        batch = await self._client.run(list, islice(self._rows, self._batch_size))
+        if not batch:
+            raise StopAsyncIteration
+        self._buffer = iter(batch)
+        return next(self._buffer)
+
+
+class AsyncService:
+    """
+    Asynchronous view of a service, e.g. `AsyncClient.forms` for `Client.forms`.
+
+    Each public method of the service is available as a coroutine function with the same
+    signature. Attributes (e.g. `default_form_id`) are read from and written to the
+    wrapped service. Methods which return an iterator of rows (e.g. `iter_table`) return
+    an `AsyncRows`, for use with `async for`.
+    """
+
+    __slots__ = ("_client", "_service")
+
+    def __init__(self, client: "AsyncClient", service: "Service"):
+        object.__setattr__(self, "_client", client)
+        object.__setattr__(self, "_service", service)
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._service, name)
+        if name.startswith("_") or not callable(attr):
+            return attr
+
+        @functools.wraps(attr)
+        async def method(*args, **kwargs):
+            result = await self._client.run(attr, *args, **kwargs)
+            if isinstance(result, Iterator):
+                return AsyncRows(client=self._client, rows=result)
+            return result
+
+        return method
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self._service, name, value)
+
+
+class AsyncClient:
+    """
+    An asyncio interface to a specific ODK Central server, with the same services as the
+    `Client` (projects, forms, submissions, entities, entity_lists).
+
+    The services are the `Client` services, so URLs, validation and data models are the
+    same. Each call is run on a thread pool of `max_concurrency` workers, which share
+    one HTTP session and its connection pool. This bounds the number of requests in
+    flight, so it is safe to start many calls at once, for example:
+
+    ```python
+    import asyncio
+    from pyodk import AsyncClient
+
+    async def main():
+        async with AsyncClient() as client:
+            await asyncio.gather(*(
+                client.submissions.review(instance_id=i, review_state="approved")
+                for i in instance_ids
+            ))
+
+    asyncio.run(main())
+    ```
+
+    :param config_path: Where to read the pyodk_config.toml. Defaults to the
+        path in PYODK_CONFIG_FILE, then the user home directory.
+    :param cache_path: Where to read/write pyodk_cache.toml. Defaults to the
+        path in PYODK_CACHE_FILE, then the user home directory.
+    :param project_id: The project ID to use for all client calls. Defaults to the
+        "default_project_id" in pyodk_config.toml, or can be specified per call.
+    :param session: A prepared pyodk.session.Session class instance, or an instance
+        of a customised subclass.
+    :param api_version: The ODK Central API version, which is used in the URL path
+        e.g. 'v1' in 'https://www.example.com/v1/projects'.
+    :param max_concurrency: The maximum number of requests in flight at once. If a
+        session is not provided, this is also the size of the connection pool.
+    :param instruments: Callables to receive a `pyodk.instrumentation.RequestEvent` for
+        each request. Not used if a session is provided.
+    :param response_cache: A `pyodk.response_cache.ResponseCache`, to re-use GET
+        responses instead of fetching them again. Not used if a session is provided.
+    :param compression: The encoding to compress large request bodies with: "gzip",
+        "deflate", or None to not compress. Not used if a session is provided.
+    :param compression_threshold: In bytes. Smaller request bodies are not compressed.
+        Not used if a session is provided.
+    :param trust_responses: If True, `list` methods return a `ModelList`, which
+        validates each item when it is first accessed, instead of validating all items
+        up front. Not used if a session is provided.
+    :param json_codec: The library to encode and decode JSON bodies with: "orjson",
+        "msgspec", "json" (the standard library), or "auto" to use the fastest one
+        installed. Not used if a session is provided.
+    :param memory_map_uploads: If True, send attachment files from a memory map, which
+        uses much less CPU for large files. Not used if a session is provided.
+    """
+
+    def __init__(
+        self,
+        config_path: str | None = None,
+        cache_path: str | None = None,
+        project_id: int | None = None,
+        session: Session | None = None,
+        api_version: str | None = "v1",
+        max_concurrency: int = 10,
+        instruments: Iterable[Instrument] | None = None,
+        response_cache: "ResponseCache | None" = None,
+        compression: str | None = None,
+        compression_threshold: int = 16384,
+        trust_responses: bool = False,
+        json_codec: "str | JSONCodec" = "auto",
+        memory_map_uploads: bool = False,
+    ) -> None:
+        self.client: Client = Client(
+            config_path=config_path,
+            cache_path=cache_path,
+            project_id=project_id,
+            session=session,
+            api_version=api_version,
+            # Keep a connection for each worker, so connections are re-used.
+            pool_maxsize=max_concurrency,
+            instruments=instruments,
+            response_cache=response_cache,
+            compression=compression,
+            compression_threshold=compression_threshold,
+            trust_responses=trust_responses,
+            json_codec=json_codec,
+            memory_map_uploads=memory_map_uploads,
+        )
+        self.max_concurrency: int = max_concurrency
+        self._executor: ThreadPoolExecutor = ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix="pyodk"
+        )
+
+        # Delegate http verbs for ease of use.
+        self.get: Callable = self._wrap(self.session.get)
+        self.post: Callable = self._wrap(self.session.post)
+        self.put: Callable = self._wrap(self.session.put)
+        self.patch: Callable = self._wrap(self.session.patch)
+        self.delete: Callable = self._wrap(self.session.delete)
+
+    # Services are created on first use, like the Client services.
+
+    @cached_property
+    def projects(self) -> AsyncService:
+        return AsyncService(self, self.client.projects)
+
+    @cached_property
+    def forms(self) -> AsyncService:
+        return AsyncService(self, self.client.forms)
+
+    @cached_property
+    def submissions(self) -> AsyncService:
+        return AsyncService(self, self.client.submissions)
+
+    @cached_property
+    def entities(self) -> AsyncService:
+        return AsyncService(self, self.client.entities)
+
+    @cached_property
+    def entity_lists(self) -> AsyncService:
+        return AsyncService(self, self.client.entity_lists)
+
+    @property
+    def session(self) -> Session:
+        return self.client.session
+
+    @property
+    def project_id(self) -> int | None:
+        return self.client.project_id
+
+    def _wrap(self, func: Callable) -> Callable:
+        @functools.wraps(func)
+        async def wrapped(*args, **kwargs):
+            return await self.run(func, *args, **kwargs)
+
+        return wrapped
+
+    async def run(self, func: Callable, *args, **kwargs) -> Any:
+        """Run a blocking function on the client's thread pool, and await the result."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(func, *args, **kwargs)
+        )
+
+    async def open(self) -> "AsyncClient":
+        """Enter the session, and authenticate."""
+        await self.run(self.client.open)
+        return self
+
+    async def close(self, *args):
+        """Close the session, after any requests in progress have finished."""
+        # Wait for the thread pool off the event loop, so other tasks keep running.
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._executor.shutdown, True)
+        await loop.run_in_executor(None, functools.partial(self.client.close, *args))
+
+    async def __aenter__(self) -> "AsyncClient":
+        return await self.open()
+
+    async def __aexit__(self, *args):
+        await self.close(*args)
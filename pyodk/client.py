@@ -1,13 +1,21 @@
-from collections.abc import Callable
-
-from pyodk._endpoints.comments import CommentService
-from pyodk._endpoints.entities import EntityService
-from pyodk._endpoints.entity_lists import EntityListService
-from pyodk._endpoints.forms import FormService
-from pyodk._endpoints.projects import ProjectService
-from pyodk._endpoints.submissions import SubmissionService
+import importlib
+from collections.abc import Callable, Iterable
+from functools import cached_property
+from typing import TYPE_CHECKING
+
 from pyodk._utils import config
 from pyodk._utils.session import Session
+from pyodk.instrumentation import Instrument
+
+if TYPE_CHECKING:
+    from pyodk._endpoints.comments import CommentService
+    from pyodk._endpoints.entities import EntityService
+    from pyodk._endpoints.entity_lists import EntityListService
+    from pyodk._endpoints.forms import FormService
+    from pyodk._endpoints.projects import ProjectService
+    from pyodk._endpoints.submissions import SubmissionService
+    from pyodk._utils.json_codec import JSONCodec
+    from pyodk.response_cache import ResponseCache
 
 
 class Client:
@@ -26,6 +34,32 @@ class Client:
         of a customised subclass.
     :param api_version: The ODK Central API version, which is used in the URL path
         e.g. 'v1' in 'https://www.example.com/v1/projects'.
+    :param pool_connections: The number of hosts to keep a connection pool for.
+        Not used if a session is provided.
+    :param pool_maxsize: The number of connections to keep open for re-use, per host.
+        If using the client from multiple threads, use at least one per thread. Not used
+        if a session is provided.
+    :param pool_block: If True, when all `pool_maxsize` connections are in use, wait
+        for one to be free instead of opening another. Not used if a session is provided.
+    :param keep_alive: If False, close each connection after one request. Not used if a
+        session is provided.
+    :param instruments: Callables to receive a `pyodk.instrumentation.RequestEvent` for
+        each request, e.g. a `pyodk.instrumentation.MetricsAggregator`. Not used if a
+        session is provided.
+    :param response_cache: A `pyodk.response_cache.ResponseCache`, to re-use GET
+        responses instead of fetching them again. Not used if a session is provided.
+    :param compression: The encoding to compress large request bodies with: "gzip",
+        "deflate", or None to not compress. Not used if a session is provided.
+    :param compression_threshold: In bytes. Smaller request bodies are not compressed.
+        Not used if a session is provided.
+    :param trust_responses: If True, `list` methods return a `ModelList`, which
+        validates each item when it is first accessed, instead of validating all items
+        up front. Not used if a session is provided.
+    :param json_codec: The library to encode and decode JSON bodies with: "orjson",
+        "msgspec", "json" (the standard library), or "auto" to use the fastest one
+        installed. Not used if a session is provided.
+    :param memory_map_uploads: If True, send attachment files from a memory map, which
+        uses much less CPU for large files. Not used if a session is provided.
     """
 
     def __init__(
@@ -35,6 +69,17 @@ class Client:
         project_id: int | None = None,
         session: Session | None = None,
         api_version: str | None = "v1",
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        instruments: Iterable[Instrument] | None = None,
+        response_cache: "ResponseCache | None" = None,
+        compression: str | None = None,
+        compression_threshold: int = 16384,
+        trust_responses: bool = False,
+        json_codec: "str | JSONCodec" = "auto",
+        memory_map_uploads: bool = False,
     ) -> None:
         self.config: config.Config = config.read_config(config_path=config_path)
         self._project_id: int | None = project_id
@@ -45,6 +90,17 @@ class Client:
                 username=self.config.central.username,
                 password=self.config.central.password,
                 cache_path=cache_path,
+                pool_connections=pool_connections,
+                pool_maxsize=pool_maxsize,
+                pool_block=pool_block,
+                keep_alive=keep_alive,
+                instruments=instruments,
+                response_cache=response_cache,
+                compression=compression,
+                compression_threshold=compression_threshold,
+                trust_responses=trust_responses,
+                json_codec=json_codec,
+                memory_map_uploads=memory_map_uploads,
             )
         self.session: Session = session
 
@@ -55,26 +111,37 @@ class Client:
         self.patch: Callable = self.session.patch
         self.delete: Callable = self.session.delete
 
-        # Endpoints
-        self.projects: ProjectService = ProjectService(
-            session=self.session,
-            default_project_id=self.project_id,
-        )
-        self.forms: FormService = FormService(
-            session=self.session, default_project_id=self.project_id
-        )
-        self.submissions: SubmissionService = SubmissionService(
-            session=self.session, default_project_id=self.project_id
-        )
-        self._comments: CommentService = CommentService(
-            session=self.session, default_project_id=self.project_id
-        )
-        self.entities: EntityService = EntityService(
-            session=self.session, default_project_id=self.project_id
-        )
-        self.entity_lists: EntityListService = EntityListService(
-            session=self.session, default_project_id=self.project_id
-        )
+    def _make_service(self, module: str, name: str):
+        """
+        Create a service. Services are created on first use, so that the endpoint
+        modules and their data models are only imported if needed.
+        """
+        service = getattr(importlib.import_module(f"pyodk._endpoints.{module}"), name)
+        return service(session=self.session, default_project_id=self.project_id)
+
+    @cached_property
+    def projects(self) -> "ProjectService":
+        return self._make_service("projects", "ProjectService")
+
+    @cached_property
+    def forms(self) -> "FormService":
+        return self._make_service("forms", "FormService")
+
+    @cached_property
+    def submissions(self) -> "SubmissionService":
+        return self._make_service("submissions", "SubmissionService")
+
+    @cached_property
+    def _comments(self) -> "CommentService":
+        return self._make_service("comments", "CommentService")
+
+    @cached_property
+    def entities(self) -> "EntityService":
+        return self._make_service("entities", "EntityService")
+
+    @cached_property
+    def entity_lists(self) -> "EntityListService":
+        return self._make_service("entity_lists", "EntityListService")
 
     @property
     def project_id(self) -> int | None:
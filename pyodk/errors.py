@@ -1,6 +1,3 @@
-from requests import Response
-
-
 class PyODKError(Exception):
     """An error raised by pyodk."""
 
@@ -10,9 +7,33 @@ class PyODKError(Exception):
 
         Per central-backend/lib/util/problem.js.
         """
-        if len(self.args) >= 2 and isinstance(self.args[1], Response):
+        # Not an isinstance check, to avoid importing requests with this module.
+        if len(self.args) >= 2 and hasattr(self.args[1], "json"):
             err_detail = self.args[1].json()
             err_code = str(err_detail.get("code", ""))
             if err_code is not None and err_code == str(code):
                 return True
         return False
+
+
+class AttachmentUploadError(PyODKError):
+    """
+    Some attachments of a new Submission failed to upload. The Submission was created,
+    so the failed attachments can be uploaded again with the `instance_id`.
+    """
+
+    def __init__(self, instance_id: str, uploaded: list, failed: dict):
+        """
+        :param instance_id: The instanceId of the Submission.
+        :param uploaded: The file path of each attachment which was uploaded.
+        :param failed: The error for each file path which failed to upload.
+        """
+        details = "; ".join(f"{path}: {error}" for path, error in failed.items())
+        super().__init__(
+            f"Attachment upload failed for {len(failed)} of "
+            f"{len(failed) + len(uploaded)} files of submission {instance_id}. "
+            f"{details}"
+        )
+        self.instance_id: str = instance_id
+        self.uploaded: list = uploaded
+        self.failed: dict = failed
@@ -0,0 +1,306 @@
+import logging
+import threading
+from bisect import bisect_left
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field, replace
+from typing import Any
+
+from requests import PreparedRequest, Response
+
+log = logging.getLogger(__name__)
+
+Instrument = Callable[["RequestEvent"], Any]
+
+
+@dataclass(frozen=True)
+class RequestEvent:
+    """
+    A request sent by the session, and how it went.
+
+    :param method: The HTTP method, e.g. "GET".
+    :param url: The full URL requested, including the query string.
+    :param template: The URL template the URL was formatted from, e.g.
+      "projects/{project_id}/forms/{form_id}". For URLs that weren't made with
+      `Session.urlformat`, this is the URL path relative to the base URL.
+    :param status: The response status code, or None if no response was received.
+    :param request_bytes: The size of the request body, if known.
+    :param response_bytes: The number of response body bytes received (as sent, i.e.
+      before decompression).
+    :param retries: The number of times the request was retried, e.g. after a 503
+      response or re-sent after logging in again.
+    :param ttfb: Seconds from sending the request to receiving the response headers.
+    :param duration: Seconds from sending the request to receiving the whole response.
+      For streamed responses, this is when the response is closed.
+    :param error: The error raised while sending the request, if any.
+    """
+
+    method: str
+    url: str
+    template: str
+    status: int | None = None
+    request_bytes: int | None = None
+    response_bytes: int | None = None
+    retries: int = 0
+    ttfb: float | None = None
+    duration: float | None = None
+    error: Exception | None = None
+
+    @staticmethod
+    def get_request_bytes(request: PreparedRequest) -> int | None:
+        if isinstance(request.body, bytes | str):
+            return len(request.body)
+        if request.body is None:
+            return 0
+        length = request.headers.get("Content-Length")
+        return int(length) if length is not None else None
+
+    @staticmethod
+    def get_response_bytes(response: Response) -> int | None:
+        tell = getattr(response.raw, "tell", None)
+        if callable(tell):
+            return tell()
+        if isinstance(response._content, bytes):
+            return len(response._content)
+        return None
+
+    @staticmethod
+    def get_retries(response: Response) -> int:
+        retries = getattr(response.raw, "retries", None)
+        count = len(retries.history) if getattr(retries, "history", None) else 0
+        # Requests re-sent by Auth.handle_401 keep the rejected response in history.
+        return count + sum(1 for r in response.history if r.status_code == 401)
+
+
+def emit(instruments: Iterable[Instrument], event: RequestEvent) -> None:
+    """
+    Send the event to each instrument. Errors raised by an instrument are logged, so
+    that a broken metrics sink doesn't interrupt the request.
+    """
+    for instrument in instruments:
+        _notify(instrument, event)
+
+
+def _notify(instrument: Instrument, event: RequestEvent) -> None:
+    try:
+        instrument(event)
+    except Exception:
+        log.warning("Instrument %r failed for %s.", instrument, event.url, exc_info=True)
+
+
+@dataclass
+class EndpointMetrics:
+    """
+    Totals for the requests to one endpoint (method and URL template).
+
+    :param requests: The number of requests.
+    :param errors: The number of requests which raised an error (no response).
+    :param statuses: The number of responses per status code.
+    :param request_bytes: The total size of request bodies.
+    :param response_bytes: The total size of response bodies.
+    :param retries: The total number of retries.
+    :param ttfb_sum: The total of the time-to-first-byte of each request, in seconds.
+    :param duration_sum: The total duration of the requests, in seconds.
+    :param duration_max: The longest request duration, in seconds.
+    :param buckets: The upper bounds of the duration histogram buckets, in seconds.
+    :param counts: The number of requests in each duration bucket, with a final
+      bucket for durations longer than the last bound.
+    """
+
+    buckets: tuple[float, ...]
+    requests: int = 0
+    errors: int = 0
+    statuses: dict[int, int] = field(default_factory=dict)
+    request_bytes: int = 0
+    response_bytes: int = 0
+    retries: int = 0
+    ttfb_sum: float = 0.0
+    duration_sum: float = 0.0
+    duration_max: float = 0.0
+    counts: list[int] = field(default_factory=list)
+
+    def __post_init__(self):
+        if not self.counts:
+            self.counts = [0] * (len(self.buckets) + 1)
+
+    def add(self, event: RequestEvent) -> None:
+        self.requests += 1
+        if event.status is None:
+            self.errors += 1
+        else:
+            self.statuses[event.status] = self.statuses.get(event.status, 0) + 1
+        self.request_bytes += event.request_bytes or 0
+        self.response_bytes += event.response_bytes or 0
+        self.retries += event.retries
+        self.ttfb_sum += event.ttfb or 0.0
+        duration = event.duration or 0.0
+        self.duration_sum += duration
+        self.duration_max = max(self.duration_max, duration)
+        self.counts[bisect_left(self.buckets, duration)] += 1
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate a duration quantile (e.g. 0.95) from the histogram, in seconds.
+
+        The estimate is the upper bound of the bucket containing the quantile, or the
+        longest duration if it is beyond the last bucket.
+        """
+        if self.requests == 0:
+            return 0.0
+        rank = q * self.requests
+        seen = 0
+        for bound, count in zip(self.buckets, self.counts, strict=False):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.duration_max)
+        return self.duration_max
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "statuses": dict(self.statuses),
+            "request_bytes": self.request_bytes,
+            "response_bytes": self.response_bytes,
+            "retries": self.retries,
+            "ttfb_mean": self.ttfb_sum / self.requests if self.requests else 0.0,
+            "duration_mean": self.duration_sum / self.requests if self.requests else 0.0,
+            "duration_p50": self.quantile(0.5),
+            "duration_p95": self.quantile(0.95),
+            "duration_max": self.duration_max,
+        }
+
+
+class MetricsAggregator:
+    """
+    An instrument which totals request counts, bytes, and latency histograms per
+    endpoint. It is safe to use from multiple threads.
+
+    ```python
+    from pyodk import Client
+    from pyodk.instrumentation import MetricsAggregator
+
+    metrics = MetricsAggregator()
+    with Client(instruments=[metrics]) as client:
+        client.entities.merge(...)
+    print(metrics.snapshot())
+    ```
+
+    :param buckets: The upper bounds of the duration histogram buckets, in seconds.
+    """
+
+    default_buckets: tuple[float, ...] = (
+        0.005,
+        0.01,
+        0.025,
+        0.05,
+        0.1,
+        0.25,
+        0.5,
+        1.0,
+        2.5,
+        5.0,
+        10.0,
+        30.0,
+        60.0,
+    )
+
+    def __init__(self, buckets: Iterable[float] | None = None):
+        if buckets is None:
+            buckets = self.default_buckets
+        self.buckets: tuple[float, ...] = tuple(sorted(buckets))
+        self._lock: threading.Lock = threading.Lock()
+        self._endpoints: dict[tuple[str, str], EndpointMetrics] = {}
+
+    def __call__(self, event: RequestEvent) -> None:
+        key = (event.method, event.template)
+        with self._lock:
+            metrics = self._endpoints.get(key)
+            if metrics is None:
+                metrics = self._endpoints[key] = EndpointMetrics(buckets=self.buckets)
+            metrics.add(event)
+
+    def reset(self) -> None:
+        """Discard all collected metrics."""
+        with self._lock:
+            self._endpoints.clear()
+
+    def endpoints(self) -> dict[tuple[str, str], EndpointMetrics]:
+        """Get a copy of the metrics, keyed by (method, URL template)."""
+        with self._lock:
+            return {
+                k: replace(v, statuses=dict(v.statuses), counts=list(v.counts))
+                for k, v in self._endpoints.items()
+            }
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """
+        Get a summary of the metrics per endpoint, e.g. for logging or saving as JSON.
+
+        :return: Summaries keyed by "<method> <URL template>", slowest mean first.
+        """
+        summaries = {
+            f"{method} {template}": metrics.as_dict()
+            for (method, template), metrics in self.endpoints().items()
+        }
+        return dict(
+            sorted(summaries.items(), key=lambda i: i[1]["duration_mean"], reverse=True)
+        )
+
+    def to_prometheus(self, prefix: str = "pyodk") -> str:
+        """
+        Format the metrics in the Prometheus text exposition format, e.g. to serve from
+        a metrics endpoint or write for the node exporter textfile collector.
+
+        :param prefix: The prefix for the metric names.
+        """
+        lines = []
+
+        def header(name: str, kind: str, text: str) -> None:
+            lines.append(f"# HELP {prefix}_{name} {text}")
+            lines.append(f"# TYPE {prefix}_{name} {kind}")
+
+        endpoints = sorted(self.endpoints().items())
+        header("requests_total", "counter", "Requests sent, by response status.")
+        for (method, template), m in endpoints:
+            labels = _labels(method=method, endpoint=template)
+            for status, count in sorted(m.statuses.items()):
+                lines.append(
+                    f'{prefix}_requests_total{{{labels},status="{status}"}} {count}'
+                )
+            if m.errors:
+                lines.append(
+                    f'{prefix}_requests_total{{{labels},status="error"}} {m.errors}'
+                )
+        for name, attr, text in (
+            ("request_bytes_total", "request_bytes", "Request body bytes sent."),
+            ("response_bytes_total", "response_bytes", "Response body bytes received."),
+            ("request_retries_total", "retries", "Requests retried."),
+        ):
+            header(name, "counter", text)
+            for (method, template), m in endpoints:
+                labels = _labels(method=method, endpoint=template)
+                lines.append(f"{prefix}_{name}{{{labels}}} {getattr(m, attr)}")
+        header("request_duration_seconds", "histogram", "Request duration.")
+        for (method, template), m in endpoints:
+            labels = _labels(method=method, endpoint=template)
+            cumulative = 0
+            for bound, count in zip((*m.buckets, "+Inf"), m.counts, strict=True):
+                cumulative += count
+                lines.append(
+                    f"{prefix}_request_duration_seconds_bucket"
+                    f'{{{labels},le="{bound}"}} {cumulative}'
+                )
+            lines.append(
+                f"{prefix}_request_duration_seconds_sum{{{labels}}} {m.duration_sum}"
+            )
+            lines.append(
+                f"{prefix}_request_duration_seconds_count{{{labels}}} {m.requests}"
+            )
+        return "\n".join(lines) + "\n"
+
+
+def _labels(**labels: str) -> str:
+    def escape(value: str) -> str:
+        return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+    return ",".join(f'{k}="{escape(v)}"' for k, v in labels.items())
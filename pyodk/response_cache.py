@@ -0,0 +1,340 @@
+import base64
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from datetime import timedelta
+from pathlib import Path
+from typing import Protocol
+
+from requests import PreparedRequest, Response
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+# Requests with these headers are already conditional or partial, so they're not cached.
+_UNCACHEABLE_HEADERS = ("If-None-Match", "If-Modified-Since", "If-Match", "Range")
+# Request headers which change the response, so they're part of the cache key. The
+# Accept-Encoding header isn't, because the decoded content is stored.
+_KEY_HEADERS = ("Authorization", "Accept", "Accept-Language", "X-Extended-Metadata")
+# Response headers which describe the transfer, rather than the (decoded) content.
+_TRANSFER_HEADERS = frozenset(
+    (
+        "connection",
+        "content-encoding",
+        "content-length",
+        "keep-alive",
+        "transfer-encoding",
+    )
+)
+
+
+@dataclass
+class CacheEntry:
+    """
+    A stored response.
+
+    :param url: The request URL.
+    :param status: The response status code.
+    :param headers: The response headers.
+    :param content: The response body.
+    :param stored_at: When the response was received or last revalidated, as a
+      `time.time()` timestamp.
+    """
+
+    url: str
+    status: int
+    headers: dict[str, str]
+    content: bytes
+    stored_at: float
+
+    @property
+    def etag(self) -> str | None:
+        return CaseInsensitiveDict(self.headers).get("ETag")
+
+    @property
+    def size(self) -> int:
+        return len(self.content)
+
+    def to_response(self, request: PreparedRequest) -> Response:
+        response = Response()
+        response.status_code = self.status
+        response.reason = "OK"
+        response.headers = CaseInsensitiveDict(self.headers)
+        response.encoding = get_encoding_from_headers(response.headers)
+        response._content = self.content
+        response.url = request.url
+        response.request = request
+        response.elapsed = timedelta(0)
+        response.from_cache = True
+        return response
+
+
+class CacheStore(Protocol):
+    """Where a `ResponseCache` keeps its entries."""
+
+    def get(self, key: str) -> CacheEntry | None: ...
+
+    def set(self, key: str, entry: CacheEntry) -> None: ...
+
+    def clear(self) -> None: ...
+
+    def __len__(self) -> int: ...
+
+
+class MemoryStore:
+    """
+    Keep cache entries in memory, evicting the least recently used entries when either
+    limit is exceeded.
+
+    :param max_entries: The maximum number of entries to keep.
+    :param max_bytes: The maximum total size of the response bodies to keep.
+    """
+
+    def __init__(self, max_entries: int = 256, max_bytes: int | None = None):
+        self.max_entries: int = max_entries
+        self.max_bytes: int | None = max_bytes
+        self._lock: threading.Lock = threading.Lock()
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._bytes: int = 0
+
+    def get(self, key: str) -> CacheEntry | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        with self._lock:
+            if (old := self._entries.pop(key, None)) is not None:
+                self._bytes -= old.size
+            self._entries[key] = entry
+            self._bytes += entry.size
+            while len(self._entries) > self.max_entries or (
+                self.max_bytes is not None and self._bytes > self.max_bytes
+            ):
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted.size
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class DiskStore:
+    """
+    Keep cache entries as files in a directory, so they can be re-used by later runs.
+    The least recently used entries (by file modification time) are evicted when either
+    limit is exceeded.
+
+    The files contain the response bodies, which may be sensitive, so the directory
+    should only be readable by the user.
+
+    :param path: The directory to store the entries in. Created if it doesn't exist.
+    :param max_entries: The maximum number of entries to keep.
+    :param max_bytes: The maximum total size of the entry files to keep.
+    """
+
+    def __init__(
+        self, path: str | Path, max_entries: int = 1024, max_bytes: int | None = None
+    ):
+        self.path: Path = Path(path).expanduser()
+        self.path.mkdir(mode=0o700, parents=True, exist_ok=True)
+        self.max_entries: int = max_entries
+        self.max_bytes: int | None = max_bytes
+        self._lock: threading.Lock = threading.Lock()
+
+    def _file(self, key: str) -> Path:
+        return self.path / f"{key}.json"
+
+    def get(self, key: str) -> CacheEntry | None:
+        file = self._file(key)
+        try:
+            data = json.loads(file.read_text(encoding="utf-8"))
+            data["content"] = base64.b64decode(data["content"])
+            entry = CacheEntry(**data)
+            os.utime(file)
+        except (OSError, ValueError, TypeError, KeyError):
+            return None
+        return entry
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        data = asdict(entry)
+        data["content"] = base64.b64encode(entry.content).decode("ascii")
+        file = self._file(key)
+        with self._lock:
+            tmp = file.with_suffix(".tmp")
+            tmp.write_text(json.dumps(data), encoding="utf-8")
+            tmp.replace(file)
+            self._evict()
+
+    def _evict(self) -> None:
+        files = []
+        for file in self.path.glob("*.json"):
+            stat = file.stat()
+            files.append((stat.st_mtime, stat.st_size, file))
+        files.sort(reverse=True)
+        total = 0
+        for i, (_, size, file) in enumerate(files):
+            total += size
+            if i >= self.max_entries or (
+                self.max_bytes is not None and total > self.max_bytes
+            ):
+                file.unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        with self._lock:
+            for file in self.path.glob("*.json"):
+                file.unlink(missing_ok=True)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self.path.glob("*.json"))
+
+
+@dataclass
+class CacheStats:
+    """
+    Response cache statistics.
+
+    :param hits: Responses used from the cache without contacting Central.
+    :param revalidated: Responses used from the cache after Central confirmed that they
+      hadn't changed (HTTP 304).
+    :param misses: Responses fetched from Central, including changed responses.
+    :param invalidations: The number of times the cache was cleared after a change.
+    """
+
+    hits: int = 0
+    revalidated: int = 0
+    misses: int = 0
+    invalidations: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """The share of requests answered from the cache, including revalidations."""
+        total = self.hits + self.revalidated + self.misses
+        return (self.hits + self.revalidated) / total if total else 0.0
+
+
+class ResponseCache:
+    """
+    An HTTP cache for GET requests, for metadata which is requested repeatedly, such as
+    forms, entity lists, and projects.
+
+    Responses are keyed by URL and by the request headers which change the response
+    (Authorization, Accept, Accept-Language, and X-Extended-Metadata), so responses for
+    one user are not used for another, and e.g. extended metadata responses are kept
+    apart from the plain ones. A stored response is used without contacting Central
+    until it is `ttl` seconds old. After that, if it has an ETag, Central is asked if it
+    has changed (with If-None-Match), otherwise it is fetched again.
+
+    Streamed responses (e.g. `iter_table`) and requests which are already conditional
+    are not cached. Any successful POST, PUT, PATCH, or DELETE request clears the cache,
+    so changes made through the session are seen by later requests.
+
+    ```python
+    from pyodk import Client
+    from pyodk.response_cache import DiskStore, ResponseCache
+
+    cache = ResponseCache(store=DiskStore("~/.cache/pyodk"), ttl=600)
+    with Client(response_cache=cache) as client:
+        client.forms.list()
+    print(cache.stats.hit_rate)
+    ```
+
+    :param store: Where to keep the entries. Defaults to a `MemoryStore`.
+    :param ttl: Seconds to use a stored response without revalidating it. If 0, always
+      revalidate. If None, use it until it is evicted or the cache is cleared.
+    """
+
+    def __init__(self, store: CacheStore | None = None, ttl: float | None = 60):
+        if store is None:
+            store = MemoryStore()
+        self.store: CacheStore = store
+        self.ttl: float | None = ttl
+        self.stats: CacheStats = CacheStats()
+        self._lock: threading.Lock = threading.Lock()
+
+    @staticmethod
+    def get_key(request: PreparedRequest) -> str:
+        headers = (request.headers.get(h, "") for h in _KEY_HEADERS)
+        return hashlib.sha256("\n".join((request.url, *headers)).encode()).hexdigest()
+
+    def _count(self, stat: str) -> None:
+        with self._lock:
+            setattr(self.stats, stat, getattr(self.stats, stat) + 1)
+
+    def clear(self) -> None:
+        """Remove all stored responses."""
+        self.store.clear()
+
+    def send(
+        self,
+        request: PreparedRequest,
+        send: Callable[[PreparedRequest], Response],
+        stream: bool = False,
+    ) -> Response:
+        """
+        Send the request using the cache.
+
+        :param request: The request to send.
+        :param send: The function to send the request to Central.
+        :param stream: If True, the response body will be streamed, so it isn't cached.
+        """
+        if request.method != "GET":
+            response = send(request)
+            if response.status_code < 400 and request.method in (
+                "POST",
+                "PUT",
+                "PATCH",
+                "DELETE",
+            ):
+                self.clear()
+                self._count("invalidations")
+            return response
+        if stream or any(h in request.headers for h in _UNCACHEABLE_HEADERS):
+            return send(request)
+
+        key = self.get_key(request)
+        entry = self.store.get(key)
+        if entry is not None:
+            age = time.time() - entry.stored_at
+            if self.ttl is None or age < self.ttl:
+                self._count("hits")
+                return entry.to_response(request)
+            if (etag := entry.etag) is not None:
+                request.headers["If-None-Match"] = etag
+
+        response = send(request)
+        if entry is not None and response.status_code == 304:
+            response.close()
+            entry.stored_at = time.time()
+            self.store.set(key, entry)
+            self._count("revalidated")
+            return entry.to_response(request)
+
+        self._count("misses")
+        cache_control = response.headers.get("Cache-Control", "")
+        if response.status_code == 200 and "no-store" not in cache_control:
+            self.store.set(
+                key,
+                CacheEntry(
+                    url=request.url,
+                    status=response.status_code,
+                    headers={
+                        k: v
+                        for k, v in response.headers.items()
+                        if k.lower() not in _TRANSFER_HEADERS
+                    },
+                    content=response.content,
+                    stored_at=time.time(),
+                ),
+            )
+        return response
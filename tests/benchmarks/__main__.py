@@ -0,0 +1,92 @@
+"""
+Run the pyodk benchmarks, or compare two saved results.
+
+python -m tests.benchmarks run [--match TEXT] [--quick] [--output PATH]
+python -m tests.benchmarks compare BEFORE.json AFTER.json [--threshold 0.1]
+python -m tests.benchmarks list
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+from tests.benchmarks import runner
+
+
+def cmd_run(args: argparse.Namespace) -> int:
+    def report(result: runner.Result) -> None:
+        per_item = ""
+        if result.per_item is not None:
+            per_item = f" ({runner.format_time(result.per_item)} per item)"
+        print(
+            f"{result.name:<50} {runner.format_time(result.median):>10}"
+            f" ± {runner.format_time(result.stdev):<10}{per_item}",
+            flush=True,
+        )
+
+    results = runner.run(match=args.match, quick=args.quick, report=report)
+    path = runner.save(results, args.output or runner.default_path())
+    print(f"Saved {len(results)} results to {path}")
+    return 0
+
+
+def cmd_compare(args: argparse.Namespace) -> int:
+    comparisons = runner.compare(runner.load(args.before), runner.load(args.after))
+    regressions = 0
+    print(f"{'benchmark':<50} {'before':>10} {'after':>10} {'change':>8}")
+    for c in comparisons:
+        change, flag = "-", ""
+        if c.ratio is not None:
+            change = f"{c.ratio - 1:+.1%}"
+            if c.ratio > 1 + args.threshold:
+                flag = "  slower"
+                regressions += 1
+            elif c.ratio < 1 - args.threshold:
+                flag = "  faster"
+        print(
+            f"{c.name:<50} {runner.format_time(c.before):>10}"
+            f" {runner.format_time(c.after):>10} {change:>8}{flag}"
+        )
+    if regressions:
+        print(f"{regressions} benchmarks were more than {args.threshold:.0%} slower.")
+        return 1
+    return 0
+
+
+def cmd_list(args: argparse.Namespace) -> int:
+    for bench in runner.collect().values():
+        sizes = ", ".join(str(s) for s in bench.sizes if s is not None)
+        print(f"{bench.name}{f' [{sizes}]' if sizes else ''}")
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m tests.benchmarks")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="Run the benchmarks and save the results.")
+    run.add_argument("--match", help="Only run benchmarks with names containing this.")
+    run.add_argument("--quick", action="store_true", help="Only run the small sizes.")
+    run.add_argument("--output", type=Path, help="Where to save the results JSON.")
+    run.set_defaults(func=cmd_run)
+
+    compare = commands.add_parser("compare", help="Compare two saved results.")
+    compare.add_argument("before", type=Path)
+    compare.add_argument("after", type=Path)
+    compare.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="Report a change in median time larger than this fraction (default 0.1).",
+    )
+    compare.set_defaults(func=cmd_compare)
+
+    listing = commands.add_parser("list", help="List the benchmarks.")
+    listing.set_defaults(func=cmd_list)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
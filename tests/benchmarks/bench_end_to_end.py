@@ -0,0 +1,102 @@
+"""
+Client requests against the local fake Central server. The server runs in the same
+process, so these measure pyodk's (and requests') overhead per request and per row,
+rather than network or server time.
+"""
+
+from contextlib import ExitStack
+
+from tests.benchmarks import data
+from tests.benchmarks.runner import benchmark
+from tests.utils.fake_central import FakeCentral
+from tests.utils.utils import get_temp_dir
+
+PROPERTIES = [f"p{p}" for p in range(5)]
+
+
+def get_client(central: FakeCentral, stack: ExitStack, **kwargs):
+    stack.enter_context(central)
+    tmp = stack.enter_context(get_temp_dir())
+    client = stack.enter_context(central.client(tmp, **kwargs))
+    client.session.auth.login()
+    return client
+
+
+def add_entities(central: FakeCentral, size: int) -> None:
+    name = central.entity_list_name
+    for p in PROPERTIES:
+        if p not in {i["name"] for i in central.entity_lists[(1, name)]["properties"]}:
+            central.add_property(central.entity_lists[(1, name)], p)
+    for row in data.entity_rows(size):
+        values = {k: row[k] for k in PROPERTIES}
+        central.add_entity(1, name, row["label"], values, uuid=row["__id"])
+
+
+@benchmark("end_to_end.get_table", sizes=(1_000, 10_000), quick_sizes=(1_000,))
+def get_table(size):
+    stack = ExitStack()
+    central = FakeCentral()
+    add_entities(central, size)
+    client = get_client(central, stack)
+
+    def func():
+        client.entities.get_table(entity_list_name=central.entity_list_name)
+
+    func.close = stack.close
+    return func
+
+
+@benchmark("end_to_end.get_table_columnar", sizes=(1_000, 10_000), quick_sizes=(1_000,))
+def get_table_columnar(size):
+    """Compare with "end_to_end.get_table_transposed" for the same columns."""
+    stack = ExitStack()
+    central = FakeCentral()
+    add_entities(central, size)
+    client = get_client(central, stack)
+
+    def func():
+        client.entities.get_table(
+            entity_list_name=central.entity_list_name, columnar=True
+        )
+
+    func.close = stack.close
+    return func
+
+
+@benchmark("end_to_end.get_table_transposed", sizes=(1_000, 10_000), quick_sizes=(1_000,))
+def get_table_transposed(size):
+    """Get rows, then make a list per column, as callers did before columnar mode."""
+    stack = ExitStack()
+    central = FakeCentral()
+    add_entities(central, size)
+    client = get_client(central, stack)
+
+    def func():
+        rows = client.entities.get_table(entity_list_name=central.entity_list_name)
+        rows = rows["value"]
+        columns = {k for row in rows for k in row}
+        return {c: [row.get(c) for row in rows] for c in columns}
+
+    func.close = stack.close
+    return func
+
+
+@benchmark("end_to_end.merge", sizes=(100, 1_000), quick_sizes=(100,), repeat=3)
+def merge(size):
+    """Merge with a quarter unchanged, half updated, and a quarter new."""
+    stack = ExitStack()
+    central = FakeCentral()
+    add_entities(central, size)
+    client = get_client(central, stack, pool_maxsize=8)
+    key = (1, central.entity_list_name)
+    initial = central.entities[key]
+    source = data.merge_source(size)
+
+    def func():
+        central.entities[key] = {k: dict(v) for k, v in initial.items()}
+        client.entities.merge(
+            source, entity_list_name=central.entity_list_name, max_workers=8
+        )
+
+    func.close = stack.close
+    return func
@@ -0,0 +1,50 @@
+from pyodk._endpoints.entities import EntityService
+from requests import Response
+
+from tests.benchmarks import data
+from tests.benchmarks.runner import benchmark
+from tests.test_session import get_session
+
+
+@benchmark(
+    "entities.prep_data_for_merge",
+    sizes=(10_000, 100_000, 1_000_000),
+    quick_sizes=(10_000,),
+    repeat=3,
+)
+def prep_data_for_merge(size):
+    source = data.merge_source(size)
+    target = data.entity_rows(size)
+    return lambda: EntityService._prep_data_for_merge(
+        source_data=source, target_data=target
+    )
+
+
+def stub_send(request, **kwargs) -> Response:
+    response = Response()
+    response.status_code = 200
+    response._content = b'{"success": true}'
+    response.request = request
+    return response
+
+
+@benchmark(
+    "entities.create_many",
+    sizes=(1_000, 10_000, 100_000),
+    quick_sizes=(1_000,),
+    repeat=3,
+)
+def create_many(size):
+    """Reshape, JSON encode, and prepare the request; the response is stubbed."""
+    session = get_session()
+    session.send = stub_send
+    service = EntityService(
+        session=session, default_project_id=1, default_entity_list_name="bench"
+    )
+    rows = data.merge_source(size)
+
+    def func():
+        service.create_many(data=rows)
+
+    func.close = session.close
+    return func
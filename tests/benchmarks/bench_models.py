@@ -0,0 +1,80 @@
+import json
+
+from pyodk._endpoints.bases import ModelList, list_adapter, record_type
+from pyodk._endpoints.entities import Entity
+from pyodk._endpoints.submissions import Submission
+
+from tests.benchmarks import data
+from tests.benchmarks.runner import benchmark
+
+
+@benchmark("models.submission", sizes=(1_000, 10_000), quick_sizes=(1_000,))
+def submission(size):
+    rows = data.submissions_json(size)
+    return lambda: [Submission(**r) for r in rows]
+
+
+@benchmark("models.entity", sizes=(1_000, 10_000), quick_sizes=(1_000,))
+def entity(size):
+    rows = data.entities_json(size)
+    return lambda: [Entity(**r) for r in rows]
+
+
+@benchmark("models.submission_trusted", sizes=(1_000, 10_000), quick_sizes=(1_000,))
+def submission_trusted(size):
+    """A trusted list, of which only the first 10 items are used."""
+    rows = data.submissions_json(size)
+    return lambda: ModelList(Submission, rows)[:10]
+
+
+@benchmark("models.entity_trusted", sizes=(1_000, 10_000), quick_sizes=(1_000,))
+def entity_trusted(size):
+    """A trusted list, of which only the first 10 items are used."""
+    rows = data.entities_json(size)
+    return lambda: ModelList(Entity, rows)[:10]
+
+
+@benchmark("models.submission_bytes", sizes=(1_000, 10_000), quick_sizes=(1_000,))
+def submission_bytes(size):
+    """Validate a list response body, as the `list` methods do."""
+    content = json.dumps(data.submissions_json(size)).encode()
+    adapter = list_adapter(Submission)
+    return lambda: adapter.validate_json(content)
+
+
+@benchmark("models.submission_loads", sizes=(1_000, 10_000), quick_sizes=(1_000,))
+def submission_loads(size):
+    """Parse a list response body to dicts, then validate each one."""
+    content = json.dumps(data.submissions_json(size)).encode()
+    return lambda: [Submission(**r) for r in json.loads(content)]
+
+
+@benchmark("models.entity_bytes", sizes=(1_000, 10_000), quick_sizes=(1_000,))
+def entity_bytes(size):
+    """Validate a list response body, as the `list` methods do."""
+    content = json.dumps(data.entities_json(size)).encode()
+    adapter = list_adapter(Entity)
+    return lambda: adapter.validate_json(content)
+
+
+@benchmark("models.entity_loads", sizes=(1_000, 10_000), quick_sizes=(1_000,))
+def entity_loads(size):
+    """Parse a list response body to dicts, then validate each one."""
+    content = json.dumps(data.entities_json(size)).encode()
+    return lambda: [Entity(**r) for r in json.loads(content)]
+
+
+@benchmark("models.submission_record", sizes=(1_000, 10_000), quick_sizes=(1_000,))
+def submission_record(size):
+    """Parse a list response body to compact records."""
+    content = json.dumps(data.submissions_json(size)).encode()
+    from_dict = record_type(Submission).from_dict
+    return lambda: [from_dict(r) for r in json.loads(content)]
+
+
+@benchmark("models.entity_record", sizes=(1_000, 10_000), quick_sizes=(1_000,))
+def entity_record(size):
+    """Parse a list response body to compact records."""
+    content = json.dumps(data.entities_json(size)).encode()
+    from_dict = record_type(Entity).from_dict
+    return lambda: [from_dict(r) for r in json.loads(content)]
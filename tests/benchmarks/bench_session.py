@@ -0,0 +1,60 @@
+import importlib.util
+
+from pyodk._endpoints.submissions import URLs
+from pyodk._utils.json_codec import CODECS, get_codec
+
+from tests.benchmarks import data
+from tests.benchmarks.runner import benchmark
+from tests.test_session import get_session
+
+URLS = URLs()
+
+
+@benchmark("session.urlformat")
+def urlformat(size):
+    session = get_session()
+
+    def func():
+        session.urlformat(URLS.get, project_id=1, form_id="a form", instance_id="uuid:1")
+
+    func.close = session.close
+    return func
+
+
+@benchmark("session.urljoin")
+def urljoin(size):
+    session = get_session()
+    url = session.urlformat(URLS.get, project_id=1, form_id="a", instance_id="uuid:1")
+
+    def func():
+        session.urljoin(url)
+
+    func.close = session.close
+    return func
+
+
+def json_benchmarks(codec_name: str) -> None:
+    """Register the JSON encode and decode benchmarks for a codec."""
+
+    @benchmark(
+        f"session.json_dumps_{codec_name}", sizes=(1_000, 10_000), quick_sizes=(1_000,)
+    )
+    def json_dumps(size):
+        """Encode a `create_many` body."""
+        codec = get_codec(codec_name)
+        body = {"source": {"name": "bench"}, "entities": data.entity_rows(size)}
+        return lambda: codec.dumps(body)
+
+    @benchmark(
+        f"session.json_loads_{codec_name}", sizes=(1_000, 10_000), quick_sizes=(1_000,)
+    )
+    def json_loads(size):
+        """Decode an entities `list` response body."""
+        codec = get_codec(codec_name)
+        content = get_codec("json").dumps(data.entities_json(size))
+        return lambda: codec.loads(content)
+
+
+for name in CODECS:
+    if name == "json" or importlib.util.find_spec(name) is not None:
+        json_benchmarks(name)
@@ -0,0 +1,37 @@
+"""
+Cold start: a new interpreter importing pyodk and making a Client. Each run includes
+the interpreter startup, which is measured on its own by "startup.python".
+"""
+
+import subprocess
+import sys
+
+from tests.benchmarks.runner import benchmark
+from tests.resources import CONFIG_FILE
+
+
+def run_python(code: str):
+    def func():
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    return func
+
+
+@benchmark("startup.python")
+def python(size):
+    return run_python("pass")
+
+
+@benchmark("startup.import_pyodk")
+def import_pyodk(size):
+    return run_python("import pyodk")
+
+
+@benchmark("startup.client")
+def client(size):
+    """Import pyodk, make a Client, and use one service (without a request)."""
+    return run_python(
+        "from pyodk import Client\n"
+        f"client = Client(config_path={CONFIG_FILE.as_posix()!r})\n"
+        "client.submissions"
+    )
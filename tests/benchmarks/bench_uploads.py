@@ -0,0 +1,104 @@
+"""
+Upload a file to a local server which discards it, with each kind of request body. The
+size is in MB, so the time per item is the time per MB.
+
+The "_cpu" benchmarks time the CPU used, rather than the elapsed time. The server runs in
+the same process, so its (equal) share is included.
+"""
+
+import os
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import ExitStack, contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from pyodk._utils.transfer import open_upload
+
+from tests.benchmarks.runner import benchmark
+from tests.test_session import get_session
+from tests.utils.utils import get_temp_dir
+
+MB = 1 << 20
+
+
+class SinkHandler(BaseHTTPRequestHandler):
+    """Reads and discards the request body, into one reused buffer."""
+
+    protocol_version = "HTTP/1.1"
+
+    def read(self, size: int, view: memoryview) -> None:
+        while size:
+            size -= self.rfile.readinto(view[: min(size, len(view))])
+
+    def do_POST(self):
+        view = memoryview(bytearray(MB))
+        if self.headers["Transfer-Encoding"] == "chunked":
+            while size := int(self.rfile.readline().strip(), 16):
+                self.read(size + 2, view)
+            self.rfile.readline()
+        else:
+            self.read(int(self.headers["Content-Length"]), view)
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"{}")
+
+    def log_message(self, *args):
+        pass
+
+
+@contextmanager
+def open_generator(path: Path, blocksize: int) -> Iterator[Iterator[bytes]]:
+    """The body which uploads used before they were sent from the open file."""
+
+    def file_stream():
+        with open(path, "rb") as f:
+            while chunk := f.read(blocksize):
+                yield chunk
+
+    yield file_stream()
+
+
+def upload(size: int, body: str) -> Callable:
+    stack = ExitStack()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), SinkHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    stack.callback(server.server_close)
+    stack.callback(server.shutdown)
+    session = stack.enter_context(
+        get_session(base_url=f"http://127.0.0.1:{server.server_address[1]}")
+    )
+    path = stack.enter_context(get_temp_dir()) / "video.mp4"
+    with open(path, "wb") as f:
+        for _ in range(size):
+            f.write(os.urandom(MB))
+    headers = {"Transfer-Encoding": "chunked"} if body == "generator" else {}
+
+    def func():
+        if body == "generator":
+            opened = open_generator(path, blocksize=session.blocksize)
+        else:
+            opened = open_upload(path, memory_map=body == "mmap")
+        with opened as data:
+            session.post("upload", data=data, headers=headers)
+
+    func.close = stack.close
+    return func
+
+
+def upload_benchmarks(body: str) -> None:
+    """Register the upload benchmarks for a kind of request body."""
+    for suffix, timer in (("", time.perf_counter), ("_cpu", time.process_time)):
+        benchmark(
+            f"uploads.{body}{suffix}",
+            sizes=(16, 256),
+            quick_sizes=(16,),
+            repeat=3,
+            timer=timer,
+        )(lambda size, body=body: upload(size, body))
+
+
+for name in ("generator", "file", "mmap"):
+    upload_benchmarks(name)
@@ -0,0 +1,89 @@
+"""
+Generated data in the shapes that Central returns, for benchmarks.
+"""
+
+from uuid import UUID
+
+NOW = "2025-01-01T00:00:00.000Z"
+
+
+def uuid(i: int) -> str:
+    return str(UUID(int=i))
+
+
+def entity_rows(size: int, properties: int = 5) -> list[dict]:
+    """Entities as returned by the Entities OData table."""
+    return [
+        {
+            "__id": uuid(i),
+            "label": f"Entity {i}",
+            **{f"p{p}": f"{i}-{p}" for p in range(properties)},
+            "__system": {
+                "createdAt": NOW,
+                "creatorId": "1",
+                "creatorName": "Bench",
+                "updates": 0,
+                "updatedAt": None,
+                "version": 1,
+                "conflict": None,
+            },
+        }
+        for i in range(size)
+    ]
+
+
+def merge_source(size: int, properties: int = 5) -> list[dict]:
+    """
+    Source data for a merge with `entity_rows(size)`: a quarter of the rows are
+    unchanged, half are changed, and the last quarter are new.
+    """
+    rows = []
+    for i in range(size):
+        if i < size // 4:
+            values = {f"p{p}": f"{i}-{p}" for p in range(properties)}
+        else:
+            values = {f"p{p}": f"{i}-{p}-new" for p in range(properties)}
+        label = f"Entity {i}" if i < size * 3 // 4 else f"New {i}"
+        rows.append({"label": label, **values})
+    return rows
+
+
+def submissions_json(size: int) -> list[dict]:
+    """Submissions as returned by the submissions list endpoint."""
+    return [
+        {
+            "instanceId": f"uuid:{uuid(i)}",
+            "submitterId": 1,
+            "deviceId": None,
+            "createdAt": NOW,
+            "updatedAt": None,
+            "reviewState": None,
+        }
+        for i in range(size)
+    ]
+
+
+def entities_json(size: int) -> list[dict]:
+    """Entities as returned by the entities list endpoint."""
+    return [
+        {
+            "uuid": uuid(i),
+            "creatorId": 1,
+            "createdAt": NOW,
+            "updatedAt": None,
+            "deletedAt": None,
+            "conflict": None,
+            "currentVersion": {
+                "label": f"Entity {i}",
+                "current": True,
+                "createdAt": NOW,
+                "creatorId": 1,
+                "userAgent": "pyodk",
+                "version": 1,
+                "baseVersion": None,
+                "conflictingProperties": None,
+                "data": {"p0": str(i)},
+            },
+        }
+        for i in range(size)
+    ]
@@ -0,0 +1,234 @@
+"""
+Collect, run, save, and compare benchmarks.
+
+A benchmark is a setup function registered with `@benchmark`. It is called once per
+size to prepare the data, and returns the function to time.
+"""
+
+import importlib
+import json
+import platform
+import statistics
+import subprocess
+import time
+import timeit
+from collections.abc import Callable, Iterable
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from pyodk.__version__ import __version__
+
+RESULTS_DIR = Path(__file__).parent / "results"
+MODULES = (
+    "tests.benchmarks.bench_entities",
+    "tests.benchmarks.bench_models",
+    "tests.benchmarks.bench_session",
+    "tests.benchmarks.bench_uploads",
+    "tests.benchmarks.bench_end_to_end",
+    "tests.benchmarks.bench_startup",
+)
+
+
+@dataclass
+class Benchmark:
+    """
+    :param name: The benchmark name, e.g. "entities.prep_data_for_merge".
+    :param setup: Makes the function to time, for a given size.
+    :param sizes: The sizes (e.g. row counts) to run the benchmark with, or (None,).
+    :param quick_sizes: The sizes to run in quick mode.
+    :param repeat: The number of timing runs; the median and minimum are reported.
+    :param timer: The clock to time with, e.g. `time.process_time` for CPU time.
+    """
+
+    name: str
+    setup: Callable[[int | None], Callable[[], Any]]
+    sizes: tuple[int | None, ...] = (None,)
+    quick_sizes: tuple[int | None, ...] | None = None
+    repeat: int = 5
+    timer: Callable[[], float] = time.perf_counter
+
+    def get_sizes(self, quick: bool) -> tuple[int | None, ...]:
+        if quick and self.quick_sizes is not None:
+            return self.quick_sizes
+        return self.sizes
+
+
+@dataclass
+class Result:
+    """
+    Timings for one benchmark and size, in seconds per call.
+
+    :param name: The benchmark name, with the size if any, e.g. "name[1000]".
+    :param size: The size the benchmark was run with.
+    :param number: The number of calls per timing run.
+    :param repeat: The number of timing runs.
+    """
+
+    name: str
+    size: int | None
+    number: int
+    repeat: int
+    min: float
+    median: float
+    mean: float
+    stdev: float
+
+    @property
+    def per_item(self) -> float | None:
+        return self.median / self.size if self.size else None
+
+
+BENCHMARKS: dict[str, Benchmark] = {}
+
+
+def benchmark(
+    name: str,
+    sizes: Iterable[int] | None = None,
+    quick_sizes: Iterable[int] | None = None,
+    repeat: int = 5,
+    timer: Callable[[], float] = time.perf_counter,
+) -> Callable:
+    """Register a benchmark setup function."""
+
+    def decorator(func: Callable) -> Callable:
+        BENCHMARKS[name] = Benchmark(
+            name=name,
+            setup=func,
+            sizes=(None,) if sizes is None else tuple(sizes),
+            quick_sizes=None if quick_sizes is None else tuple(quick_sizes),
+            repeat=repeat,
+            timer=timer,
+        )
+        return func
+
+    return decorator
+
+
+def collect() -> dict[str, Benchmark]:
+    for module in MODULES:
+        importlib.import_module(module)
+    return BENCHMARKS
+
+
+def measure(bench: Benchmark, size: int | None) -> Result:
+    func = bench.setup(size)
+    try:
+        timer = timeit.Timer(func, timer=bench.timer)
+        number, _ = timer.autorange()
+        times = [t / number for t in timer.repeat(repeat=bench.repeat, number=number)]
+    finally:
+        if callable(close := getattr(func, "close", None)):
+            close()
+    return Result(
+        name=bench.name if size is None else f"{bench.name}[{size}]",
+        size=size,
+        number=number,
+        repeat=bench.repeat,
+        min=min(times),
+        median=statistics.median(times),
+        mean=statistics.mean(times),
+        stdev=statistics.stdev(times) if len(times) > 1 else 0.0,
+    )
+
+
+def run(
+    match: str | None = None,
+    quick: bool = False,
+    report: Callable[[Result], Any] | None = None,
+) -> list[Result]:
+    """
+    Run the benchmarks.
+
+    :param match: If provided, only run benchmarks with names containing this text.
+    :param quick: If True, run the smaller sizes only, e.g. for a smoke test.
+    :param report: Called with each result as it is measured.
+    """
+    results = []
+    for bench in collect().values():
+        if match is not None and match not in bench.name:
+            continue
+        for size in bench.get_sizes(quick=quick):
+            result = measure(bench, size)
+            if report is not None:
+                report(result)
+            results.append(result)
+    return results
+
+
+def get_commit() -> str | None:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],  # noqa: S607
+            capture_output=True,
+            check=True,
+            cwd=Path(__file__).parent,
+            text=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip()
+
+
+def save(results: list[Result], path: Path) -> Path:
+    data = {
+        "meta": {
+            "pyodk": __version__,
+            "commit": get_commit(),
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+            "created": datetime.now(tz=timezone.utc).isoformat(timespec="seconds"),
+        },
+        "results": {r.name: asdict(r) for r in results},
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    return path
+
+
+def load(path: Path) -> dict[str, Result]:
+    data = json.loads(Path(path).read_text(encoding="utf-8"))
+    return {k: Result(**v) for k, v in data["results"].items()}
+
+
+@dataclass
+class Comparison:
+    name: str
+    before: float | None
+    after: float | None
+
+    @property
+    def ratio(self) -> float | None:
+        if self.before and self.after is not None:
+            return self.after / self.before
+        return None
+
+
+def compare(before: dict[str, Result], after: dict[str, Result]) -> list[Comparison]:
+    """Compare the median times of two sets of results, by benchmark name."""
+    names = list(before) + [n for n in after if n not in before]
+    return [
+        Comparison(
+            name=n,
+            before=before[n].median if n in before else None,
+            after=after[n].median if n in after else None,
+        )
+        for n in names
+    ]
+
+
+def format_time(seconds: float | None) -> str:
+    if seconds is None:
+        return "-"
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.3g} {unit}"
+    return f"{seconds / 1e-9:.3g} ns"
+
+
+def default_path() -> Path:
+    stamp = time.strftime("%Y%m%dT%H%M%S")
+    return RESULTS_DIR / f"pyodk-{__version__}-{stamp}.json"
@@ -1,3 +1,4 @@
+from datetime import datetime, timedelta, timezone
 from unittest import TestCase
 from unittest.mock import MagicMock, patch
 
@@ -73,7 +74,7 @@ class TestAuth(TestCase):
         with (
             patch.multiple(
                 AuthService,
-                get_new_token=MagicMock(return_value="123"),
+                get_new_session=MagicMock(return_value={"token": "123"}),
             ),
             get_temp_dir() as tmp,
         ):
@@ -97,7 +98,7 @@ class TestAuth(TestCase):
             patch.multiple(
                 AuthService,
                 verify_token=verify_mock,
-                get_new_token=get_new_mock,
+                get_new_session=get_new_mock,
             ),
             get_temp_dir() as tmp,
             self.assertRaises(PyODKError) as err,
@@ -136,7 +137,7 @@ class TestAuth(TestCase):
             patch.multiple(
                 AuthService,
                 verify_token=verify_mock,
-                get_new_token=MagicMock(return_value="123"),
+                get_new_session=MagicMock(return_value={"token": "123"}),
             ),
             get_temp_dir() as tmp,
         ):
@@ -151,3 +152,76 @@ class TestAuth(TestCase):
             cache = config.read_cache_token(cache_path=cache_path)
             self.assertEqual("123", cache)
             self.assertEqual(1, verify_mock.call_count)
+
+    def test_get_token__ok__new_cache_expiry(self):
+        """Should write the token expiry time to the cache file."""
+        with (
+            patch.multiple(
+                AuthService,
+                get_new_session=MagicMock(
+                    return_value={"token": "123", "expiresAt": "2030-01-01T00:00:00.000Z"}
+                ),
+            ),
+            get_temp_dir() as tmp,
+        ):
+            cache_path = (tmp / "test_cache.toml").as_posix()
+            client = Client(cache_path=cache_path)
+            client.session.auth.service.get_token(username="user", password="pass")  # noqa: S106
+            self.assertEqual(
+                datetime(2030, 1, 1, tzinfo=timezone.utc),
+                config.read_cache_token_expiry(cache_path=cache_path),
+            )
+
+    def test_get_token__ok__existing_cache_not_expired(self):
+        """Should return the cached token without verifying it, if not near expiry."""
+        verify_mock = MagicMock()
+        get_new_mock = MagicMock()
+        with (
+            patch.multiple(
+                AuthService, verify_token=verify_mock, get_new_session=get_new_mock
+            ),
+            get_temp_dir() as tmp,
+        ):
+            cache_path = (tmp / "test_cache.toml").as_posix()
+            client = Client(cache_path=cache_path)
+            expires_at = datetime.now(tz=timezone.utc) + timedelta(hours=1)
+            config.write_cache("token", "123", cache_path=cache_path)
+            config.write_cache("token_expires_at", expires_at.isoformat(), cache_path)
+            token = client.session.auth.service.get_token(
+                username="user",
+                password="pass",  # noqa: S106
+            )
+            self.assertEqual("123", token)
+            verify_mock.assert_not_called()
+            get_new_mock.assert_not_called()
+
+    def test_get_token__ok__existing_cache_near_expiry(self):
+        """Should get a new token without verifying, if the cached one is near expiry."""
+        verify_mock = MagicMock()
+        new_expiry = "2030-01-01T00:00:00.000Z"
+        with (
+            patch.multiple(
+                AuthService,
+                verify_token=verify_mock,
+                get_new_session=MagicMock(
+                    return_value={"token": "456", "expiresAt": new_expiry}
+                ),
+            ),
+            get_temp_dir() as tmp,
+        ):
+            cache_path = (tmp / "test_cache.toml").as_posix()
+            client = Client(cache_path=cache_path)
+            expires_at = datetime.now(tz=timezone.utc) + timedelta(minutes=1)
+            config.write_cache("token", "123", cache_path=cache_path)
+            config.write_cache("token_expires_at", expires_at.isoformat(), cache_path)
+            token = client.session.auth.service.get_token(
+                username="user",
+                password="pass",  # noqa: S106
+            )
+            self.assertEqual("456", token)
+            self.assertEqual("456", config.read_cache_token(cache_path=cache_path))
+            self.assertEqual(
+                datetime(2030, 1, 1, tzinfo=timezone.utc),
+                config.read_cache_token_expiry(cache_path=cache_path),
+            )
+            verify_mock.assert_not_called()
@@ -1,3 +1,4 @@
+import json
 from unittest import TestCase
 from unittest.mock import MagicMock, patch
 
@@ -16,7 +17,9 @@ class TestComments(TestCase):
         fixture = comments_data.test_comments
         with patch.object(Session, "request") as mock_session:
             mock_session.return_value.status_code = 200
-            mock_session.return_value.json.return_value = fixture["response_data"]
+            mock_session.return_value.content = json.dumps(
+                fixture["response_data"]
+            ).encode()
             with Client() as client:
                 observed = client._comments.list(
                     form_id=fixture["form_id"],
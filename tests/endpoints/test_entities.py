@@ -1,8 +1,11 @@
+import json
 from csv import DictReader
+from datetime import datetime
 from io import StringIO
 from unittest import TestCase
 from unittest.mock import MagicMock, patch
 
+from pyodk._endpoints.bases import Record
 from pyodk._endpoints.entities import Entity, MergeActions
 from pyodk._endpoints.entities import EntityService as es
 from pyodk._utils.session import Session
@@ -20,7 +23,7 @@ class TestEntities(TestCase):
         fixture = entities_data.test_entities
         with patch.object(Session, "request") as mock_session:
             mock_session.return_value.status_code = 200
-            mock_session.return_value.json.return_value = fixture
+            mock_session.return_value.content = json.dumps(fixture).encode()
             with Client() as client:
                 observed = client.entities.list(entity_list_name="test")
         self.assertEqual(2, len(observed))
@@ -28,6 +31,27 @@ class TestEntities(TestCase):
             with self.subTest(i):
                 self.assertIsInstance(o, Entity)
 
+    def test_list__compact(self):
+        """Should return a list of Entity records, equivalent to the Entity objects."""
+        fixture = entities_data.test_entities
+        with patch.object(Session, "request") as mock_session:
+            mock_session.return_value.status_code = 200
+            mock_session.return_value.json.return_value = json.loads(json.dumps(fixture))
+            with Client() as client:
+                observed = client.entities.list(entity_list_name="test", compact=True)
+        self.assertEqual(2, len(observed))
+        for i, o in enumerate(observed):
+            with self.subTest(i):
+                self.assertIsInstance(o, Record)
+                self.assertNotIsInstance(o, Entity)
+                self.assertFalse(hasattr(o, "__dict__"))
+                # Datetimes are parsed when first read.
+                self.assertIsInstance(o._createdAt, str)
+                self.assertIsInstance(o.createdAt, datetime)
+                self.assertIsInstance(o._createdAt, datetime)
+                self.assertIsInstance(o.currentVersion, Record)
+                self.assertEqual(Entity(**fixture[i]), o.to_model())
+
     def test_create__ok(self):
         """Should return an Entity object."""
         fixture = entities_data.test_entities
@@ -120,6 +144,71 @@ class TestEntities(TestCase):
                         err.exception.args[0],
                     )
 
+    def test_merge__concurrent_updates_and_deletes(self):
+        """Should apply updates and deletes concurrently, collecting results in order."""
+        source = [{"label": f"L{i}", "n": f"{i}!"} for i in range(20)]
+        target = [
+            {"__id": f"id{i}", "__system": {"version": 1}, "label": f"L{i}", "n": str(i)}
+            for i in range(30)
+        ]
+        with (
+            patch.object(es, "get_table", return_value={"value": target}),
+            patch.object(es, "update", side_effect=lambda **kw: kw["uuid"]) as update,
+            patch.object(es, "delete", return_value=True) as delete,
+        ):
+            with Client() as client:
+                observed = client.entities.merge(
+                    data=source,
+                    entity_list_name="test",
+                    add_new_properties=False,
+                    delete_not_matched=True,
+                    max_workers=4,
+                )
+        self.assertEqual(20, update.call_count)
+        self.assertEqual(10, delete.call_count)
+        self.assertEqual(list(observed.to_update.keys()), list(observed.updated.keys()))
+        self.assertEqual([f"id{i}" for i in range(20)], list(observed.updated.values()))
+        self.assertEqual(list(observed.to_delete.keys()), list(observed.deleted.keys()))
+        self.assertEqual({}, observed.errors)
+
+    def test_merge__errors_captured_or_raised(self):
+        """Should record per-Entity errors, or raise the first one if raise_errors."""
+        source = [{"label": f"L{i}", "n": f"{i}!"} for i in range(6)]
+        target = [
+            {"__id": f"id{i}", "__system": {"version": 1}, "label": f"L{i}", "n": str(i)}
+            for i in range(6)
+        ]
+
+        def update(**kwargs):
+            if kwargs["uuid"] in {"id1", "id4"}:
+                raise PyODKError(f"failed: {kwargs['uuid']}")
+            return kwargs["uuid"]
+
+        with (
+            patch.object(es, "get_table", return_value={"value": target}),
+            patch.object(es, "update", side_effect=update),
+            Client() as client,
+        ):
+            for workers in (1, 3):
+                with self.subTest(workers=workers):
+                    observed = client.entities.merge(
+                        data=source,
+                        entity_list_name="test",
+                        add_new_properties=False,
+                        max_workers=workers,
+                        raise_errors=False,
+                    )
+                    self.assertEqual([("L1",), ("L4",)], list(observed.errors.keys()))
+                    self.assertEqual(4, len(observed.updated))
+                    with self.assertRaises(PyODKError) as err:
+                        client.entities.merge(
+                            data=source,
+                            entity_list_name="test",
+                            add_new_properties=False,
+                            max_workers=workers,
+                        )
+                    self.assertEqual("failed: id1", err.exception.args[0])
+
 
 class TestPrepDataForMerge(TestCase):
     def test_noop__source_same_as_target(self):
@@ -1,3 +1,4 @@
+import json
 from unittest import TestCase
 from unittest.mock import MagicMock, patch
 
@@ -16,7 +17,7 @@ class TestEntityLists(TestCase):
         fixture = entity_lists_data.test_entity_lists
         with patch.object(Session, "request") as mock_session:
             mock_session.return_value.status_code = 200
-            mock_session.return_value.json.return_value = fixture
+            mock_session.return_value.content = json.dumps(fixture).encode()
             with Client() as client:
                 observed = client.entity_lists.list()
         self.assertEqual(3, len(observed))
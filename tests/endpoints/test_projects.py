@@ -1,3 +1,4 @@
+import json
 from collections.abc import Callable
 from dataclasses import dataclass
 from functools import wraps
@@ -63,7 +64,9 @@ class TestProjects(TestCase):
         fixture = projects_data.test_projects
         with patch.object(Session, "request") as mock_session:
             mock_session.return_value.status_code = 200
-            mock_session.return_value.json.return_value = fixture["response_data"]
+            mock_session.return_value.content = json.dumps(
+                fixture["response_data"]
+            ).encode()
             client = Client()
             observed = client.projects.list()
         self.assertEqual(2, len(observed))
@@ -147,7 +150,9 @@ class TestProjectAppUsers(TestCase):
         fixture = projects_data.project_app_users
         with patch.object(Session, "request") as mock_session:
             mock_session.return_value.status_code = 200
-            mock_session.return_value.json.return_value = fixture["response_data"]
+            mock_session.return_value.content = json.dumps(
+                fixture["response_data"]
+            ).encode()
             client = Client()
             observed = ProjectAppUserService(session=client.session).list(project_id=1)
         self.assertEqual(2, len(observed))
@@ -1,15 +1,24 @@
+import copy
+import hashlib
+import json
 from collections.abc import Callable
 from dataclasses import dataclass
+from datetime import date, datetime, timezone
 from functools import wraps
 from unittest import TestCase
 from unittest.mock import MagicMock, patch
 
+from pydantic import ValidationError
+from pyodk._endpoints.bases import ModelList
 from pyodk._endpoints.submission_attachments import SubmissionAttachmentService
 from pyodk._endpoints.submissions import Submission
 from pyodk._utils.session import Session
 from pyodk.client import Client
+from pyodk.errors import AttachmentUploadError, PyODKError
+from requests.exceptions import HTTPError
 
 from tests.resources import CONFIG_DATA, submissions_data
+from tests.utils.utils import get_temp_dir
 
 
 @dataclass
@@ -48,7 +57,9 @@ class TestSubmissions(TestCase):
         fixture = submissions_data.test_submissions
         with patch.object(Session, "request") as mock_session:
             mock_session.return_value.status_code = 200
-            mock_session.return_value.json.return_value = fixture["response_data"]
+            mock_session.return_value.content = json.dumps(
+                fixture["response_data"]
+            ).encode()
             with Client() as client:
                 observed = client.submissions.list(form_id="range")
         self.assertEqual(4, len(observed))
@@ -56,6 +67,151 @@ class TestSubmissions(TestCase):
             with self.subTest(i):
                 self.assertIsInstance(o, Submission)
 
+    def test_list__trusted(self):
+        """Should return a ModelList which validates each Submission when accessed."""
+        fixture = submissions_data.test_submissions
+        data = [*fixture["response_data"], {"instanceId": "bad"}]
+        with patch.object(Session, "request") as mock_session:
+            mock_session.return_value.status_code = 200
+            mock_session.return_value.json.return_value = data
+            mock_session.return_value.content = json.dumps(data).encode()
+            with Client(trust_responses=True) as client:
+                observed = client.submissions.list(form_id="range")
+                with self.assertRaises(ValidationError):
+                    client.submissions.list(form_id="range", trusted=False)
+        self.assertIsInstance(observed, ModelList)
+        self.assertEqual(5, len(observed))
+        self.assertIs(observed[0], observed[0])
+        expected = [Submission(**r) for r in fixture["response_data"]]
+        self.assertEqual(expected, observed[:4])
+        with self.assertRaises(ValidationError):
+            observed[-1]
+        with self.assertRaises(ValidationError):
+            list(observed)
+
+    def test_export(self):
+        """Should stream the export to the file, with the export options."""
+        with patch.object(Session, "request") as mock_session:
+            mock_session.return_value.status_code = 200
+            mock_session.return_value.headers = {"Content-Length": "3"}
+            mock_session.return_value.iter_content.return_value = [b"a", b"bc"]
+            with Client() as client, get_temp_dir() as tmp:
+                observed = client.submissions.export(
+                    path=tmp / "a.zip", form_id="a", split_select_multiples=True
+                )
+                self.assertEqual(tmp / "a.zip", observed)
+                self.assertEqual(b"abc", observed.read_bytes())
+        kwargs = mock_session.call_args.kwargs
+        self.assertTrue(kwargs["url"].endswith("forms/a/submissions.csv.zip"))
+        self.assertEqual(
+            {"attachments": "false", "splitSelectMultiples": "true"}, kwargs["params"]
+        )
+        self.assertTrue(kwargs["stream"])
+
+    def test_download_attachments(self):
+        """Should download each file, skip unchanged ones, and record errors."""
+        photo = b"photo"
+        etag = f'"{hashlib.md5(photo).hexdigest()}"'  # noqa: S324
+
+        def respond(method, url, headers, **kwargs):
+            response = MagicMock(headers={})
+            if url.endswith("b.jpg"):
+                response.status_code = 500
+                response.raise_for_status.side_effect = HTTPError()
+            elif headers.get("If-None-Match") == etag:
+                response.status_code = 304
+            else:
+                response.status_code = 200
+                response.iter_content.return_value = [photo]
+            return response
+
+        items = [("uuid:1", "a.jpg"), ("uuid:2", "b.jpg"), ("uuid:3", "c.jpg")]
+        with (
+            patch.object(Session, "request", side_effect=respond),
+            Client() as client,
+            get_temp_dir() as tmp,
+        ):
+            (tmp / "uuid_3").mkdir()
+            (tmp / "uuid_3" / "c.jpg").write_bytes(photo)
+            observed = client.submissions.download_attachments(
+                attachments=iter(items), directory=tmp, form_id="a", max_workers=2
+            )
+            self.assertEqual({items[0]: tmp / "uuid_1" / "a.jpg"}, observed.downloaded)
+            self.assertEqual(photo, (tmp / "uuid_1" / "a.jpg").read_bytes())
+            self.assertEqual({items[2]: tmp / "uuid_3" / "c.jpg"}, observed.unchanged)
+            self.assertEqual([items[1]], list(observed.errors))
+
+    def test_download_attachments__same_file_name(self):
+        """Should give each attachment its own file, if their safe names are the same."""
+
+        def respond(method, url, **kwargs):
+            response = MagicMock(headers={}, status_code=200)
+            response.iter_content.return_value = [url.rsplit("/", 1)[-1].encode()]
+            return response
+
+        items = [
+            ("uuid:1", "a?.jpg"),
+            ("uuid:1", "a_.jpg"),
+            ("uuid:1", "A_.jpg"),
+            ("uuid:1", "a?.jpg"),
+        ]
+        with (
+            patch.object(Session, "request", side_effect=respond) as mock_session,
+            Client() as client,
+            get_temp_dir() as tmp,
+        ):
+            observed = client.submissions.download_attachments(
+                attachments=items, directory=tmp, form_id="a", max_workers=2
+            )
+            expected = {
+                items[0]: tmp / "uuid_1" / "a_.jpg",
+                items[1]: tmp / "uuid_1" / "a_ (2).jpg",
+                items[2]: tmp / "uuid_1" / "A_ (3).jpg",
+            }
+            self.assertEqual(expected, observed.downloaded)
+            self.assertEqual(
+                [b"a%3F.jpg", b"a_.jpg", b"A_.jpg"],
+                [p.read_bytes() for p in expected.values()],
+            )
+        self.assertEqual(3, mock_session.call_count)
+
+    def test_get_table__typed(self):
+        """Should convert values using the form schema, which is cached by version."""
+        table = submissions_data.test_table
+        form = {"xmlFormId": "my_form", "version": "1", "hash": "abc"}
+
+        def respond(method, url, **kwargs):
+            response = MagicMock(status_code=200)
+            if url.endswith("$metadata"):
+                response.content = submissions_data.test_metadata.encode()
+            elif url.endswith(".svc/Submissions"):
+                response.json.side_effect = lambda: copy.deepcopy(table)
+                response.iter_content.return_value = [json.dumps(table).encode()]
+            else:
+                response.json.return_value = form
+            return response
+
+        with patch.object(Session, "request", side_effect=respond) as mock_session:
+            with Client() as client:
+                rows = client.submissions.get_table(form_id="my_form", typed=True)
+                columns = client.submissions.get_table(
+                    form_id="my_form", typed=True, columnar=True
+                )
+                form["version"] = "2"
+                client.submissions.get_table_schema(form_id="my_form")
+        urls = [c.kwargs["url"] for c in mock_session.call_args_list]
+        self.assertEqual(2, sum(u.endswith("$metadata") for u in urls))
+        row = rows["value"][0]
+        self.assertEqual(
+            datetime(2021, 5, 10, 20, 51, 51, 404000, tzinfo=timezone.utc),
+            row["__system"]["submissionDate"],
+        )
+        self.assertEqual(date(1985, 3, 1), row["birthday"])
+        columns = columns["value"]
+        self.assertEqual([-1.3], list(columns["location/latitude"]))
+        self.assertEqual([4.5], list(columns["location/accuracy"]))
+        self.assertEqual([36], list(columns["age"]))
+
     def test_get__ok(self):
         """Should return a Submission object."""
         fixture = submissions_data.test_submissions
@@ -120,6 +276,80 @@ class TestSubmissions(TestCase):
                 self.assertEqual(1, ctx.sa_upload.call_count)
                 self.assertEqual(1, ctx.sa_list.call_count)
 
+    @get_mock_context
+    def test_create__with_attachments__partial_failure(self, ctx: MockContext):
+        """Should upload all attachments, then raise an error naming the failed ones."""
+        fixture = submissions_data.test_submissions
+        ctx.sa_upload.side_effect = lambda file_path, **kwargs: {
+            "a.jpg": True,
+            "b.jpg": False,
+            "c.jpg": True,
+        }[file_path]
+        with patch.object(Session, "request") as mock_session:
+            mock_session.return_value.status_code = 200
+            mock_session.return_value.json.return_value = fixture["response_data"][1]
+            with Client() as client, self.assertRaises(AttachmentUploadError) as err:
+                client.submissions.create(
+                    project_id=fixture["project_id"],
+                    form_id=fixture["form_id"],
+                    xml=submissions_data.upload_file_xml.format(
+                        iid=fixture["response_data"][1]["instanceId"],
+                        file_name="a.jpg",
+                    ),
+                    attachments=["a.jpg", "b.jpg", "c.jpg"],
+                    max_workers=2,
+                )
+        self.assertEqual(["a.jpg", "c.jpg"], err.exception.uploaded)
+        self.assertEqual(["b.jpg"], list(err.exception.failed))
+        self.assertEqual(
+            fixture["response_data"][1]["instanceId"], err.exception.instance_id
+        )
+        self.assertEqual(3, ctx.sa_upload.call_count)
+        self.assertEqual(0, ctx.sa_list.call_count)
+
+    @get_mock_context
+    def test_create__with_attachments__duplicate_names(self, ctx: MockContext):
+        """Should raise an error before creating the Submission, for duplicate names."""
+        fixture = submissions_data.test_submissions
+        for attachments in (["a.jpg", "a.jpg"], ["/x/a.jpg", "/y/a.jpg", "b.jpg"]):
+            with (
+                self.subTest(attachments=attachments),
+                patch.object(Session, "request") as mock_session,
+                Client() as client,
+                self.assertRaises(PyODKError) as err,
+            ):
+                client.submissions.create(
+                    project_id=fixture["project_id"],
+                    form_id=fixture["form_id"],
+                    xml=submissions_data.test_xml,
+                    attachments=attachments,
+                )
+            self.assertIn("a.jpg", err.exception.args[0])
+            self.assertNotIn("b.jpg", err.exception.args[0])
+            mock_session.assert_not_called()
+        self.assertEqual(0, ctx.sa_upload.call_count)
+
+    @get_mock_context
+    def test_create__with_attachments__no_list(self, ctx: MockContext):
+        """Should list the uploaded attachments without requesting them."""
+        fixture = submissions_data.test_submissions
+        with patch.object(Session, "request") as mock_session:
+            mock_session.return_value.status_code = 200
+            mock_session.return_value.json.return_value = fixture["response_data"][1]
+            with Client() as client:
+                observed = client.submissions.create(
+                    project_id=fixture["project_id"],
+                    form_id=fixture["form_id"],
+                    xml=submissions_data.upload_file_xml.format(
+                        iid=fixture["response_data"][1]["instanceId"],
+                        file_name="a.jpg",
+                    ),
+                    attachments=["/some/path/a.jpg"],
+                    list_attachments=False,
+                )
+        self.assertEqual(["a.jpg"], [a.name for a in observed.attachments])
+        self.assertEqual(0, ctx.sa_list.call_count)
+
     def test__put__ok(self):
         """Should return a Submission object."""
         fixture = submissions_data.test_submissions
@@ -165,3 +395,65 @@ class TestSubmissions(TestCase):
                     review_state="edited",
                 )
                 self.assertIsInstance(observed, Submission)
+
+    def test_iter_table__follows_next_link(self):
+        """Should yield rows from each page, requesting the nextLink until absent."""
+        next_link = "https://example.com/v1/projects/8/forms/range.svc/Submissions?a=1"
+        pages = [
+            {"value": [{"__id": "a"}, {"__id": "b"}], "@odata.nextLink": next_link},
+            {"value": [{"__id": "c"}]},
+        ]
+        with patch.object(Session, "request") as mock_session:
+            mock_session.return_value.status_code = 200
+            mock_session.return_value.iter_content.side_effect = [
+                [json.dumps(p).encode()] for p in pages
+            ]
+            with Client() as client:
+                observed = client.submissions.iter_table(form_id="range", page_size=2)
+                self.assertEqual(0, mock_session.call_count)
+                self.assertEqual(["a", "b", "c"], [r["__id"] for r in observed])
+        self.assertEqual(2, mock_session.call_count)
+        first, second = mock_session.call_args_list
+        self.assertEqual({"$top": 2}, first.kwargs["params"])
+        self.assertTrue(first.kwargs["stream"])
+        self.assertEqual(next_link, second.kwargs["url"])
+        self.assertEqual({}, second.kwargs["params"])
+
+    def test_iter_table__next_link_full_last_page(self):
+        """Should stop at a full page without a nextLink, after following a nextLink."""
+        next_link = "https://example.com/v1/projects/8/forms/range.svc/Submissions?a=1"
+        pages = [
+            {"value": [{"__id": "a"}, {"__id": "b"}], "@odata.nextLink": next_link},
+            {"value": [{"__id": "c"}, {"__id": "d"}]},
+        ]
+        with patch.object(Session, "request") as mock_session:
+            mock_session.return_value.status_code = 200
+            mock_session.return_value.iter_content.side_effect = [
+                [json.dumps(p).encode()] for p in pages
+            ]
+            with Client() as client:
+                observed = list(
+                    client.submissions.iter_table(form_id="range", page_size=2)
+                )
+        self.assertEqual(["a", "b", "c", "d"], [r["__id"] for r in observed])
+        self.assertEqual(2, mock_session.call_count)
+
+    def test_iter_table__skip_paging_without_next_link(self):
+        """Should increment $skip while full pages are returned and no nextLink."""
+        pages = [
+            {"value": [{"__id": "a"}, {"__id": "b"}]},
+            {"value": [{"__id": "c"}, {"__id": "d"}]},
+            {"value": []},
+        ]
+        with patch.object(Session, "request") as mock_session:
+            mock_session.return_value.status_code = 200
+            mock_session.return_value.iter_content.side_effect = [
+                [json.dumps(p).encode()] for p in pages
+            ]
+            with Client() as client:
+                observed = list(
+                    client.submissions.iter_table(form_id="range", page_size=2)
+                )
+        self.assertEqual(4, len(observed))
+        skips = [c.kwargs["params"].get("$skip") for c in mock_session.call_args_list]
+        self.assertEqual([None, 2, 4], skips)
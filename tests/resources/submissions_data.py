@@ -45,6 +45,78 @@ test_xml = """
   <age>36</age>
 </data>
 """
+test_metadata = """<?xml version="1.0" encoding="UTF-8"?>
+<edmx:Edmx xmlns:edmx="http://docs.oasis-open.org/odata/ns/edmx" Version="4.0">
+  <edmx:DataServices>
+    <Schema xmlns="http://docs.oasis-open.org/odata/ns/edm" Namespace="org.opendatakit.submission">
+      <ComplexType Name="metadata">
+        <Property Name="submissionDate" Type="Edm.DateTimeOffset"/>
+        <Property Name="submitterId" Type="Edm.String"/>
+        <Property Name="attachmentsPresent" Type="Edm.Int64"/>
+        <Property Name="reviewState" Type="org.opendatakit.submission.ReviewState"/>
+      </ComplexType>
+      <EnumType Name="ReviewState">
+        <Member Name="hasIssues"/>
+      </EnumType>
+    </Schema>
+    <Schema xmlns="http://docs.oasis-open.org/odata/ns/edm" Namespace="org.opendatakit.user.my_form">
+      <EntityType Name="Submissions">
+        <Key><PropertyRef Name="__id"/></Key>
+        <Property Name="__id" Type="Edm.String"/>
+        <Property Name="__system" Type="org.opendatakit.submission.metadata"/>
+        <Property Name="meta" Type="org.opendatakit.user.my_form.meta"/>
+        <Property Name="name" Type="Edm.String"/>
+        <Property Name="age" Type="Edm.Int64"/>
+        <Property Name="height" Type="Edm.Decimal"/>
+        <Property Name="birthday" Type="Edm.Date"/>
+        <Property Name="location" Type="Edm.GeographyPoint"/>
+        <Property Name="children" Type="org.opendatakit.user.my_form.children"/>
+      </EntityType>
+      <EntityType Name="Submissions.children.child">
+        <Key><PropertyRef Name="__id"/></Key>
+        <Property Name="__id" Type="Edm.String"/>
+        <Property Name="__Submissions-id" Type="Edm.String"/>
+        <Property Name="child_age" Type="Edm.Int64"/>
+      </EntityType>
+      <ComplexType Name="meta">
+        <Property Name="instanceID" Type="Edm.String"/>
+      </ComplexType>
+      <ComplexType Name="children">
+        <NavigationProperty Name="child" Type="Collection(org.opendatakit.user.my_form.Submissions.children.child)"/>
+      </ComplexType>
+      <EntityContainer Name="my_form">
+        <EntitySet Name="Submissions" EntityType="org.opendatakit.user.my_form.Submissions"/>
+        <EntitySet Name="Submissions.children.child" EntityType="org.opendatakit.user.my_form.Submissions.children.child"/>
+      </EntityContainer>
+    </Schema>
+  </edmx:DataServices>
+</edmx:Edmx>
+"""
+test_table = {
+    "@odata.context": "https://example.com/v1/projects/8/forms/my_form.svc/$metadata#Submissions",
+    "value": [
+        {
+            "__id": "uuid:85cb9aff-005e-4edd-9739-dc9c1a829c44",
+            "__system": {
+                "submissionDate": "2021-05-10T20:51:51.404Z",
+                "submitterId": "28",
+                "attachmentsPresent": 0,
+                "reviewState": None,
+            },
+            "meta": {"instanceID": "uuid:85cb9aff-005e-4edd-9739-dc9c1a829c44"},
+            "name": "Alice",
+            "age": 36,
+            "height": 1.65,
+            "birthday": "1985-03-01",
+            "location": {
+                "type": "Point",
+                "coordinates": [36.8, -1.3, 1700],
+                "properties": {"accuracy": 4.5},
+            },
+            "children@odata.navigationLink": "Submissions('uuid:85cb9aff')/children/child",
+        },
+    ],
+}
 upload_file_xml = """
 <data id="upload_file" version="1">
   <meta><instanceID>{iid}</instanceID></meta>
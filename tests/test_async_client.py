@@ -0,0 +1,133 @@
+import asyncio
+import json
+import threading
+import time
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+
+from pyodk._endpoints.submissions import Submission
+from pyodk._utils.session import Session
+from pyodk.async_client import AsyncClient, AsyncRows
+
+from tests.resources import CONFIG_DATA, submissions_data
+
+
+@patch("pyodk._utils.session.Auth.login", MagicMock())
+@patch("pyodk._utils.config.read_config", MagicMock(return_value=CONFIG_DATA))
+class TestAsyncClient(TestCase):
+    def test_service_method__ok(self):
+        """Should return the same object as the synchronous service method."""
+        fixture = submissions_data.test_submissions
+
+        async def main():
+            async with AsyncClient() as client:
+                return await client.submissions.list(form_id="range")
+
+        with patch.object(Session, "request") as mock_session:
+            mock_session.return_value.status_code = 200
+            mock_session.return_value.content = json.dumps(
+                fixture["response_data"]
+            ).encode()
+            observed = asyncio.run(main())
+        self.assertEqual(4, len(observed))
+        for i, o in enumerate(observed):
+            with self.subTest(i):
+                self.assertIsInstance(o, Submission)
+
+    def test_service_method__gather_bounded(self):
+        """Should run concurrent calls, with no more than max_concurrency at once."""
+        fixture = submissions_data.test_submissions
+        in_flight, peak = 0, 0
+        lock = threading.Lock()
+
+        def request(*args, **kwargs):
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.01)
+            with lock:
+                in_flight -= 1
+            response = MagicMock(status_code=200)
+            response.json.return_value = fixture["response_data"][0]
+            return response
+
+        async def main():
+            async with AsyncClient(max_concurrency=3) as client:
+                return await asyncio.gather(
+                    *(
+                        client.submissions.get(form_id="range", instance_id=str(i))
+                        for i in range(12)
+                    )
+                )
+
+        with patch.object(Session, "request", side_effect=request):
+            observed = asyncio.run(main())
+        self.assertEqual(12, len(observed))
+        self.assertLessEqual(peak, 3)
+
+    def test_close__after_requests(self):
+        """Should close the session once requests in progress have finished, without
+        blocking the event loop."""
+        fixture = submissions_data.test_submissions
+        events = []
+
+        def request(*args, **kwargs):
+            time.sleep(0.2)
+            events.append("request")
+            response = MagicMock(status_code=200)
+            response.json.return_value = fixture["response_data"][0]
+            return response
+
+        async def tick():
+            while True:
+                events.append("tick")
+                await asyncio.sleep(0.01)
+
+        async def main():
+            client = await AsyncClient().open()
+            get = asyncio.create_task(
+                client.submissions.get(form_id="range", instance_id="a")
+            )
+            await asyncio.sleep(0.05)
+            ticker = asyncio.create_task(tick())
+            await client.close()
+            ticker.cancel()
+            return await get
+
+        with (
+            patch.object(Session, "request", side_effect=request),
+            patch.object(
+                Session, "__exit__", side_effect=lambda *a: events.append("close")
+            ),
+        ):
+            observed = asyncio.run(main())
+        self.assertIsInstance(observed, Submission)
+        self.assertEqual("close", events[-1])
+        self.assertLess(events.index("request"), events.index("close"))
+        self.assertGreater(events[: events.index("request")].count("tick"), 1)
+
+    def test_service_attribute__shared(self):
+        """Should read and write attributes on the wrapped service."""
+        client = AsyncClient()
+        client.submissions.default_form_id = "range"
+        self.assertEqual("range", client.client.submissions.default_form_id)
+        self.assertEqual("range", client.submissions.default_form_id)
+
+    def test_iter_table__async_rows(self):
+        """Should return an async iterator of the table rows."""
+        pages = [{"value": [{"__id": str(i)} for i in range(250)]}]
+
+        async def main():
+            async with AsyncClient() as client:
+                rows = await client.submissions.iter_table(form_id="range")
+                self.assertIsInstance(rows, AsyncRows)
+                return [r["__id"] async for r in rows]
+
+        with patch.object(Session, "request") as mock_session:
+            mock_session.return_value.status_code = 200
+            mock_session.return_value.iter_content.side_effect = [
+                [json.dumps(p).encode()] for p in pages
+            ]
+            observed = asyncio.run(main())
+        self.assertEqual([str(i) for i in range(250)], observed)
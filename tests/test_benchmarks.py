@@ -0,0 +1,31 @@
+from unittest import TestCase
+
+from tests.benchmarks import runner
+from tests.utils.utils import get_temp_dir
+
+
+class TestBenchmarks(TestCase):
+    def test_measure(self):
+        """Should time the function made by the benchmark setup."""
+        bench = runner.Benchmark(name="sum", setup=lambda size: lambda: sum(range(size)))
+        result = runner.measure(bench, 100)
+        self.assertEqual("sum[100]", result.name)
+        self.assertGreater(result.number, 1)
+        self.assertLessEqual(result.min, result.median)
+
+    def test_save_load_compare(self):
+        """Should save results as JSON, and compare the medians of two results."""
+        before = [
+            runner.Result("a", None, 1, 1, 1.0, 1.0, 1.0, 0.0),
+            runner.Result("b", 10, 1, 1, 2.0, 2.0, 2.0, 0.0),
+        ]
+        after = [runner.Result("a", None, 1, 1, 1.0, 1.5, 1.5, 0.0)]
+        with get_temp_dir() as tmp:
+            runner.save(before, tmp / "before.json")
+            runner.save(after, tmp / "after.json")
+            observed = runner.compare(
+                runner.load(tmp / "before.json"), runner.load(tmp / "after.json")
+            )
+        self.assertEqual(["a", "b"], [c.name for c in observed])
+        self.assertEqual(1.5, observed[0].ratio)
+        self.assertIsNone(observed[1].ratio)
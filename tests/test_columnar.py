@@ -0,0 +1,154 @@
+import json
+from datetime import datetime, timezone
+from unittest import TestCase, skipUnless
+from unittest.mock import MagicMock, patch
+
+from pyodk._utils import columnar
+from pyodk._utils.columnar import TableBuilder, read_columnar
+from pyodk._utils.session import Session
+from pyodk.client import Client
+from pyodk.errors import PyODKError
+
+from tests.resources import CONFIG_DATA
+
+np = columnar.get_numpy()
+
+ROWS = [
+    {
+        "__id": "uuid:1",
+        "age": 36,
+        "height": 1.5,
+        "consent": True,
+        "meta": {"instanceID": "uuid:1"},
+        "__system": {"submissionDate": "2025-01-02T03:04:05.678Z", "submitterId": 5},
+    },
+    {
+        "__id": "uuid:2",
+        "age": None,
+        "height": 2,
+        "consent": False,
+        "meta": {"instanceID": "uuid:2"},
+        "__system": {"submissionDate": "2025-01-03T00:00:00.000Z", "submitterId": 5},
+        "repeat": [{"a": 1}],
+    },
+    {"__id": "uuid:3", "age": 40},
+]
+DOCUMENT = {
+    "@odata.context": "https://example.com/v1/projects/1/forms/a.svc/$metadata",
+    "@odata.count": 3,
+    "value": ROWS,
+}
+
+
+def build(dtypes=None) -> dict:
+    builder = TableBuilder(dtypes=dtypes)
+    for row in ROWS:
+        builder.add(row)
+    return builder.build()
+
+
+class TestTableBuilder(TestCase):
+    @patch.object(columnar, "get_numpy", MagicMock(return_value=None))
+    def test_build__lists(self):
+        """Should make a list per column, flattening objects, with None for nulls."""
+        observed = build()
+        self.assertEqual(
+            [
+                "__id",
+                "age",
+                "height",
+                "consent",
+                "meta/instanceID",
+                "__system/submissionDate",
+                "__system/submitterId",
+                "repeat",
+            ],
+            list(observed),
+        )
+        self.assertEqual([36, None, 40], observed["age"])
+        self.assertEqual([True, False, None], observed["consent"])
+        self.assertEqual([None, [{"a": 1}], None], observed["repeat"])
+
+    @patch.object(columnar, "get_numpy", MagicMock(return_value=None))
+    def test_build__lists_typed(self):
+        """Should convert typed columns, with None for nulls."""
+        observed = build(dtypes={"age": "float", "__system/submissionDate": "datetime"})
+        self.assertEqual([36.0, None, 40.0], observed["age"])
+        self.assertEqual(
+            [
+                datetime(2025, 1, 2, 3, 4, 5, 678000, tzinfo=timezone.utc),
+                datetime(2025, 1, 3, tzinfo=timezone.utc),
+                None,
+            ],
+            observed["__system/submissionDate"],
+        )
+
+    @skipUnless(np is not None, "NumPy is not installed.")
+    def test_build__numpy(self):
+        """Should make a masked array per column, typed where the values allow."""
+        observed = build(dtypes={"__system/submissionDate": "datetime"})
+        self.assertEqual(np.int64, observed["age"].dtype)
+        self.assertEqual([False, True, False], observed["age"].mask.tolist())
+        self.assertEqual(np.float64, observed["height"].dtype)
+        self.assertEqual(np.bool_, observed["consent"].dtype)
+        self.assertEqual(object, observed["__id"].dtype)
+        self.assertEqual(
+            np.datetime64("2025-01-02T03:04:05.678"),
+            observed["__system/submissionDate"][0],
+        )
+        self.assertTrue(observed["__system/submissionDate"].mask[2])
+
+    def test_add__bad_value(self):
+        """Should raise an error if a typed column has a value of another type."""
+        builder = TableBuilder(dtypes={"__id": "int"})
+        with self.assertRaises(PyODKError) as err:
+            builder.add(ROWS[0])
+        self.assertIn("'__id'", err.exception.args[0])
+
+    def test_add__not_text_date(self):
+        """Should raise an error for a value which isn't text in a date column."""
+        for dtype in ("datetime", "date"):
+            builder = TableBuilder(dtypes={"d": dtype})
+            with self.subTest(dtype=dtype), self.assertRaises(PyODKError) as err:
+                builder.add({"d": 5})
+            self.assertIn("'d'", err.exception.args[0])
+
+    def test_add__int_not_truncated(self):
+        """Should raise an error for a float which isn't a whole number in an int column."""
+        builder = TableBuilder(dtypes={"age": "int"})
+        builder.add({"age": 36.0})
+        builder.add({"age": "37"})
+        with self.assertRaises(PyODKError) as err:
+            builder.add({"age": 2.7})
+        self.assertIn("2.7", err.exception.args[0])
+
+    def test_init__bad_dtype(self):
+        """Should raise an error if a column type is unknown."""
+        with self.assertRaises(PyODKError):
+            TableBuilder(dtypes={"age": "decimal"})
+
+    def test_read_columnar(self):
+        """Should return the OData document with the rows as columns."""
+        data = json.dumps(DOCUMENT).encode()
+        observed = read_columnar(data[i : i + 7] for i in range(0, len(data), 7))
+        self.assertEqual(3, observed["@odata.count"])
+        self.assertEqual(["uuid:1", "uuid:2", "uuid:3"], list(observed["value"]["__id"]))
+
+
+@patch("pyodk._utils.session.Auth.login", MagicMock())
+@patch("pyodk._utils.config.read_config", MagicMock(return_value=CONFIG_DATA))
+class TestGetTableColumnar(TestCase):
+    def test_get_table__columnar(self):
+        """Should stream the response, and return the rows as columns."""
+        with patch.object(Session, "request") as mock_session:
+            mock_session.return_value.status_code = 200
+            mock_session.return_value.iter_content.return_value = [
+                json.dumps(DOCUMENT).encode()
+            ]
+            with Client() as client:
+                observed = client.submissions.get_table(
+                    form_id="a", columnar=True, dtypes={"age": "int"}
+                )
+        self.assertTrue(mock_session.call_args.kwargs["stream"])
+        self.assertEqual(3, len(observed["value"]["age"]))
+        self.assertEqual(40, observed["value"]["age"][2])
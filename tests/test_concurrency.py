@@ -0,0 +1,75 @@
+import threading
+import time
+from unittest import TestCase
+
+from pyodk._utils.concurrency import map_bounded
+
+
+class TestMapBounded(TestCase):
+    def test_map_bounded__ordered(self):
+        """Should yield outcomes in input order, regardless of completion order."""
+        for workers in (1, 4):
+            with self.subTest(workers=workers):
+
+                def func(i):
+                    time.sleep((10 - i) / 1000)
+                    return i * 2
+
+                observed = list(map_bounded(func, range(10), max_workers=workers))
+                self.assertEqual(list(range(10)), [o.item for o in observed])
+                self.assertEqual([i * 2 for i in range(10)], [o.result for o in observed])
+
+    def test_map_bounded__errors_captured(self):
+        """Should capture errors per item, and continue with the other items."""
+
+        def func(i):
+            if i % 3 == 0:
+                raise ValueError(i)
+            return i
+
+        for workers in (1, 4):
+            with self.subTest(workers=workers):
+                observed = list(map_bounded(func, range(7), max_workers=workers))
+                self.assertEqual(7, len(observed))
+                errors = [o.item for o in observed if o.error is not None]
+                self.assertEqual([0, 3, 6], errors)
+                self.assertIsInstance(observed[3].error, ValueError)
+
+    def test_map_bounded__stop_on_error(self):
+        """Should not start more items after an error."""
+        started = []
+
+        def func(i):
+            started.append(i)
+            if i == 2:
+                raise ValueError(i)
+            return i
+
+        observed = list(map_bounded(func, range(100), stop_on_error=True))
+        self.assertEqual([0, 1, 2], [o.item for o in observed])
+        self.assertEqual([0, 1, 2], started)
+        observed = list(
+            map_bounded(
+                func, range(100), max_workers=2, max_in_flight=2, stop_on_error=True
+            )
+        )
+        # Items already in flight at the time of the error are finished.
+        self.assertEqual([2], [o.item for o in observed if o.error is not None])
+        self.assertLessEqual(len(observed), 2 + 1 + 2)
+
+    def test_map_bounded__in_flight_limit(self):
+        """Should not have more than max_in_flight items submitted and not yielded."""
+        lock = threading.Lock()
+        consumed = 0
+        peak = 0
+
+        def func(i):
+            nonlocal peak
+            with lock:
+                peak = max(peak, i + 1 - consumed)
+            return i
+
+        for _ in map_bounded(func, range(50), max_workers=3, max_in_flight=5):
+            with lock:
+                consumed += 1
+        self.assertLessEqual(peak, 5)
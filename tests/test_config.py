@@ -1,4 +1,5 @@
 import os
+from datetime import datetime, timezone
 from unittest import TestCase
 from unittest.mock import patch
 
@@ -67,6 +68,37 @@ class TestConfig(TestCase):
             config.write_cache(key="token", value="1234abcd", cache_path=path.as_posix())
             self.assertTrue(path.exists())
 
+    def test_write_cache__none_removes_key(self):
+        """Should remove the key from the cache data when the value is None."""
+        with get_temp_dir() as tmp:
+            path = tmp / "my_cache.toml"
+            config.write_cache(key="token", value="1234abcd", cache_path=path.as_posix())
+            config.write_cache(key="other", value="1", cache_path=path.as_posix())
+            config.write_cache(key="token", value=None, cache_path=path.as_posix())
+            self.assertEqual({"other": "1"}, config.read_toml(path=path))
+
+    def test_read_cache_token_expiry(self):
+        """Should return the token expiry time, or None if missing or invalid."""
+        cases = (
+            (
+                "2030-01-02T03:04:05.678Z",
+                datetime(2030, 1, 2, 3, 4, 5, 678000, timezone.utc),
+            ),
+            (
+                "2030-01-02T03:04:05+01:00",
+                datetime(2030, 1, 2, 2, 4, 5, tzinfo=timezone.utc),
+            ),
+            ("2030-01-02T03:04:05", datetime(2030, 1, 2, 3, 4, 5, tzinfo=timezone.utc)),
+            ("not a date", None),
+            (None, None),
+        )
+        for value, expected in cases:
+            with self.subTest(msg=value), get_temp_dir() as tmp:
+                path = (tmp / "my_cache.toml").as_posix()
+                config.write_cache(key="token", value="1234abcd", cache_path=path)
+                config.write_cache(key="token_expires_at", value=value, cache_path=path)
+                self.assertEqual(expected, config.read_cache_token_expiry(path))
+
     def test_objectify_config__error__missing_section(self):
         cfg = {"centrall": {}}
         with self.assertRaises(KeyError) as err:
@@ -0,0 +1,95 @@
+import copy
+from datetime import date, datetime, timezone
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from pyodk._utils.edmx import SchemaCache, make_row_converter, parse_metadata
+from pyodk.errors import PyODKError
+
+from tests.resources import submissions_data
+
+
+class TestParseMetadata(TestCase):
+    def test_parse_metadata(self):
+        """Should get the flattened column types of each table."""
+        observed = parse_metadata(submissions_data.test_metadata.encode())
+        self.assertEqual(
+            ["Submissions", "Submissions.children.child"], list(observed.tables)
+        )
+        self.assertEqual(
+            {
+                "__id": "Edm.String",
+                "__system/submissionDate": "Edm.DateTimeOffset",
+                "__system/submitterId": "Edm.String",
+                "__system/attachmentsPresent": "Edm.Int64",
+                "__system/reviewState": "org.opendatakit.submission.ReviewState",
+                "meta/instanceID": "Edm.String",
+                "name": "Edm.String",
+                "age": "Edm.Int64",
+                "height": "Edm.Decimal",
+                "birthday": "Edm.Date",
+                "location": "Edm.GeographyPoint",
+            },
+            observed.tables["Submissions"],
+        )
+        self.assertEqual(
+            "Edm.Int64", observed.tables["Submissions.children.child"]["child_age"]
+        )
+
+    def test_dtypes(self):
+        """Should get the columnar dtypes, skipping types without one (enums)."""
+        observed = parse_metadata(submissions_data.test_metadata).dtypes("Submissions")
+        self.assertEqual("datetime", observed["__system/submissionDate"])
+        self.assertEqual("float", observed["height"])
+        self.assertEqual("geopoint", observed["location"])
+        self.assertNotIn("__system/reviewState", observed)
+
+    def test_dtypes__unknown_table(self):
+        """Should raise an error if the table isn't in the schema."""
+        schema = parse_metadata(submissions_data.test_metadata)
+        with self.assertRaises(PyODKError):
+            schema.dtypes("Nope")
+
+    def test_parse_metadata__invalid(self):
+        """Should raise an error if the document isn't XML."""
+        with self.assertRaises(PyODKError):
+            parse_metadata(b"{}")
+
+
+class TestRowConverter(TestCase):
+    def test_row_converter(self):
+        """Should convert the datetimes and dates of a row, including nested ones."""
+        schema = parse_metadata(submissions_data.test_metadata)
+        convert = schema.row_converter("Submissions")
+        self.assertIs(convert, schema.row_converter("Submissions"))
+        row = copy.deepcopy(submissions_data.test_table["value"][0])
+        convert(row)
+        self.assertEqual(
+            datetime(2021, 5, 10, 20, 51, 51, 404000, tzinfo=timezone.utc),
+            row["__system"]["submissionDate"],
+        )
+        self.assertEqual(date(1985, 3, 1), row["birthday"])
+        self.assertEqual(36, row["age"])
+
+    def test_row_converter__missing(self):
+        """Should skip columns which are missing or null."""
+        convert = make_row_converter({"a/b": "datetime", "c": "date"})
+        self.assertEqual({"a": None}, convert({"a": None}))
+        self.assertEqual({"c": None}, convert({"c": None}))
+
+
+class TestSchemaCache(TestCase):
+    def test_get(self):
+        """Should load each key once, and drop the least recently used."""
+        cache = SchemaCache(max_entries=2)
+        load = MagicMock(side_effect=lambda: object())
+        first = cache.get("a", load)
+        self.assertIs(first, cache.get("a", load))
+        cache.get("b", load)
+        cache.get("a", load)
+        cache.get("c", load)  # Drops "b".
+        self.assertEqual(3, load.call_count)
+        self.assertIs(first, cache.get("a", load))
+        cache.get("b", load)
+        self.assertEqual(4, load.call_count)
+        self.assertEqual(2, len(cache))
@@ -0,0 +1,147 @@
+from unittest import TestCase
+
+from pyodk._endpoints.submission_attachments import SubmissionAttachmentService
+from pyodk.errors import PyODKError
+from pyodk.instrumentation import MetricsAggregator
+
+from tests.utils.fake_central import FakeCentral, odata_filter
+from tests.utils.utils import get_temp_dir
+
+
+class TestFakeCentral(TestCase):
+    """End-to-end checks of the Client against the fake Central server."""
+
+    def test_odata_filter(self):
+        """Should evaluate simple comparisons joined by 'and'."""
+        match = odata_filter("__system/version gt 1 and label eq 'it''s'")
+        self.assertTrue(match({"label": "it's", "__system": {"version": 2}}))
+        self.assertFalse(match({"label": "it's", "__system": {"version": 1}}))
+        self.assertFalse(match({"label": "other", "__system": {"version": 2}}))
+
+    def test_client__submissions(self):
+        """Should page through the submissions table and create a submission."""
+        with FakeCentral(submissions=25) as central, get_temp_dir() as tmp:
+            client = central.client(tmp)
+            with client:
+                forms = client.forms.list()
+                rows = list(
+                    client.submissions.iter_table(form_id=central.form_id, page_size=10)
+                )
+                table = client.submissions.get_table(
+                    form_id=central.form_id, filter="age le 50", count=True
+                )
+                created = client.submissions.create(
+                    xml="<data id='fake_form'><name>a</name>"
+                    "<meta><instanceID>uuid:1</instanceID></meta></data>",
+                    form_id=central.form_id,
+                )
+            self.assertEqual([central.form_id], [f.xmlFormId for f in forms])
+            self.assertEqual(25, len(rows))
+            self.assertEqual(len(table["value"]), table["@odata.count"])
+            self.assertTrue(all(r["age"] <= 50 for r in table["value"]))
+            self.assertEqual("uuid:1", created.instanceId)
+            self.assertEqual(4, central.stats.requests[("GET", "submissions_odata")])
+            self.assertEqual(1, central.stats.connections)
+
+    def test_client__iter_table__full_pages(self):
+        """Should read each row once, when the last page is full."""
+        with (
+            FakeCentral(submissions=20, entities=20) as central,
+            get_temp_dir() as tmp,
+            central.client(tmp) as client,
+        ):
+            submissions = list(
+                client.submissions.iter_table(form_id=central.form_id, page_size=10)
+            )
+            entities = list(
+                client.entities.iter_table(
+                    entity_list_name=central.entity_list_name, page_size=10
+                )
+            )
+        self.assertEqual(20, len({r["__id"] for r in submissions}))
+        self.assertEqual(20, len(submissions))
+        self.assertEqual(20, len({r["__id"] for r in entities}))
+        self.assertEqual(20, len(entities))
+
+    def test_client__merge(self):
+        """Should merge entities concurrently, with concurrent requests re-using
+        connections."""
+        data = [{"label": f"Entity {i}", "name": f"New {i}"} for i in range(40)]
+        data.append({"label": "Extra", "name": "x", "colour": "red"})
+        with FakeCentral(entities=50) as central, get_temp_dir() as tmp:
+            client = central.client(tmp, pool_maxsize=4)
+            with client:
+                merged = client.entities.merge(
+                    data,
+                    entity_list_name=central.entity_list_name,
+                    delete_not_matched=True,
+                    max_workers=4,
+                )
+                table = client.entities.get_table(
+                    entity_list_name=central.entity_list_name
+                )
+            self.assertEqual(40, len(merged.updated))
+            self.assertEqual(10, len(merged.deleted))
+            self.assertEqual(41, len(table["value"]))
+            self.assertEqual(
+                2,
+                next(r for r in table["value"] if r["label"] == "Entity 0")["__system"][
+                    "version"
+                ],
+            )
+            self.assertLessEqual(central.stats.connections, 4)
+
+    def test_client__retry(self):
+        """Should retry injected 429 and 503 errors, and report them in the metrics."""
+        metrics = MetricsAggregator()
+        with FakeCentral() as central, get_temp_dir() as tmp:
+            client = central.client(tmp, instruments=[metrics])
+            client.session.adapters["http://"].max_retries.backoff_factor = 0
+            with client:
+                client.projects.list()
+                central.fail_next = [429, 503]
+                projects = client.projects.list()
+            self.assertEqual(1, len(projects))
+            self.assertEqual(2, central.stats.injected_errors)
+            self.assertEqual(2, metrics.snapshot()["GET projects"]["retries"])
+
+    def test_client__retry_upload(self):
+        """Should re-send the whole attachment file when an upload is retried."""
+        for memory_map in (False, True):
+            with (
+                self.subTest(memory_map=memory_map),
+                FakeCentral() as central,
+                get_temp_dir() as tmp,
+            ):
+                client = central.client(tmp, memory_map_uploads=memory_map)
+                client.session.adapters["http://"].max_retries.backoff_factor = 0
+                photo = tmp / "a.jpg"
+                photo.write_bytes(bytes(range(256)) * 1000)
+                with client:
+                    central.add_submission(
+                        central.project_id, central.form_id, "uuid:1", {}
+                    )
+                    central.fail_next = [503]
+                    uploaded = SubmissionAttachmentService(session=client.session).upload(
+                        file_path=photo,
+                        project_id=central.project_id,
+                        form_id=central.form_id,
+                        instance_id="uuid:1",
+                    )
+                self.assertTrue(uploaded)
+                self.assertEqual(1, central.stats.injected_errors)
+                self.assertEqual(
+                    photo.read_bytes(), central.attachments["uuid:1"]["a.jpg"]
+                )
+
+    def test_client__error(self):
+        """Should raise an error for a rejected request."""
+        with FakeCentral(entities=1) as central, get_temp_dir() as tmp:
+            client = central.client(tmp)
+            with client, self.assertRaises(PyODKError) as err:
+                client.entities.create(
+                    label="a",
+                    data={"unknown": "1"},
+                    entity_list_name=central.entity_list_name,
+                )
+            self.assertIn("400", str(err.exception))
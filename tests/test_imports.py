@@ -0,0 +1,49 @@
+import subprocess
+import sys
+from unittest import TestCase
+
+from pyodk.client import Client
+
+from tests.resources import CONFIG_FILE
+
+# Modules which are slow to import, and only needed for some uses of pyodk.
+HEAVY = ("asyncio", "pydantic", "requests", "toml")
+
+
+def get_imported(code: str) -> set[str]:
+    """Run the code in a new interpreter, and get the modules it imported."""
+    code = f"import sys\n{code}\nprint('\\n'.join(sys.modules))"
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, check=True, text=True
+    )
+    return set(out.stdout.splitlines())
+
+
+class TestImports(TestCase):
+    def test_import_pyodk(self):
+        """Should not import the clients or their dependencies until they are used."""
+        observed = get_imported("import pyodk")
+        for module in (*HEAVY, "pyodk.client", "pyodk.async_client"):
+            with self.subTest(module=module):
+                self.assertNotIn(module, observed)
+
+    def test_client(self):
+        """Should only import a service's endpoint module when it is first used."""
+        code = (
+            "from pyodk import Client\n"
+            f"client = Client(config_path={CONFIG_FILE.as_posix()!r})\n"
+        )
+        observed = get_imported(code)
+        for module in ("asyncio", "pydantic", "pyodk._endpoints.projects"):
+            with self.subTest(module=module):
+                self.assertNotIn(module, observed)
+        observed = get_imported(f"{code}client.projects")
+        self.assertIn("pyodk._endpoints.projects", observed)
+        self.assertNotIn("pyodk._endpoints.entities", observed)
+
+    def test_client__service_cached(self):
+        """Should create each service once, with the client's project ID."""
+        client = Client(config_path=CONFIG_FILE.as_posix(), project_id=7)
+        self.assertIs(client.forms, client.forms)
+        self.assertEqual(7, client.forms.default_project_id)
+        self.assertIs(client.session, client.forms.session)
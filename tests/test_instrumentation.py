@@ -0,0 +1,149 @@
+import socket
+import threading
+from http.server import ThreadingHTTPServer
+from unittest import TestCase
+
+from pyodk.instrumentation import MetricsAggregator, RequestEvent
+from requests.exceptions import ConnectionError
+
+from tests.test_session import KeepAliveHandler, get_session
+
+
+def get_event(**kwargs) -> RequestEvent:
+    event = {
+        "method": "GET",
+        "url": "https://example.com/v1/projects/1",
+        "template": "projects/{project_id}",
+        "status": 200,
+        "request_bytes": 0,
+        "response_bytes": 10,
+        "duration": 0.02,
+        "ttfb": 0.01,
+    }
+    event.update(kwargs)
+    return RequestEvent(**event)
+
+
+class TestMetricsAggregator(TestCase):
+    def test_snapshot(self):
+        """Should total the events per method and URL template."""
+        metrics = MetricsAggregator()
+        for duration in (0.02, 0.02, 0.02, 3.0):
+            metrics(get_event(duration=duration))
+        metrics(get_event(status=404))
+        metrics(get_event(method="POST", template="projects", duration=0.3, retries=2))
+        metrics(get_event(method="POST", template="projects", status=None))
+        observed = metrics.snapshot()
+        self.assertEqual(["GET projects/{project_id}", "POST projects"], list(observed))
+        get = observed["GET projects/{project_id}"]
+        self.assertEqual(5, get["requests"])
+        self.assertEqual({200: 4, 404: 1}, get["statuses"])
+        self.assertEqual(50, get["response_bytes"])
+        self.assertEqual(0.025, get["duration_p50"])
+        self.assertEqual(3.0, get["duration_max"])
+        self.assertAlmostEqual(0.616, get["duration_mean"])
+        post = observed["POST projects"]
+        self.assertEqual(1, post["errors"])
+        self.assertEqual(2, post["retries"])
+        metrics.reset()
+        self.assertEqual({}, metrics.snapshot())
+
+    def test_to_prometheus(self):
+        """Should format the metrics as Prometheus text."""
+        metrics = MetricsAggregator(buckets=(0.1, 1.0))
+        metrics(get_event(duration=0.05))
+        metrics(get_event(duration=0.5, status=500))
+        metrics(get_event(duration=5, status=None, template='a"b'))
+        observed = metrics.to_prometheus().splitlines()
+        labels = 'method="GET",endpoint="projects/{project_id}"'
+        expected = (
+            f'pyodk_requests_total{{{labels},status="200"}} 1',
+            f'pyodk_requests_total{{{labels},status="500"}} 1',
+            'pyodk_requests_total{method="GET",endpoint="a\\"b",status="error"} 1',
+            f"pyodk_response_bytes_total{{{labels}}} 20",
+            f'pyodk_request_duration_seconds_bucket{{{labels},le="0.1"}} 1',
+            f'pyodk_request_duration_seconds_bucket{{{labels},le="1.0"}} 2',
+            f'pyodk_request_duration_seconds_bucket{{{labels},le="+Inf"}} 2',
+            f"pyodk_request_duration_seconds_count{{{labels}}} 2",
+            "# TYPE pyodk_request_duration_seconds histogram",
+        )
+        for line in expected:
+            with self.subTest(msg=line):
+                self.assertIn(line, observed)
+
+
+class TestSessionInstruments(TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), KeepAliveHandler)
+        thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        thread.start()
+        self.base_url = f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_send__event(self):
+        """Should emit an event with the URL template for each request."""
+        events = []
+        with get_session(base_url=self.base_url, instruments=[events.append]) as s:
+            url = s.urlformat(
+                "projects/{project_id}/forms/{form_id}", project_id=1, form_id="a b"
+            )
+            s.get(url, params={"a": 1})
+            s.get("projects")
+        self.assertEqual(2, len(events))
+        event = events[0]
+        self.assertEqual("GET", event.method)
+        self.assertEqual(f"{self.base_url}/v1/projects/1/forms/a%20b?a=1", event.url)
+        self.assertEqual("projects/{project_id}/forms/{form_id}", event.template)
+        self.assertEqual(200, event.status)
+        self.assertEqual(0, event.request_bytes)
+        self.assertEqual(2, event.response_bytes)
+        self.assertEqual(0, event.retries)
+        self.assertGreater(event.ttfb, 0.0)
+        self.assertGreaterEqual(event.duration, event.ttfb)
+        self.assertEqual("projects", events[1].template)
+
+    def test_send__event__stream(self):
+        """Should emit the event for a streamed response when it is closed."""
+        events = []
+        with get_session(base_url=self.base_url, instruments=[events.append]) as s:
+            response = s.get("projects", stream=True)
+            self.assertEqual([], events)
+            with response:
+                response.content  # noqa: B018
+            response.close()
+        self.assertEqual(1, len(events))
+        self.assertEqual(2, events[0].response_bytes)
+
+    def test_send__event__error(self):
+        """Should emit an event if the request fails, and raise the error."""
+        events = []
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            base_url = f"http://127.0.0.1:{sock.getsockname()[1]}"
+        with (
+            get_session(base_url=base_url, instruments=[events.append]) as s,
+            self.assertRaises(ConnectionError),
+        ):
+            s.adapters["http://"].max_retries.total = 0
+            s.get("projects")
+        self.assertEqual(1, len(events))
+        self.assertIsNone(events[0].status)
+        self.assertIsInstance(events[0].error, ConnectionError)
+
+    def test_send__instrument_error(self):
+        """Should log an error raised by an instrument, and still return the response."""
+
+        def broken(event):
+            raise ValueError("broken")
+
+        metrics = MetricsAggregator()
+        with (
+            get_session(base_url=self.base_url, instruments=[broken, metrics]) as s,
+            self.assertLogs("pyodk.instrumentation", "WARNING"),
+        ):
+            response = s.get("projects")
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(1, metrics.snapshot()["GET projects"]["requests"])
@@ -0,0 +1,57 @@
+import importlib
+import importlib.util
+import json
+from unittest import TestCase, skipUnless
+
+from pyodk._utils.json_codec import STDLIB, get_codec
+from pyodk.errors import PyODKError
+
+
+class TestGetCodec(TestCase):
+    def test_get_codec__auto(self):
+        """Should get the first codec which is installed."""
+        expected = "orjson" if importlib.util.find_spec("orjson") else None
+        observed = get_codec("auto")
+        if expected is not None:
+            self.assertEqual(expected, observed.name)
+        self.assertEqual(
+            {"a": [1, None]}, observed.loads(observed.dumps({"a": [1, None]}))
+        )
+
+    def test_get_codec__stdlib(self):
+        """Should encode to UTF-8 bytes, and reject NaN, as requests does."""
+        self.assertIs(STDLIB, get_codec("json"))
+        self.assertEqual(b'{"a": "\\u00e9"}', STDLIB.dumps({"a": "é"}))
+        with self.assertRaises(ValueError):
+            STDLIB.dumps(float("nan"))
+
+    def test_get_codec__unknown(self):
+        """Should raise an error if the codec name is unknown."""
+        with self.assertRaises(PyODKError):
+            get_codec("simplejson")
+
+    @skipUnless(importlib.util.find_spec("orjson"), "orjson is not installed.")
+    def test_get_codec__orjson_big_int(self):
+        """Should decode integers too large for orjson with the standard library."""
+        self.assertEqual({"a": 2**70}, get_codec("orjson").loads(b'{"a": %d}' % 2**70))
+
+    def test_get_codec__nan(self):
+        """Should reject NaN and Infinity with every codec, rather than send null."""
+        for name in ("json", "auto"):
+            codec = get_codec(name)
+            for value in (float("nan"), float("inf"), -float("inf")):
+                with self.subTest(codec=codec.name, value=value):
+                    with self.assertRaises(ValueError):
+                        codec.dumps({"a": [None, {"b": value}]})
+            self.assertEqual({"a": None}, codec.loads(codec.dumps({"a": None})))
+
+    def test_get_codec__stdlib_types(self):
+        """Should encode values the standard library can, e.g. numpy scalars."""
+        data, expected = {"big": 2**70}, {"big": 2**70}
+        if importlib.util.find_spec("numpy"):
+            numpy = importlib.import_module("numpy")
+            data["count"], expected["count"] = numpy.float64(2.0), 2.0
+        for name in ("json", "auto"):
+            codec = get_codec(name)
+            with self.subTest(codec=codec.name):
+                self.assertEqual(expected, json.loads(codec.dumps(data)))
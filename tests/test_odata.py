@@ -0,0 +1,84 @@
+import json
+from unittest import TestCase
+
+from pyodk._utils.odata import ODataStream
+from pyodk.errors import PyODKError
+
+DOCUMENT = {
+    "@odata.context": "https://example.com/v1/projects/1/forms/a.svc/$metadata",
+    "@odata.count": 1234567,
+    "value": [
+        {"__id": "uuid:1", "age": 36, "name": "Alice", "geo": [1.5, -2.25]},
+        {"__id": "uuid:2", "age": None, "name": "Bøb ✅", "nested": {"a": [1, {}]}},
+        {"__id": "uuid:3", "text": 'quote " and brace } and comma ,'},
+    ],
+    "@odata.nextLink": "https://example.com/v1/projects/1/forms/a.svc/Submissions?x=1",
+}
+
+
+def chunked(data: bytes, size: int) -> list[bytes]:
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+class TestODataStream(TestCase):
+    def test_iter__whole_document(self):
+        """Should yield each row, and collect the other top-level members."""
+        stream = ODataStream([json.dumps(DOCUMENT).encode()])
+        self.assertEqual(DOCUMENT["value"], list(stream))
+        self.assertEqual(
+            {k: v for k, v in DOCUMENT.items() if k != "value"}, stream.metadata
+        )
+
+    def test_iter__any_chunk_boundary(self):
+        """Should give the same result however the body is split into chunks."""
+        for indent in (None, 2):
+            data = json.dumps(DOCUMENT, indent=indent, ensure_ascii=False).encode()
+            for size in range(1, 40):
+                with self.subTest(indent=indent, size=size):
+                    stream = ODataStream(chunked(data, size))
+                    self.assertEqual(DOCUMENT["value"], list(stream))
+                    self.assertEqual(1234567, stream.metadata["@odata.count"])
+                    self.assertEqual(
+                        DOCUMENT["@odata.nextLink"], stream.metadata["@odata.nextLink"]
+                    )
+
+    def test_iter__rows_yielded_before_end_of_body(self):
+        """Should yield a row once its bytes have arrived, before the body ends."""
+        received = []
+
+        def chunks():
+            for c in chunked(json.dumps(DOCUMENT).encode(), 16):
+                received.append(c)
+                yield c
+
+        first = next(iter(ODataStream(chunks())))
+        self.assertEqual(DOCUMENT["value"][0], first)
+        self.assertLess(sum(len(c) for c in received), len(json.dumps(DOCUMENT)))
+
+    def test_iter__large_row(self):
+        """Should not decode a large row again for each small chunk it arrives in."""
+        row = {"__id": "uuid:1", "text": "a" * 1_000_000}
+        data = json.dumps({"value": [row]}).encode()
+        stream = ODataStream(chunked(data, 1024))
+        attempts = []
+        raw_decode = stream._decoder.raw_decode
+
+        def counted(text, pos):
+            attempts.append(pos)
+            return raw_decode(text, pos)
+
+        stream._decoder.raw_decode = counted
+        self.assertEqual([row], list(stream))
+        self.assertLess(len(attempts), 20)
+
+    def test_iter__empty(self):
+        """Should yield nothing for an empty object or an empty value array."""
+        for data in (b"{}", b'{"value": []}', b' {\n "value" : [ ] } '):
+            with self.subTest(data=data):
+                self.assertEqual([], list(ODataStream([data])))
+
+    def test_iter__invalid(self):
+        """Should raise an error if the document is not an OData JSON object."""
+        for data in (b"", b"[]", b'{"value": [{"a": 1}', b'{"value": [1 2]}'):
+            with self.subTest(data=data), self.assertRaises(PyODKError):
+                list(ODataStream(chunked(data, 3)))
@@ -0,0 +1,172 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import ClassVar
+from unittest import TestCase
+
+from pyodk.response_cache import (
+    CacheEntry,
+    DiskStore,
+    MemoryStore,
+    ResponseCache,
+)
+
+from tests.test_session import get_session
+from tests.utils.utils import get_temp_dir
+
+
+class ETagHandler(BaseHTTPRequestHandler):
+    """Serves a JSON document with an ETag, and records the requests received."""
+
+    protocol_version = "HTTP/1.1"
+    requests: ClassVar[list] = []
+    etag = '"v1"'
+
+    def reply(self, status: int, body: bytes) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        if self.path != "/v1/no-etag":
+            self.send_header("ETag", self.etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        type(self).requests.append((self.command, self.path, dict(self.headers)))
+        if self.headers["If-None-Match"] == self.etag:
+            self.reply(304, b"")
+        else:
+            self.reply(200, b'{"path": "' + self.path.encode() + b'"}')
+
+    def do_POST(self):
+        type(self).requests.append((self.command, self.path, dict(self.headers)))
+        self.rfile.read(int(self.headers["Content-Length"] or 0))
+        self.reply(200, b"{}")
+
+    def log_message(self, *args):
+        pass
+
+
+def get_entry(content: bytes = b"{}") -> CacheEntry:
+    return CacheEntry(
+        url="https://example.com", status=200, headers={}, content=content, stored_at=0
+    )
+
+
+class TestResponseCache(TestCase):
+    def setUp(self):
+        ETagHandler.requests = []
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), ETagHandler)
+        thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        thread.start()
+        self.base_url = f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_send__fresh(self):
+        """Should use a stored response without contacting the server, within the TTL."""
+        cache = ResponseCache(ttl=60)
+        with get_session(base_url=self.base_url, response_cache=cache) as session:
+            first = session.get("projects")
+            second = session.get("projects")
+            other = session.get("forms")
+        self.assertEqual(2, len(ETagHandler.requests))
+        self.assertEqual({"path": "/v1/projects"}, second.json())
+        self.assertEqual(first.content, second.content)
+        self.assertTrue(second.from_cache)
+        self.assertEqual({"path": "/v1/forms"}, other.json())
+        self.assertEqual(1, cache.stats.hits)
+        self.assertEqual(2, cache.stats.misses)
+        self.assertAlmostEqual(1 / 3, cache.stats.hit_rate)
+
+    def test_send__revalidate(self):
+        """Should revalidate a stale response which has an ETag."""
+        cache = ResponseCache(ttl=0)
+        with get_session(base_url=self.base_url, response_cache=cache) as session:
+            session.get("projects")
+            second = session.get("projects")
+            session.get("no-etag")
+            session.get("no-etag")
+        self.assertEqual(4, len(ETagHandler.requests))
+        self.assertEqual('"v1"', ETagHandler.requests[1][2]["If-None-Match"])
+        self.assertNotIn("If-None-Match", ETagHandler.requests[3][2])
+        self.assertEqual(200, second.status_code)
+        self.assertEqual({"path": "/v1/projects"}, second.json())
+        self.assertEqual(1, cache.stats.revalidated)
+        self.assertEqual(3, cache.stats.misses)
+
+    def test_send__keyed_by_auth(self):
+        """Should not use a response stored for a different Authorization header."""
+        cache = ResponseCache(ttl=60)
+        with get_session(base_url=self.base_url, response_cache=cache) as session:
+            session.get("projects")
+            session.headers["Authorization"] = "Bearer other"
+            session.get("projects")
+        self.assertEqual(2, len(ETagHandler.requests))
+        self.assertEqual(0, cache.stats.hits)
+
+    def test_send__keyed_by_headers(self):
+        """Should not use a response stored for different representation headers."""
+        cache = ResponseCache(ttl=60)
+        with get_session(base_url=self.base_url, response_cache=cache) as session:
+            session.get("forms/a")
+            session.get("forms/a", headers={"X-Extended-Metadata": "true"})
+            session.get("forms/a", headers={"Accept": "application/xml"})
+            session.get("forms/a", headers={"X-Extended-Metadata": "true"})
+        self.assertEqual(3, len(ETagHandler.requests))
+        self.assertEqual("true", ETagHandler.requests[1][2]["X-Extended-Metadata"])
+        self.assertEqual(3, len(cache.store))
+        self.assertEqual(1, cache.stats.hits)
+
+    def test_send__not_cached(self):
+        """Should not cache streamed responses, or requests which are conditional."""
+        cache = ResponseCache(ttl=60)
+        with get_session(base_url=self.base_url, response_cache=cache) as session:
+            for _ in range(2):
+                with session.get("projects", stream=True) as response:
+                    response.content  # noqa: B018
+            for _ in range(2):
+                session.get("forms", headers={"If-None-Match": '"v0"'})
+        self.assertEqual(4, len(ETagHandler.requests))
+        self.assertEqual(0, len(cache.store))
+
+    def test_send__invalidate(self):
+        """Should clear the cache after a successful change."""
+        cache = ResponseCache(ttl=60)
+        with get_session(base_url=self.base_url, response_cache=cache) as session:
+            session.get("projects")
+            session.post("projects", json={"name": "a"})
+            session.get("projects")
+        self.assertEqual(3, len(ETagHandler.requests))
+        self.assertEqual(1, cache.stats.invalidations)
+
+    def test_memory_store__evict(self):
+        """Should evict the least recently used entries when over either limit."""
+        store = MemoryStore(max_entries=2, max_bytes=10)
+        store.set("a", get_entry())
+        store.set("b", get_entry())
+        store.get("a")
+        store.set("c", get_entry())
+        self.assertIsNone(store.get("b"))
+        self.assertIsNotNone(store.get("a"))
+        store.set("d", get_entry(b"0123456789"))
+        self.assertEqual(1, len(store))
+        self.assertIsNotNone(store.get("d"))
+
+    def test_disk_store(self):
+        """Should keep entries between instances, and evict the least recently used."""
+        with get_temp_dir() as tmp:
+            store = DiskStore(tmp / "cache", max_entries=2)
+            store.set("a", get_entry(b"\x00\xff"))
+            self.assertEqual(get_entry(b"\x00\xff"), DiskStore(tmp / "cache").get("a"))
+            time.sleep(0.01)
+            store.set("b", get_entry())
+            time.sleep(0.01)
+            store.get("a")
+            store.set("c", get_entry())
+            self.assertEqual(2, len(store))
+            self.assertIsNone(store.get("b"))
+            store.clear()
+            self.assertEqual(0, len(store))
@@ -1,7 +1,126 @@
+import gzip
+import json
+import threading
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 from unittest import TestCase
+from urllib.parse import urljoin
 
-from pyodk._utils.session import Session
+from pyodk._utils import config
+from pyodk._utils.json_codec import STDLIB, JSONCodec
+from pyodk._utils.session import Adapter, Session, URLFormatter
+from pyodk.errors import PyODKError
+
+from tests.utils.utils import get_temp_dir
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        time.sleep(0.02)
+        body = b"{}"
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class AuthHandler(BaseHTTPRequestHandler):
+    """Accepts only the token from the most recent login."""
+
+    protocol_version = "HTTP/1.1"
+    token = "new"  # noqa: S105
+    logins = 0
+
+    def reply(self, status: int, body: bytes) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def read_body(self) -> bytes:
+        if self.headers["Transfer-Encoding"] != "chunked":
+            return self.rfile.read(int(self.headers["Content-Length"] or 0))
+        body = b""
+        while size := int(self.rfile.readline().strip(), 16):
+            body += self.rfile.read(size + 2)[:-2]
+        self.rfile.readline()
+        return body
+
+    def do_GET(self):
+        self.do_POST()
+
+    def do_POST(self):
+        body = self.read_body()
+        if self.path == "/v1/sessions":
+            type(self).logins += 1
+            time.sleep(0.05)
+            data = {"token": self.token, "expiresAt": "2030-01-01T00:00:00.000Z"}
+            self.reply(200, json.dumps(data).encode())
+        elif self.headers["Authorization"] != f"Bearer {self.token}":
+            self.reply(401, b'{"code": 401.2}')
+        else:
+            self.reply(200, body or b"{}")
+
+    def log_message(self, *args):
+        pass
+
+
+class EchoHandler(BaseHTTPRequestHandler):
+    """Replies with the decoded request body, compressed if the client accepts gzip."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        encoding = self.headers["Content-Encoding"]
+        if encoding == "gzip":
+            body = gzip.decompress(body)
+        elif encoding == "deflate":
+            body = zlib.decompress(body)
+        reply = json.dumps(
+            {
+                "content_encoding": encoding,
+                "content_type": self.headers["Content-Type"],
+                "accept_encoding": self.headers["Accept-Encoding"],
+                "body": body.decode("utf-8"),
+            }
+        ).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        if "gzip" in self.headers["Accept-Encoding"]:
+            reply = gzip.compress(reply)
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(reply)))
+        self.end_headers()
+        self.wfile.write(reply)
+
+    def log_message(self, *args):
+        pass
+
+
+def get_session(
+    base_url: str = "https://example.com", cache_path: str = "", **kwargs
+) -> Session:
+    session = Session(
+        base_url=base_url,
+        api_version="v1",
+        username="user",
+        password="pass",  # noqa: S106
+        cache_path=cache_path,
+        **kwargs,
+    )
+    session.headers["Authorization"] = "Bearer token"
+    return session
 
 
 class TestSession(TestCase):
@@ -41,6 +160,29 @@ class TestSession(TestCase):
             with self.subTest(msg=str(params)):
                 self.assertEqual(expected, Session.urlformat(url, **params))
 
+    def test_urljoin(self):
+        """Should join formatted URLs to the base URL the same way as urllib."""
+        session = get_session(base_url="https://example.com/central")
+        test_cases = (
+            ("projects/{project_id}/forms/{form_id}", {"project_id": 1, "form_id": "a"}),
+            ("projects/{project_id}", {"project_id": "a/b?c#d"}),
+            ("projects/{project_id}", {"project_id": ".."}),
+            ("{x}/forms", {"x": "."}),
+            ("/projects/{project_id}", {"project_id": 1}),
+            ("projects/{project_id!r}", {"project_id": "a"}),
+            ("projects/{project_id}", {"project_id": ["a"]}),
+        )
+        for template, params in test_cases:
+            with self.subTest(msg=template):
+                url = session.urlformat(template, **params)
+                expected = urljoin(
+                    session.base_url,
+                    URLFormatter().format(template, **params).lstrip("/"),
+                )
+                observed = session.urljoin(url)
+                self.assertEqual(expected, observed)
+                self.assertEqual(template, observed.template)
+
     def test_urlquote(self):
         """Should url-encode input values."""
         test_cases = (
@@ -62,3 +204,193 @@ class TestSession(TestCase):
         for params, expected in test_cases:
             with self.subTest(msg=str(params)):
                 self.assertEqual(expected, Session.urlquote(Path(params).stem))
+
+    def test_init__pool_options(self):
+        """Should mount the same configured adapter for both http and https."""
+        session = get_session(pool_connections=3, pool_maxsize=32, pool_block=True)
+        https, http = session.get_adapter("https://a"), session.get_adapter("http://a")
+        self.assertIs(https, http)
+        self.assertIsInstance(https, Adapter)
+        self.assertEqual(3, https._pool_connections)
+        self.assertEqual(32, https._pool_maxsize)
+        self.assertTrue(https._pool_block)
+        self.assertEqual("keep-alive", session.headers["Connection"])
+        self.assertEqual("close", get_session(keep_alive=False).headers["Connection"])
+
+    def test_pool_stats(self):
+        """Should count requests, new connections, and connection re-use."""
+        server = ThreadingHTTPServer(("127.0.0.1", 0), KeepAliveHandler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            base_url = f"http://127.0.0.1:{server.server_address[1]}"
+            with get_session(base_url=base_url) as session:
+                self.assertEqual(0, session.pool_stats().requests)
+                for _ in range(3):
+                    session.get("projects")
+                stats = session.pool_stats()
+            self.assertEqual(1, stats.pools)
+            self.assertEqual(3, stats.requests)
+            self.assertEqual(1, stats.connections)
+            self.assertEqual(2, stats.reused)
+            self.assertEqual(0, stats.discarded)
+            self.assertEqual(1, stats.idle)
+            with get_session(base_url=base_url, keep_alive=False) as session:
+                for _ in range(3):
+                    session.get("projects")
+                self.assertEqual(3, session.pool_stats().connections)
+            with get_session(base_url=base_url, pool_maxsize=1) as session:
+                with (
+                    self.assertLogs("urllib3.connectionpool", "WARNING"),
+                    ThreadPoolExecutor(max_workers=4) as executor,
+                ):
+                    list(executor.map(lambda _: session.get("projects"), range(4)))
+                stats = session.pool_stats()
+            self.assertEqual(4, stats.requests)
+            self.assertEqual(stats.connections - 1, stats.discarded)
+            self.assertGreater(stats.discarded, 0)
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    def test_auth__401__login_and_resend(self):
+        """Should log in again and re-send the request, if the token was rejected."""
+        server = ThreadingHTTPServer(("127.0.0.1", 0), AuthHandler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            base_url = f"http://127.0.0.1:{server.server_address[1]}"
+            with get_temp_dir() as tmp:
+                cache_path = (tmp / "cache.toml").as_posix()
+                with get_session(base_url=base_url, cache_path=cache_path) as session:
+                    response = session.post("projects", data=b'{"name": "a"}')
+                    self.assertEqual(200, response.status_code)
+                    self.assertEqual({"name": "a"}, response.json())
+                    self.assertEqual([401], [r.status_code for r in response.history])
+                    self.assertEqual("Bearer new", session.headers["Authorization"])
+                    self.assertEqual("new", config.read_cache_token(cache_path))
+                    self.assertIsNotNone(config.read_cache_token_expiry(cache_path))
+                    # Other requests use the new token.
+                    response = session.get("projects")
+                    self.assertEqual(200, response.status_code)
+                    self.assertEqual([], response.history)
+                with get_session(base_url=base_url, cache_path=cache_path) as session:
+                    # A body which can't be re-sent is not re-sent.
+                    response = session.post("projects", data=iter([b"{}"]))
+                    self.assertEqual(401, response.status_code)
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    def test_auth__401__single_login_for_concurrent_requests(self):
+        """Should log in once, when many threads have their token rejected at once."""
+        server = ThreadingHTTPServer(("127.0.0.1", 0), AuthHandler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            base_url = f"http://127.0.0.1:{server.server_address[1]}"
+            with get_temp_dir() as tmp:
+                cache_path = (tmp / "cache.toml").as_posix()
+                with (
+                    get_session(base_url=base_url, cache_path=cache_path) as session,
+                    ThreadPoolExecutor(max_workers=8) as executor,
+                ):
+                    AuthHandler.logins = 0
+                    responses = list(
+                        executor.map(lambda _: session.get("projects"), range(16))
+                    )
+                self.assertEqual(1, AuthHandler.logins)
+                self.assertEqual({200}, {r.status_code for r in responses})
+                self.assertEqual("new", config.read_cache_token(cache_path))
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    def test_request__json_codec(self):
+        """Should encode json bodies and decode responses with the session's codec."""
+        server = ThreadingHTTPServer(("127.0.0.1", 0), EchoHandler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        calls = []
+
+        def dumps(obj):
+            calls.append("dumps")
+            return STDLIB.dumps(obj)
+
+        def loads(content):
+            calls.append("loads")
+            return STDLIB.loads(content)
+
+        codec = JSONCodec(name="test", dumps=dumps, loads=loads)
+        try:
+            base_url = f"http://127.0.0.1:{server.server_address[1]}"
+            for compression in (None, "gzip"):
+                calls.clear()
+                with (
+                    self.subTest(compression=compression),
+                    get_session(
+                        base_url=base_url, json_codec=codec, compression=compression
+                    ) as session,
+                ):
+                    # Too small to compress, so the codec's body is sent as it is.
+                    observed = session.post("echo", json={"a": 1}, compress=True).json()
+                    self.assertEqual(["dumps", "loads"], calls)
+                    self.assertEqual("application/json", observed["content_type"])
+                    self.assertIsNone(observed["content_encoding"])
+                    self.assertEqual({"a": 1}, json.loads(observed["body"]))
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    def test_request__compress(self):
+        """Should compress large request bodies, if compression is set on the session."""
+        server = ThreadingHTTPServer(("127.0.0.1", 0), EchoHandler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            base_url = f"http://127.0.0.1:{server.server_address[1]}"
+            data = {"entities": [{"label": "a" * 100}]}
+            xml = b"<data>" + b"a" * 100 + b"</data>"
+            cases = (
+                ("gzip", {"json": data}, "gzip", "application/json"),
+                ("deflate", {"data": xml}, "deflate", None),
+                ("gzip", {"data": xml.decode("utf-8")}, "gzip", None),
+                (None, {"json": data}, None, "application/json"),
+            )
+            for compression, kwargs, encoding, content_type in cases:
+                with (
+                    self.subTest(msg=f"{compression}, {list(kwargs)}"),
+                    get_session(
+                        base_url=base_url,
+                        compression=compression,
+                        compression_threshold=100,
+                    ) as session,
+                ):
+                    observed = session.post("echo", compress=True, **kwargs).json()
+                    self.assertEqual(encoding, observed["content_encoding"])
+                    self.assertEqual(content_type, observed["content_type"])
+                    if "json" in kwargs:
+                        self.assertEqual(data, json.loads(observed["body"]))
+                    else:
+                        self.assertEqual(xml.decode(), observed["body"])
+            with get_session(base_url=base_url, compression="gzip") as session:
+                # Below the threshold, or not requested.
+                observed = session.post("echo", json=data, compress=True).json()
+                self.assertIsNone(observed["content_encoding"])
+                observed = session.post("echo", data=xml * 1000).json()
+                self.assertIsNone(observed["content_encoding"])
+                # Compressed responses are requested, and decoded when streamed.
+                response = session.post("echo", json=data, stream=True)
+                with response:
+                    self.assertEqual("gzip", response.headers["Content-Encoding"])
+                    observed = json.loads(b"".join(response.iter_content(16)))
+                self.assertIn("gzip", observed["accept_encoding"])
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    def test_init__compression__error(self):
+        """Should raise an error if the compression is not known."""
+        with self.assertRaises(PyODKError) as err:
+            get_session(compression="zip")
+        self.assertIn("Unknown compression: 'zip'", err.exception.args[0])
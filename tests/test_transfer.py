@@ -0,0 +1,164 @@
+import hashlib
+import logging
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from unittest import TestCase
+
+from pyodk._utils.transfer import download, file_md5, open_upload
+from pyodk.errors import PyODKError
+
+from tests.test_session import get_session
+from tests.utils.utils import get_temp_dir
+
+BODY = bytes(range(256)) * 1000
+ETAG = f'"{hashlib.md5(BODY).hexdigest()}"'  # noqa: S324
+log = logging.getLogger(__name__)
+
+
+class RangeHandler(BaseHTTPRequestHandler):
+    """
+    Serves BODY, with Range support if `server.ranges`. Drops the connection after
+    the number of bytes in `server.drops`, one per request, to simulate a network error.
+    """
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self.server.seen.append(dict(self.headers))
+        if self.headers.get("If-None-Match") == ETAG:
+            self.send_response(304)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        start = 0
+        if self.server.ranges and (value := self.headers.get("Range")):
+            start = int(value.removeprefix("bytes=").removesuffix("-"))
+            self.send_response(206)
+            self.send_header(
+                "Content-Range", f"bytes {start}-{len(BODY) - 1}/{len(BODY)}"
+            )
+        else:
+            self.send_response(200)
+        body = BODY[start:]
+        self.send_header("Content-Type", "application/zip")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", '"abc"')
+        self.end_headers()
+        if self.server.drops:
+            self.wfile.write(body[: self.server.drops.pop(0)])
+            self.close_connection = True
+            return
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestDownload(TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), RangeHandler)
+        self.server.ranges, self.server.drops, self.server.seen = True, [], []
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.session = get_session(
+            base_url=f"http://127.0.0.1:{self.server.server_address[1]}", chunk_size=4096
+        )
+        self.progress = []
+
+    def tearDown(self):
+        self.session.close()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def download(self, path: Path, **kwargs) -> Path:
+        return download(
+            session=self.session,
+            url="export.zip",
+            path=path,
+            logger=log,
+            progress=self.progress.append,
+            **kwargs,
+        )
+
+    def test_download__resume(self):
+        """Should resume from the end of the partial file after the connection drops."""
+        self.server.drops = [100_000]
+        with get_temp_dir() as tmp:
+            path = tmp / "export.zip"
+            self.assertEqual(path, self.download(path))
+            self.assertEqual(BODY, path.read_bytes())
+            self.assertFalse((tmp / "export.zip.part").exists())
+        self.assertEqual(2, len(self.server.seen))
+        resumed = self.server.seen[1]
+        self.assertTrue(resumed["Range"].startswith("bytes="))
+        self.assertNotEqual("bytes=0-", resumed["Range"])
+        self.assertEqual('"abc"', resumed["If-Range"])
+        self.assertEqual("identity", resumed["Accept-Encoding"])
+        last = self.progress[-1]
+        self.assertTrue(last.done)
+        self.assertEqual(1, last.resumes)
+        self.assertEqual((len(BODY), len(BODY)), (last.transferred, last.total))
+        self.assertEqual(1.0, last.fraction)
+
+    def test_download__no_ranges(self):
+        """Should start again from the beginning if the server doesn't support ranges."""
+        self.server.ranges = False
+        self.server.drops = [100_000]
+        with get_temp_dir() as tmp:
+            path = self.download(tmp / "export.zip")
+            self.assertEqual(BODY, path.read_bytes())
+
+    def test_download__partial_file(self):
+        """Should resume a partial file left by an earlier download."""
+        with get_temp_dir() as tmp:
+            (tmp / "export.zip.part").write_bytes(BODY[:1000])
+            path = self.download(tmp / "export.zip")
+            self.assertEqual(BODY, path.read_bytes())
+        self.assertEqual("bytes=1000-", self.server.seen[0]["Range"])
+        self.assertEqual(len(BODY) - 1000, self.progress[-1].received)
+
+    def test_download__max_resumes(self):
+        """Should raise an error, and keep the partial file, if resuming fails."""
+        self.server.drops = [1000, 1000]
+        with get_temp_dir() as tmp:
+            with self.assertRaises(PyODKError):
+                self.download(tmp / "export.zip", max_resumes=1)
+            self.assertFalse((tmp / "export.zip").exists())
+            self.assertTrue((tmp / "export.zip.part").exists())
+
+    def test_download__not_modified(self):
+        """Should keep the file if the server replies that it is not modified."""
+        with get_temp_dir() as tmp:
+            path = tmp / "export.zip"
+            path.write_bytes(BODY)
+            (tmp / "export.zip.part").write_bytes(b"old")
+            self.assertEqual(ETAG, f'"{file_md5(path, blocksize=1000)}"')
+            self.download(path, headers={"If-None-Match": ETAG})
+            self.assertEqual(BODY, path.read_bytes())
+            self.assertFalse((tmp / "export.zip.part").exists())
+        self.assertEqual(1, len(self.server.seen))
+        self.assertTrue(self.progress[-1].done)
+
+
+class TestOpenUpload(TestCase):
+    def test_open_upload(self):
+        """Should open the file, or map it into memory, to send as a request body."""
+        with get_temp_dir() as tmp:
+            path = tmp / "a.jpg"
+            path.write_bytes(BODY)
+            with open_upload(path) as body:
+                self.assertEqual(BODY, body.read())
+            with open_upload(path, memory_map=True) as body:
+                self.assertIsInstance(body, memoryview)
+                self.assertEqual(len(BODY), len(body))
+                self.assertEqual(BODY, bytes(body))
+                mapped = body.obj
+            self.assertTrue(mapped.closed)
+
+    def test_open_upload__empty(self):
+        """Should open an empty file as a file, because it can't be mapped."""
+        with get_temp_dir() as tmp:
+            path = tmp / "a.jpg"
+            path.write_bytes(b"")
+            with open_upload(path, memory_map=True) as body:
+                self.assertEqual(b"", body.read())
@@ -0,0 +1,780 @@
+"""
+An in-process stand-in for ODK Central, for offline load and regression testing.
+
+The server implements the parts of the Central API that pyodk uses, with in-memory
+data. It's intended to measure pyodk (throughput, connection re-use, retries,
+concurrency), not to replicate Central's validation or permissions.
+
+```python
+with FakeCentral(latency=0.01, submissions=10_000) as central, get_temp_dir() as tmp:
+    client = central.client(tmp)
+    rows = list(client.submissions.iter_table(form_id=central.form_id))
+    print(central.stats.requests, central.stats.connections)
+```
+"""
+
+import gzip
+import json
+import random
+import re
+import threading
+import time
+import zlib
+from collections import Counter
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+from urllib.parse import parse_qsl, unquote, urlencode, urlsplit
+from uuid import uuid4
+from xml.etree import ElementTree
+
+from pyodk.client import Client
+
+USERNAME = "fake@example.com"
+PASSWORD = "fake-password"  # noqa: S105
+NOW = "2025-01-01T00:00:00.000Z"
+
+
+class HTTPProblem(Exception):
+    """An error response, like Central's Problem."""
+
+    def __init__(self, status: int, code: float, message: str):
+        super().__init__(message)
+        self.status: int = status
+        self.body: dict = {"code": code, "message": message}
+
+
+@dataclass
+class FakeCentralStats:
+    """
+    What the server received.
+
+    :param requests: The number of requests per (method, route name).
+    :param connections: The number of connections accepted.
+    :param injected_errors: The number of error responses injected.
+    :param bytes_received: The total size of the request bodies (as sent).
+    """
+
+    requests: Counter = field(default_factory=Counter)
+    connections: int = 0
+    injected_errors: int = 0
+    bytes_received: int = 0
+
+    @property
+    def total_requests(self) -> int:
+        return sum(self.requests.values())
+
+
+@dataclass
+class Route:
+    method: str
+    name: str
+    pattern: re.Pattern
+    handler: Callable
+
+
+def route(method: str, path: str) -> Callable:
+    """Register a handler for a URL path template like "projects/{pid}/forms"."""
+
+    def decorator(func: Callable) -> Callable:
+        pattern = re.sub(r"\\{(\w+)\\}", r"(?P<\1>[^/]+?)", re.escape(path))
+        func.route = (method, re.compile(f"^/v1/{pattern}$"))
+        return func
+
+    return decorator
+
+
+# OData $filter expressions: "path op literal", joined by "and".
+_FILTER_TERM = re.compile(
+    r"\s*([\w/]+)\s+(eq|ne|gt|ge|lt|le)\s+('(?:[^']|'')*'|[-\d.]+|null|true|false)\s*"
+)
+_FILTER_OPS = {
+    "eq": lambda a, b: a == b,
+    "ne": lambda a, b: a != b,
+    "gt": lambda a, b: a is not None and a > b,
+    "ge": lambda a, b: a is not None and a >= b,
+    "lt": lambda a, b: a is not None and a < b,
+    "le": lambda a, b: a is not None and a <= b,
+}
+
+
+def odata_filter(expression: str) -> Callable[[dict], bool]:
+    terms = []
+    for part in re.split(r"\s+and\s+", expression.strip()):
+        match = _FILTER_TERM.fullmatch(part)
+        if match is None:
+            raise HTTPProblem(501, 501.1, f"Unsupported $filter: {part}")
+        path, op, literal = match.groups()
+        if literal.startswith("'"):
+            value = literal[1:-1].replace("''", "'")
+        else:
+            value = json.loads(literal)
+        terms.append((path.split("/"), _FILTER_OPS[op], value))
+
+    def get(row: dict, keys: list[str]) -> Any:
+        for key in keys:
+            row = row.get(key) if isinstance(row, dict) else None
+        return row
+
+    return lambda row: all(op(get(row, keys), value) for keys, op, value in terms)
+
+
+class FakeCentralHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # The headers and body are written separately, so without this each response
+    # waits for the client's delayed ACK.
+    disable_nagle_algorithm = True
+    server: "FakeCentralServer"
+
+    def setup(self):
+        super().setup()
+        with self.server.central.lock:
+            self.server.central.stats.connections += 1
+
+    def log_message(self, *args):
+        pass
+
+    def read_body(self) -> bytes:
+        if self.headers["Transfer-Encoding"] == "chunked":
+            body = b""
+            while size := int(self.rfile.readline().strip(), 16):
+                body += self.rfile.read(size + 2)[:-2]
+            self.rfile.readline()
+        else:
+            body = self.rfile.read(int(self.headers["Content-Length"] or 0))
+        with self.server.central.lock:
+            self.server.central.stats.bytes_received += len(body)
+        encoding = self.headers["Content-Encoding"]
+        if encoding == "gzip":
+            body = gzip.decompress(body)
+        elif encoding == "deflate":
+            body = zlib.decompress(body)
+        return body
+
+    def reply(
+        self, status: int, body: bytes, content_type: str, headers: dict | None = None
+    ) -> None:
+        if self.server.central.gzip_responses and "gzip" in (
+            self.headers["Accept-Encoding"] or ""
+        ):
+            body = gzip.compress(body, compresslevel=1)
+            headers = {**(headers or {}), "Content-Encoding": "gzip"}
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for k, v in (headers or {}).items():
+            self.send_header(k, v)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def handle_request(self):
+        central = self.server.central
+        url = urlsplit(self.path)
+        body = self.read_body()
+        try:
+            name, handler, args = central.match(self.command, url.path)
+            with central.lock:
+                central.stats.requests[(self.command, name)] += 1
+            if central.latency:
+                time.sleep(central.latency)
+            central.inject_error()
+            if name != "sessions":
+                central.authenticate(self.headers["Authorization"])
+            status, data = handler(
+                central,
+                body=body,
+                params=dict(parse_qsl(url.query)),
+                headers=self.headers,
+                url=url,
+                **args,
+            )
+        except HTTPProblem as problem:
+            headers = {}
+            if problem.status in (429, 503):
+                headers["Retry-After"] = str(central.retry_after)
+            self.reply(
+                problem.status,
+                json.dumps(problem.body).encode(),
+                "application/json",
+                headers,
+            )
+        else:
+            self.reply(status, json.dumps(data).encode(), "application/json")
+
+    do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = handle_request
+
+
+class FakeCentralServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, central: "FakeCentral"):
+        super().__init__(("127.0.0.1", 0), FakeCentralHandler)
+        self.central: FakeCentral = central
+
+
+class FakeCentral:
+    """
+    A local fake Central server with one project, form, and entity list.
+
+    :param latency: Seconds to wait before handling each request.
+    :param error_rate: The probability of replying with an injected error.
+    :param error_statuses: The statuses to choose from for injected errors.
+    :param retry_after: The Retry-After header value for injected 429/503 errors.
+    :param submissions: The number of submissions to generate for the form.
+    :param entities: The number of entities to generate for the entity list.
+    :param seed: The random seed for generated data and error injection.
+    :param gzip_responses: If True, compress responses if the client accepts gzip.
+    """
+
+    project_id = 1
+    form_id = "fake_form"
+    entity_list_name = "fake_list"
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        error_rate: float = 0.0,
+        error_statuses: tuple[int, ...] = (429, 503),
+        retry_after: float = 0,
+        submissions: int = 0,
+        entities: int = 0,
+        seed: int = 0,
+        gzip_responses: bool = False,
+    ):
+        self.latency: float = latency
+        self.error_rate: float = error_rate
+        self.error_statuses: tuple[int, ...] = error_statuses
+        self.retry_after: float = retry_after
+        self.gzip_responses: bool = gzip_responses
+        self.random: random.Random = random.Random(seed)  # noqa: S311
+        self.lock: threading.Lock = threading.Lock()
+        self.stats: FakeCentralStats = FakeCentralStats()
+        self.tokens: set[str] = set()
+        self.fail_next: list[int] = []
+        self.routes: list[Route] = [
+            Route(method, name, pattern, func)
+            for name, func in type(self).__dict__.items()
+            if (spec := getattr(func, "route", None)) is not None
+            for method, pattern in [spec]
+        ]
+        self.projects: dict[int, dict] = {
+            self.project_id: {"id": self.project_id, "name": "Fake", "createdAt": NOW}
+        }
+        self.app_users: dict[int, list[dict]] = {self.project_id: []}
+        self.forms: dict[tuple[int, str], dict] = {}
+        self.submissions: dict[tuple[int, str], dict[str, dict]] = {}
+        self.comments: dict[str, list[dict]] = {}
+        self.attachments: dict[str, dict[str, bytes]] = {}
+        self.entity_lists: dict[tuple[int, str], dict] = {}
+        self.entities: dict[tuple[int, str], dict[str, dict]] = {}
+        self.add_form(self.project_id, self.form_id)
+        self.add_entity_list(self.project_id, self.entity_list_name, ["name", "count"])
+        self.generate(submissions=submissions, entities=entities)
+        self.server: FakeCentralServer | None = None
+        self.thread: threading.Thread | None = None
+
+    # Lifecycle.
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def start(self) -> "FakeCentral":
+        self.server = FakeCentralServer(self)
+        self.thread = threading.Thread(
+            target=self.server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+        )
+        self.thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+        self.thread.join()
+
+    def __enter__(self) -> "FakeCentral":
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
+
+    def write_config(self, directory: Path) -> tuple[str, str]:
+        """Write a pyodk config file for this server; return (config_path, cache_path)."""
+        config_path = Path(directory) / "fake_config.toml"
+        config_path.write_text(
+            "[central]\n"
+            f'base_url = "{self.base_url}"\n'
+            f'username = "{USERNAME}"\n'
+            f'password = "{PASSWORD}"\n'
+            f"default_project_id = {self.project_id}\n"
+        )
+        return config_path.as_posix(), (Path(directory) / "fake_cache.toml").as_posix()
+
+    def client(self, directory: Path, **kwargs) -> Client:
+        """Make a pyodk Client for this server, with its config/cache in `directory`."""
+        config_path, cache_path = self.write_config(directory)
+        return Client(config_path=config_path, cache_path=cache_path, **kwargs)
+
+    # Data.
+
+    def add_form(self, pid: int, fid: str, version: str = "1") -> dict:
+        form = {
+            "projectId": pid,
+            "xmlFormId": fid,
+            "version": version,
+            "hash": uuid4().hex,
+            "state": "open",
+            "createdAt": NOW,
+            "name": fid,
+            "enketoId": None,
+            "keyId": None,
+            "updatedAt": None,
+            "publishedAt": NOW,
+        }
+        self.forms[(pid, fid)] = form
+        self.submissions.setdefault((pid, fid), {})
+        return form
+
+    def add_submission(self, pid: int, fid: str, iid: str, data: dict) -> dict:
+        submission = {
+            "instanceId": iid,
+            "submitterId": 1,
+            "deviceId": None,
+            "createdAt": NOW,
+            "updatedAt": None,
+            "reviewState": None,
+            "data": data,
+        }
+        self.submissions[(pid, fid)][iid] = submission
+        return submission
+
+    def add_entity_list(self, pid: int, name: str, properties: list[str]) -> dict:
+        entity_list = {
+            "name": name,
+            "projectId": pid,
+            "createdAt": NOW,
+            "approvalRequired": False,
+            "properties": [],
+        }
+        self.entity_lists[(pid, name)] = entity_list
+        self.entities[(pid, name)] = {}
+        for prop in properties:
+            self.add_property(entity_list, prop)
+        return entity_list
+
+    @staticmethod
+    def add_property(entity_list: dict, name: str) -> None:
+        entity_list["properties"].append(
+            {"name": name, "odataName": name, "publishedAt": NOW, "forms": []}
+        )
+
+    def add_entity(self, pid: int, name: str, label: str, data: dict, uuid=None) -> dict:
+        entity = {
+            "uuid": uuid or str(uuid4()),
+            "creatorId": 1,
+            "createdAt": NOW,
+            "updatedAt": None,
+            "deletedAt": None,
+            "conflict": None,
+            "currentVersion": {
+                "label": label,
+                "current": True,
+                "createdAt": NOW,
+                "creatorId": 1,
+                "userAgent": "pyodk",
+                "version": 1,
+                "baseVersion": None,
+                "conflictingProperties": None,
+                "data": data,
+            },
+        }
+        self.entities[(pid, name)][entity["uuid"]] = entity
+        return entity
+
+    def generate(self, submissions: int = 0, entities: int = 0) -> None:
+        """Add generated submissions and entities to the default form and entity list."""
+        for i in range(submissions):
+            self.add_submission(
+                self.project_id,
+                self.form_id,
+                f"uuid:{uuid4()}",
+                {"name": f"Name {i}", "age": self.random.randint(1, 99)},
+            )
+        for i in range(entities):
+            self.add_entity(
+                self.project_id,
+                self.entity_list_name,
+                f"Entity {i}",
+                {"name": f"Name {i}", "count": str(self.random.randint(1, 1000))},
+            )
+
+    # Request handling.
+
+    def match(self, method: str, path: str) -> tuple[str, Callable, dict]:
+        path = unquote(path)
+        for r in self.routes:
+            if r.method == method and (m := r.pattern.match(path)):
+                return r.name, r.handler, m.groupdict()
+        raise HTTPProblem(404, 404.1, f"Not found: {method} {path}")
+
+    def inject_error(self) -> None:
+        with self.lock:
+            if self.fail_next:
+                status = self.fail_next.pop(0)
+            elif self.error_rate and self.random.random() < self.error_rate:
+                status = self.random.choice(self.error_statuses)
+            else:
+                return
+            self.stats.injected_errors += 1
+        raise HTTPProblem(status, float(status), "Injected error.")
+
+    def authenticate(self, authorization: str | None) -> None:
+        if (
+            authorization is None
+            or authorization.removeprefix("Bearer ") not in self.tokens
+        ):
+            raise HTTPProblem(
+                401, 401.2, "Could not authenticate with the provided token."
+            )
+
+    def get_project(self, pid: str) -> int:
+        if int(pid) not in self.projects:
+            raise HTTPProblem(404, 404.1, "Project not found.")
+        return int(pid)
+
+    def get_form(self, pid: str, fid: str) -> dict:
+        form = self.forms.get((self.get_project(pid), fid))
+        if form is None:
+            raise HTTPProblem(404, 404.1, "Form not found.")
+        return form
+
+    def get_submission(self, pid: str, fid: str, iid: str) -> dict:
+        form = self.get_form(pid, fid)
+        submission = self.submissions[(form["projectId"], fid)].get(iid)
+        if submission is None:
+            raise HTTPProblem(404, 404.1, "Submission not found.")
+        return submission
+
+    def get_entity_list(self, pid: str, name: str) -> dict:
+        entity_list = self.entity_lists.get((self.get_project(pid), name))
+        if entity_list is None:
+            raise HTTPProblem(404, 404.1, "Entity list not found.")
+        return entity_list
+
+    def get_entity(self, pid: str, name: str, uuid: str) -> dict:
+        self.get_entity_list(pid, name)
+        entity = self.entities[(int(pid), name)].get(uuid)
+        if entity is None:
+            raise HTTPProblem(404, 404.1, "Entity not found.")
+        return entity
+
+    def odata(self, rows: list[dict], params: dict, url) -> dict:
+        if "$filter" in params:
+            rows = [r for r in rows if odata_filter(params["$filter"])(r)]
+        count = len(rows)
+        skip = int(params.get("$skip", 0))
+        top = int(params["$top"]) if "$top" in params else None
+        page = rows[skip:] if top is None else rows[skip : skip + top]
+        if "$select" in params:
+            keys = params["$select"].split(",")
+            page = [{k: r.get(k) for k in keys} for r in page]
+        data = {"@odata.context": f"{url.path}/$metadata", "value": page}
+        if params.get("$count", "").lower() == "true":
+            data["@odata.count"] = count
+        if top is not None and skip + top < count:
+            next_params = {**params, "$skip": skip + top}
+            data["@odata.nextLink"] = (
+                f"{self.base_url}{url.path}?{urlencode(next_params)}"
+            )
+        return data
+
+    @route("POST", "sessions")
+    def sessions(self, body, **kwargs):
+        data = json.loads(body)
+        if data.get("email") != USERNAME or data.get("password") != PASSWORD:
+            raise HTTPProblem(401, 401.2, "Could not authenticate with the credentials.")
+        token = uuid4().hex
+        with self.lock:
+            self.tokens.add(token)
+        expires = datetime.now(tz=timezone.utc) + timedelta(hours=24)
+        expires_at = expires.isoformat(timespec="milliseconds").replace("+00:00", "Z")
+        return 200, {"token": token, "expiresAt": expires_at, "createdAt": NOW}
+
+    @route("GET", "users/current")
+    def users_current(self, **kwargs):
+        return 200, {"id": 1, "type": "user", "displayName": "Fake", "email": USERNAME}
+
+    @route("GET", "projects")
+    def projects_list(self, **kwargs):
+        return 200, list(self.projects.values())
+
+    @route("GET", "projects/{pid}")
+    def projects_get(self, pid, **kwargs):
+        return 200, self.projects[self.get_project(pid)]
+
+    @route("GET", "projects/{pid}/app-users")
+    def app_users_list(self, pid, **kwargs):
+        return 200, self.app_users[self.get_project(pid)]
+
+    @route("POST", "projects/{pid}/app-users")
+    def app_users_create(self, pid, body, **kwargs):
+        users = self.app_users[self.get_project(pid)]
+        user = {
+            "projectId": int(pid),
+            "id": len(users) + 100,
+            "displayName": json.loads(body)["displayName"],
+            "createdAt": NOW,
+            "type": "field_key",
+            "token": uuid4().hex,
+            "updatedAt": None,
+            "deletedAt": None,
+        }
+        users.append(user)
+        return 200, user
+
+    @route("GET", "projects/{pid}/forms")
+    def forms_list(self, pid, **kwargs):
+        pid = self.get_project(pid)
+        return 200, [f for (p, _), f in self.forms.items() if p == pid]
+
+    @route("GET", "projects/{pid}/forms/{fid}")
+    def forms_get(self, pid, fid, **kwargs):
+        return 200, self.get_form(pid, fid)
+
+    @route("POST", "projects/{pid}/forms")
+    def forms_create(self, pid, body, headers, **kwargs):
+        fid = headers["X-XlsForm-FormId-Fallback"]
+        if (m := re.search(rb'\bid="([^"]+)"', body)) is not None:
+            fid = m.group(1).decode()
+        form = self.add_form(self.get_project(pid), unquote(fid or uuid4().hex))
+        form["state"], form["publishedAt"] = "draft", None
+        return 200, form
+
+    @route("POST", "projects/{pid}/forms/{fid}/draft")
+    def forms_draft(self, pid, fid, **kwargs):
+        self.get_form(pid, fid)
+        return 200, {"success": True}
+
+    @route("POST", "projects/{pid}/forms/{fid}/draft/attachments/{fname}")
+    def forms_draft_attachment(self, pid, fid, **kwargs):
+        self.get_form(pid, fid)
+        return 200, {"success": True}
+
+    @route("POST", "projects/{pid}/forms/{fid}/draft/publish")
+    def forms_draft_publish(self, pid, fid, params, **kwargs):
+        form = self.get_form(pid, fid)
+        form["state"], form["publishedAt"] = "open", NOW
+        if "version" in params:
+            form["version"] = params["version"]
+        return 200, {"success": True}
+
+    @route("POST", "projects/{pid}/forms/{fid}/assignments/{role}/{user}")
+    def forms_assign(self, pid, fid, **kwargs):
+        self.get_form(pid, fid)
+        return 200, {"success": True}
+
+    @route("GET", "projects/{pid}/forms/{fid}/submissions")
+    def submissions_list(self, pid, fid, **kwargs):
+        self.get_form(pid, fid)
+        subs = self.submissions[(int(pid), fid)].values()
+        return 200, [{k: v for k, v in s.items() if k != "data"} for s in subs]
+
+    @route("GET", "projects/{pid}/forms/{fid}/submissions/{iid}")
+    def submissions_get(self, pid, fid, iid, **kwargs):
+        submission = self.get_submission(pid, fid, iid)
+        return 200, {k: v for k, v in submission.items() if k != "data"}
+
+    @staticmethod
+    def parse_submission(body: bytes) -> tuple[str, dict]:
+        root = ElementTree.fromstring(body)  # noqa: S314
+        iid = root.findtext("meta/instanceID")
+        if iid is None:
+            raise HTTPProblem(400, 400.2, "Missing instanceID.")
+        return iid, {e.tag: e.text for e in root if e.tag != "meta"}
+
+    @route("POST", "projects/{pid}/forms/{fid}/submissions")
+    def submissions_create(self, pid, fid, body, params, **kwargs):
+        self.get_form(pid, fid)
+        iid, data = self.parse_submission(body)
+        if iid in self.submissions[(int(pid), fid)]:
+            raise HTTPProblem(409, 409.3, "A submission with that instanceID exists.")
+        submission = self.add_submission(int(pid), fid, iid, data)
+        submission["deviceId"] = params.get("deviceID")
+        return 200, {k: v for k, v in submission.items() if k != "data"}
+
+    @route("PUT", "projects/{pid}/forms/{fid}/submissions/{iid}")
+    def submissions_edit(self, pid, fid, iid, body, **kwargs):
+        submission = self.get_submission(pid, fid, iid)
+        submission["data"] = self.parse_submission(body)[1]
+        submission["updatedAt"] = NOW
+        return 200, {k: v for k, v in submission.items() if k != "data"}
+
+    @route("PATCH", "projects/{pid}/forms/{fid}/submissions/{iid}")
+    def submissions_review(self, pid, fid, iid, body, **kwargs):
+        submission = self.get_submission(pid, fid, iid)
+        submission["reviewState"] = json.loads(body)["reviewState"]
+        submission["updatedAt"] = NOW
+        return 200, {k: v for k, v in submission.items() if k != "data"}
+
+    @route("GET", "projects/{pid}/forms/{fid}/submissions/{iid}/comments")
+    def comments_list(self, pid, fid, iid, **kwargs):
+        self.get_submission(pid, fid, iid)
+        return 200, self.comments.get(iid, [])
+
+    @route("POST", "projects/{pid}/forms/{fid}/submissions/{iid}/comments")
+    def comments_create(self, pid, fid, iid, body, **kwargs):
+        self.get_submission(pid, fid, iid)
+        comment = {"body": json.loads(body)["body"], "actorId": 1, "createdAt": NOW}
+        self.comments.setdefault(iid, []).append(comment)
+        return 200, comment
+
+    @route("GET", "projects/{pid}/forms/{fid}/submissions/{iid}/attachments")
+    def attachments_list(self, pid, fid, iid, **kwargs):
+        self.get_submission(pid, fid, iid)
+        files = self.attachments.get(iid, {})
+        return 200, [{"name": name, "exists": True} for name in files]
+
+    @route("POST", "projects/{pid}/forms/{fid}/submissions/{iid}/attachments/{fname}")
+    def attachments_upload(self, pid, fid, iid, fname, body, **kwargs):
+        self.get_submission(pid, fid, iid)
+        self.attachments.setdefault(iid, {})[fname] = body
+        return 200, {"success": True}
+
+    @route("GET", "projects/{pid}/forms/{fid}.svc/{table}")
+    def submissions_odata(self, pid, fid, table, params, url, **kwargs):
+        self.get_form(pid, fid)
+        if table != "Submissions":
+            raise HTTPProblem(404, 404.1, "Table not found.")
+        rows = [
+            {
+                "__id": s["instanceId"],
+                **s["data"],
+                "__system": {
+                    "submissionDate": s["createdAt"],
+                    "updatedAt": s["updatedAt"],
+                    "submitterId": str(s["submitterId"]),
+                    "submitterName": "Fake",
+                    "attachmentsPresent": 0,
+                    "attachmentsExpected": 0,
+                    "status": None,
+                    "reviewState": s["reviewState"],
+                    "deviceId": s["deviceId"],
+                    "edits": 0,
+                    "formVersion": "1",
+                },
+            }
+            for s in self.submissions[(int(pid), fid)].values()
+        ]
+        return 200, self.odata(rows, params, url)
+
+    @route("GET", "projects/{pid}/datasets")
+    def entity_lists_list(self, pid, **kwargs):
+        pid = self.get_project(pid)
+        return 200, [
+            {k: v for k, v in el.items() if k != "properties"}
+            for (p, _), el in self.entity_lists.items()
+            if p == pid
+        ]
+
+    @route("POST", "projects/{pid}/datasets")
+    def entity_lists_create(self, pid, body, **kwargs):
+        data = json.loads(body)
+        if (int(pid), data["name"]) in self.entity_lists:
+            raise HTTPProblem(409, 409.3, "An entity list with that name exists.")
+        entity_list = self.add_entity_list(self.get_project(pid), data["name"], [])
+        entity_list["approvalRequired"] = data.get("approvalRequired", False)
+        return 200, entity_list
+
+    @route("GET", "projects/{pid}/datasets/{name}")
+    def entity_lists_get(self, pid, name, **kwargs):
+        return 200, self.get_entity_list(pid, name)
+
+    @route("POST", "projects/{pid}/datasets/{name}/properties")
+    def entity_list_properties_create(self, pid, name, body, **kwargs):
+        entity_list = self.get_entity_list(pid, name)
+        prop = json.loads(body)["name"]
+        if any(p["name"] == prop for p in entity_list["properties"]):
+            raise HTTPProblem(409, 409.3, "A property with that name exists.")
+        with self.lock:
+            self.add_property(entity_list, prop)
+        return 200, {"success": True}
+
+    def check_properties(self, entity_list: dict, data: dict) -> None:
+        known = {p["name"] for p in entity_list["properties"]}
+        if unknown := set(data) - known:
+            raise HTTPProblem(400, 400.33, f"Unknown properties: {sorted(unknown)}")
+
+    @route("GET", "projects/{pid}/datasets/{name}/entities")
+    def entities_list(self, pid, name, **kwargs):
+        self.get_entity_list(pid, name)
+        return 200, list(self.entities[(int(pid), name)].values())
+
+    @route("POST", "projects/{pid}/datasets/{name}/entities")
+    def entities_create(self, pid, name, body, **kwargs):
+        entity_list = self.get_entity_list(pid, name)
+        data = json.loads(body)
+        new = data["entities"] if "entities" in data else [data]
+        for e in new:
+            self.check_properties(entity_list, e.get("data", {}))
+        with self.lock:
+            created = [
+                self.add_entity(
+                    int(pid), name, e["label"], e.get("data", {}), e.get("uuid")
+                )
+                for e in new
+            ]
+        return 200, {"success": True} if "entities" in data else created[0]
+
+    @route("PATCH", "projects/{pid}/datasets/{name}/entities/{uuid}")
+    def entities_update(self, pid, name, uuid, body, params, **kwargs):
+        entity_list = self.get_entity_list(pid, name)
+        data = json.loads(body)
+        self.check_properties(entity_list, data.get("data", {}))
+        with self.lock:
+            entity = self.get_entity(pid, name, uuid)
+            current = entity["currentVersion"]
+            if params.get("force") != "true" and params.get("baseVersion") != str(
+                current["version"]
+            ):
+                raise HTTPProblem(409, 409.15, "The entity has been updated.")
+            entity["currentVersion"] = {
+                **current,
+                "label": data.get("label", current["label"]),
+                "data": {**current["data"], **data.get("data", {})},
+                "version": current["version"] + 1,
+                "baseVersion": current["version"],
+            }
+            entity["updatedAt"] = NOW
+        return 200, entity
+
+    @route("DELETE", "projects/{pid}/datasets/{name}/entities/{uuid}")
+    def entities_delete(self, pid, name, uuid, **kwargs):
+        with self.lock:
+            self.get_entity(pid, name, uuid)
+            del self.entities[(int(pid), name)][uuid]
+        return 200, {"success": True}
+
+    @route("GET", "projects/{pid}/datasets/{name}.svc/Entities")
+    def entities_odata(self, pid, name, params, url, **kwargs):
+        self.get_entity_list(pid, name)
+        rows = [
+            {
+                "__id": e["uuid"],
+                "label": e["currentVersion"]["label"],
+                **e["currentVersion"]["data"],
+                "__system": {
+                    "createdAt": e["createdAt"],
+                    "creatorId": str(e["creatorId"]),
+                    "creatorName": "Fake",
+                    "updates": e["currentVersion"]["version"] - 1,
+                    "updatedAt": e["updatedAt"],
+                    "version": e["currentVersion"]["version"],
+                    "conflict": e["conflict"],
+                },
+            }
+            for e in list(self.entities[(int(pid), name)].values())
+        ]
+        return 200, self.odata(rows, params, url)